@@ -4,7 +4,7 @@ from flask_restful import Api
 from flask import Flask
 
 from resources.internal import (JosmData, PrgAddressesNotInOSM, BuildingsNotInOSM, MapboxVectorTile, AddressPointInfo,
-                                RandomLocation, Excluded, Processes, LatestUpdates)
+                                RandomLocation, Excluded, Processes, LatestUpdates, Stats)
 
 app = Flask(__name__)
 api = Api(app)
@@ -18,6 +18,7 @@ api.add_resource(RandomLocation, '/random/')
 api.add_resource(Excluded, '/exclude/')
 api.add_resource(Processes, '/processes/')
 api.add_resource(LatestUpdates, '/updates.geojson')
+api.add_resource(Stats, '/stats/')
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=environ.get('flask_debug', False))
@@ -0,0 +1,150 @@
+import threading
+import time
+from collections import OrderedDict
+from os import environ
+from typing import Optional, Tuple, Hashable, Dict, Callable, Any
+
+
+def tile_ttl(z: int) -> int:
+    """Number of seconds a rendered tile at given zoom can be served from cache (also used for X-Accel-Expires)."""
+    if 6 <= z < 13:
+        return 10800
+    elif 13 <= z < 23:
+        return 60
+    return 0
+
+
+class TileCache:
+    """In-process LRU cache of rendered vector tiles bounded by the total size of cached blobs (in bytes).
+    Every entry has its own time to live after which it is treated as missing.
+    Values are usually bytes, other values (e.g. tuple of tile and its ETag) need their size passed explicitly."""
+
+    # rough memory used by a single entry apart from the blob itself (key, tuple, ordered dict node)
+    ENTRY_OVERHEAD: int = 200
+
+    def __init__(self, max_bytes: int, max_item_bytes: Optional[int] = None):
+        self.max_bytes: int = max_bytes
+        self.max_item_bytes: int = max_item_bytes if max_item_bytes is not None else max_bytes // 8
+        self._data: 'OrderedDict[Hashable, Tuple[Any, float, int]]' = OrderedDict()  # key -> (value, expires_at, size)
+        self._size: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+        # metrics
+        self.hits: int = 0
+        self.misses: int = 0
+        self.expirations: int = 0
+        self.evictions: int = 0
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._data.pop(key)
+        self._size -= size + self.ENTRY_OVERHEAD
+
+    def get(self, key: Hashable) -> Any:
+        """Returns cached value or None if there is no valid entry for the key."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float, size: Optional[int] = None) -> None:
+        """Puts value into the cache evicting least recently used entries if cache is full.
+        Values bigger than `max_item_bytes` are not cached."""
+        size = len(value) if size is None else size
+        if ttl <= 0 or size > self.max_item_bytes:
+            return
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, time.monotonic() + ttl, size)
+            self._size += size + self.ENTRY_OVERHEAD
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'max_bytes': self.max_bytes,
+                'bytes': self._size,
+                'entries': len(self._data),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+                'expirations': self.expirations,
+                'evictions': self.evictions,
+            }
+
+
+class _Call:
+    def __init__(self):
+        self.done: threading.Event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key within the process.
+    Only the first caller (leader) executes the function, others wait for it and get the same result (or exception)."""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+        # metrics
+        self.leaders: int = 0
+        self.followers: int = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                self.followers += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> dict:
+        return {'in_flight': len(self._calls), 'leaders': self.leaders, 'followers': self.followers}
+
+
+# one cache per worker process, 64MB by default, set `tile_cache_max_bytes` to 0 to disable it
+tile_cache = TileCache(max_bytes=int(environ.get('tile_cache_max_bytes', 64 * 1024 * 1024)))
@@ -1,7 +1,11 @@
 from os import environ
 from os.path import join, dirname, abspath
 import atexit
-from typing import Union
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Union, Optional, List, Tuple, Dict, Iterator, ContextManager
 from datetime import datetime, timezone
 
 import psycopg2 as pg
@@ -18,56 +22,303 @@ QUERIES = {
     'delta_point_info': str(open(join(SQL_PATH, 'delta_point_info.sql'), 'r').read()),
     'delta_where_bbox': str(open(join(SQL_PATH, 'delta_where_bbox.sql'), 'r').read()),
     'delta_where_id': str(open(join(SQL_PATH, 'delta_where_id.sql'), 'r').read()),
-    'mvt_hl': str(open(join(SQL_PATH, 'mvt_hl.sql'), 'r').read()),
+    'mvt_hl_buildings': str(open(join(SQL_PATH, 'mvt_hl_buildings.sql'), 'r').read()),
+    'mvt_hl_buildings_meta': str(open(join(SQL_PATH, 'mvt_hl_buildings_meta.sql'), 'r').read()),
+    'mvt_hl_prg': str(open(join(SQL_PATH, 'mvt_hl_prg.sql'), 'r').read()),
+    'mvt_hl_prg_meta': str(open(join(SQL_PATH, 'mvt_hl_prg_meta.sql'), 'r').read()),
+    'metatile_cached': str(open(join(SQL_PATH, 'metatile_cached.sql'), 'r').read()),
+    'metatile_layers': str(open(join(SQL_PATH, 'metatile_layers.sql'), 'r').read()),
     'mvt_ll': str(open(join(SQL_PATH, 'mvt_ll.sql'), 'r').read()),
     'mvt_ll_aggr_simc': str(open(join(SQL_PATH, 'mvt_ll_aggr_simc.sql'), 'r').read()),
     'mvt_ll_aggr_simc_ulic': str(open(join(SQL_PATH, 'mvt_ll_aggr_simc_ulic.sql'), 'r').read()),
     'mvt_ll_aggr_terc': str(open(join(SQL_PATH, 'mvt_ll_aggr_terc.sql'), 'r').read()),
+    'tile_hash': str(open(join(SQL_PATH, 'tile_hash.sql'), 'r').read()),
+    'tile_layers': str(open(join(SQL_PATH, 'tile_layers.sql'), 'r').read()),
     'locations_random': str(open(join(SQL_PATH, 'locations_random.sql'), 'r').read()),
+    'lock_tile': str(open(join(SQL_PATH, 'lock_tile.sql'), 'r').read()),
     'locations_most_count': str(open(join(SQL_PATH, 'locations_most_count.sql'), 'r').read()),
     'processes': str(open(join(SQL_PATH, 'processes.sql'), 'r').read()),
     'insert_to_exclude_prg': str(open(join(SQL_PATH, 'insert_to_exclude_prg.sql'), 'r').read()),
     'insert_to_exclude_bdot_buildings': str(open(join(SQL_PATH, 'insert_to_exclude_bdot_buildings.sql'), 'r').read()),
+    'update_delta_excluded': str(open(join(SQL_PATH, 'update_delta_excluded.sql'), 'r').read()),
+    'update_bdot_buildings_excluded': str(open(join(SQL_PATH, 'update_bdot_buildings_excluded.sql'), 'r').read()),
+    'insert_tile': str(open(join(SQL_PATH, 'insert_tile.sql'), 'r').read()),
+    'insert_tile_layer': str(open(join(SQL_PATH, 'insert_tile_layer.sql'), 'r').read()),
+    'insert_tile_layers': str(open(join(SQL_PATH, 'insert_tile_layers.sql'), 'r').read()),
+    'insert_tiles': str(open(join(SQL_PATH, 'insert_tiles.sql'), 'r').read()),
     'insert_to_package_exports': str(open(join(SQL_PATH, 'insert_to_package_exports.sql'), 'r').read()),
+    'update_package_exports': str(open(join(SQL_PATH, 'update_package_exports.sql'), 'r').read()),
     'latest_updates': str(open(join(SQL_PATH, 'latest_updates.sql'), 'r').read()),
 }
-conn: psycopg2.extensions.connection = None
 
 
-def pgdb() -> psycopg2.extensions.connection:
-    """Method returns connection to the DB. If there is no connection active it creates one."""
-    global conn
-    if conn:
+def gevent_wait_callback(conn: psycopg2.extensions.connection, timeout: float = None) -> None:
+    """Wait callback for psycopg2 that yields to the gevent loop instead of blocking the whole worker
+    while the connection waits for the database (e.g. during rendering of a vector tile)."""
+    from gevent.socket import wait_read, wait_write
+
+    while True:
+        state = conn.poll()
+        if state == psycopg2.extensions.POLL_OK:
+            break
+        elif state == psycopg2.extensions.POLL_READ:
+            wait_read(conn.fileno(), timeout=timeout)
+        elif state == psycopg2.extensions.POLL_WRITE:
+            wait_write(conn.fileno(), timeout=timeout)
+        else:
+            raise psycopg2.OperationalError(f'Bad result from poll: {state}')
+
+
+def make_psycopg_green() -> None:
+    """Makes all psycopg2 connections in the process cooperative with gevent."""
+    psycopg2.extensions.set_wait_callback(gevent_wait_callback)
+
+
+def make_psycopg_blocking() -> None:
+    """Restores default (blocking) behaviour of psycopg2 connections."""
+    psycopg2.extensions.set_wait_callback(None)
+
+
+# opt-in, requires gevent (gunicorn's gevent worker class)
+if environ.get('db_green_wait', '').lower() in ('1', 'true', 'yes', 'on'):
+    make_psycopg_green()
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection could be checked out of the pool in the given time."""
+
+
+class ConnectionPool:
+    """Bounded pool of psycopg2 connections shared by all requests (greenlets) of a single worker.
+
+    Connections are created lazily up to `max_size`. Checking out blocks (cooperatively under gevent since gunicorn's
+    gevent worker monkey patches `threading`) until a connection is returned or `timeout` seconds pass.
+    Connections idle for longer than `health_check_after` seconds are pinged before being handed out
+    and connections older than `max_lifetime` seconds are closed and replaced on checkin."""
+
+    def __init__(
+            self,
+            dsn: str,
+            max_size: int = 10,
+            timeout: float = 30.0,
+            max_lifetime: float = 3600.0,
+            health_check_after: float = 60.0
+    ):
+        self.dsn: str = dsn
+        self.max_size: int = max_size
+        self.timeout: float = timeout
+        self.max_lifetime: float = max_lifetime
+        self.health_check_after: float = health_check_after
+
+        self._idle: List[Tuple[psycopg2.extensions.connection, float, float]] = []  # (conn, created_at, last_used)
+        self._created_at: Dict[int, float] = {}  # id(conn) -> creation time of connections checked out
+        self._size: int = 0  # number of open connections (idle and checked out)
+        self._cond: threading.Condition = threading.Condition()
+        self._closed: bool = False
+
+        # metrics
+        self.checkouts: int = 0
+        self.waits: int = 0
+        self.wait_time: float = 0.0
+        self.max_wait_time: float = 0.0
+        self.timeouts: int = 0
+        self.connections_created: int = 0
+        self.connections_discarded: int = 0
+
+    def _connect(self) -> psycopg2.extensions.connection:
+        conn = pg.connect(dsn=self.dsn)
+        self.connections_created += 1
         return conn
-    else:
-        conn = pg.connect(dsn=environ['dsn'])
+
+    def _discard(self, conn: psycopg2.extensions.connection) -> None:
+        """Closes the connection ignoring errors. Must be called with the lock held."""
+        try:
+            conn.close()
+        except Exception:
+            pass
+        self._size -= 1
+        self.connections_discarded += 1
+
+    def _healthy(self, conn: psycopg2.extensions.connection, last_used: float) -> bool:
+        if conn.closed:
+            return False
+        if time.monotonic() - last_used < self.health_check_after:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute('select 1')
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _checkout(self, start: float) -> Tuple[Optional[psycopg2.extensions.connection], float, float]:
+        """Takes idle connection or a slot for a new one, waiting if the pool is exhausted.
+        Returns tuple of (connection or None if a new one should be created, created_at, last_used)."""
+        with self._cond:
+            waited = False
+            while True:
+                if self._closed:
+                    raise pg.InterfaceError('connection pool is closed')
+                if self._idle:
+                    conn, created_at, last_used = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    conn, created_at, last_used = None, time.monotonic(), time.monotonic()
+                    break
+                remaining = self.timeout - (time.monotonic() - start)
+                if remaining <= 0:
+                    self.timeouts += 1
+                    raise PoolTimeout(f'Could not get a connection from the pool in {self.timeout} seconds.')
+                waited = True
+                self._cond.wait(remaining)
+
+            self.checkouts += 1
+            if waited:
+                elapsed = time.monotonic() - start
+                self.waits += 1
+                self.wait_time += elapsed
+                self.max_wait_time = max(self.max_wait_time, elapsed)
+        return conn, created_at, last_used
+
+    def getconn(self) -> psycopg2.extensions.connection:
+        """Checks out a connection from the pool. Remember to return it with `putconn`."""
+        start = time.monotonic()
+        while True:
+            conn, created_at, last_used = self._checkout(start)
+            if conn is None:
+                # connect outside of the lock so other requests are not blocked while we wait for the database
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                break
+            if self._healthy(conn, last_used):
+                break
+            with self._cond:
+                self._discard(conn)
+                self._cond.notify()
+        self._created_at[id(conn)] = created_at
         return conn
 
+    def putconn(self, conn: psycopg2.extensions.connection) -> None:
+        """Returns the connection to the pool. Broken, expired or unfinished connections are closed or rolled back."""
+        created_at = self._created_at.pop(id(conn), time.monotonic())
+        if not conn.closed and conn.info.transaction_status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except Exception:
+                conn.close()
+        with self._cond:
+            if self._closed or conn.closed or time.monotonic() - created_at > self.max_lifetime:
+                self._discard(conn)
+            else:
+                self._idle.append((conn, created_at, time.monotonic()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[psycopg2.extensions.connection]:
+        """Context manager checking out a connection and returning it to the pool afterwards."""
+        conn = self.getconn()
+        try:
+            yield conn
+        finally:
+            self.putconn(conn)
+
+    def closeall(self) -> None:
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                conn, _, _ = self._idle.pop()
+                self._discard(conn)
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                'max_size': self.max_size,
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': self._size - len(self._idle),
+                'checkouts': self.checkouts,
+                'waits': self.waits,
+                'wait_time_total': round(self.wait_time, 6),
+                'wait_time_max': round(self.max_wait_time, 6),
+                'timeouts': self.timeouts,
+                'connections_created': self.connections_created,
+                'connections_discarded': self.connections_discarded,
+            }
+
+
+pool: Optional[ConnectionPool] = None
+
+
+def get_pool() -> ConnectionPool:
+    """Returns connection pool of the worker. If there is no pool yet it creates one."""
+    global pool
+    if pool is None:
+        pool = ConnectionPool(
+            dsn=environ['dsn'],
+            max_size=int(environ.get('db_pool_max_size', 5)),
+            timeout=float(environ.get('db_pool_timeout', 30)),
+            max_lifetime=float(environ.get('db_pool_max_lifetime', 3600)),
+            health_check_after=float(environ.get('db_pool_health_check_after', 60))
+        )
+    return pool
+
+
+def pgdb() -> ContextManager[psycopg2.extensions.connection]:
+    """Method returns context manager with connection to the DB checked out from the pool.
+    Connection goes back to the pool when the context is left."""
+    return get_pool().connection()
+
 
 @atexit.register
 def close_db_connection():
-    """Close the database connection. Method executed upon exit."""
-    global conn
-    if conn:
-        conn.close()
+    """Close all the database connections. Method executed upon exit."""
+    if pool is not None:
+        pool.closeall()
 
 
 def execute_sql(cursor, query: str, parameters: Union[tuple, dict] = None):
     """Method executes SQL query in a given cursor with given parameters. Provides error handling.
-    In case of exception it rolls back transaction and closes the connection."""
-    global conn
+    In case of exception it rolls back transaction. Broken connections are dropped by the pool on checkin."""
     try:
         cursor.execute(query, parameters) if parameters else cursor.execute(query)
     except psycopg2.InterfaceError:
         print(datetime.now(timezone.utc).astimezone().isoformat(),
               f'- Error while executing query: {query}, with parameters: {parameters}')
-        conn = None
         raise
     except:
         print(datetime.now(timezone.utc).astimezone().isoformat(),
               f'- Error while executing query: {query}, with parameters: {parameters}')
-        conn.rollback()
-        conn.close()
-        conn = None
+        try:
+            cursor.connection.rollback()
+        except psycopg2.Error:
+            cursor.connection.close()
         raise
     return cursor
+
+
+_cursor_names = itertools.count(1)  # used for unique names of server-side cursors
+
+
+def stream_rows(
+        conn: psycopg2.extensions.connection,
+        query: str,
+        parameters: Union[tuple, dict] = None,
+        batch_size: int = 2000
+) -> Iterator[tuple]:
+    """Method executes SQL query using named (server-side) cursor and yields rows fetched in batches,
+    so the whole result never has to be kept in memory. Connection must stay checked out while rows are consumed."""
+    with conn.cursor(name=f'stream_rows_{next(_cursor_names)}') as cur:
+        execute_sql(cur, query, parameters)
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
@@ -0,0 +1,172 @@
+"""Derives vector tiles above the max native zoom from their ancestor tile.
+
+Geometry of every feature of the ancestor is rescaled to the coordinate space of the descendant tile and features
+that lie completely outside of it (and its buffer) are dropped. Geometries are not clipped - coordinates outside
+of the tile extent are valid in MVT and are clipped by the renderer. Only the parts of the protobuf messages that
+have to change (features and their geometry) are decoded, everything else is copied as is.
+"""
+from typing import Iterator, List, Tuple
+
+# field numbers and wire types from the Mapbox Vector Tile specification (vector_tile.proto)
+TILE_LAYERS = 3
+LAYER_FEATURES = 2
+LAYER_EXTENT = 5
+FEATURE_GEOMETRY = 4
+WIRE_VARINT = 0
+WIRE_FIXED64 = 1
+WIRE_LEN = 2
+WIRE_FIXED32 = 5
+
+CMD_MOVE_TO = 1
+CMD_LINE_TO = 2
+CMD_CLOSE_PATH = 7
+
+DEFAULT_EXTENT = 4096
+# same as default buffer of ST_AsMVTGeom
+BUFFER = 256
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result, shift = 0, 0
+    while True:
+        b = data[pos]
+        pos += 1
+        result |= (b & 0x7f) << shift
+        if b < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _write_varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _fields(data: bytes) -> Iterator[Tuple[int, int, int, int, int]]:
+    """Yields fields of the protobuf message: field number, wire type, value (varint or start of the payload),
+    end of the payload and start of the whole field (including key) in the message."""
+    pos = 0
+    while pos < len(data):
+        start = pos
+        key, pos = _read_varint(data, pos)
+        field, wire = key >> 3, key & 7
+        if wire == WIRE_VARINT:
+            value, pos = _read_varint(data, pos)
+            yield field, wire, value, pos, start
+        elif wire == WIRE_LEN:
+            length, pos = _read_varint(data, pos)
+            yield field, wire, pos, pos + length, start
+            pos += length
+        elif wire == WIRE_FIXED64:
+            yield field, wire, pos, pos + 8, start
+            pos += 8
+        elif wire == WIRE_FIXED32:
+            yield field, wire, pos, pos + 4, start
+            pos += 4
+        else:
+            raise ValueError(f'Unsupported protobuf wire type: {wire}.')
+
+
+def _len_field(field: int, payload: bytes) -> bytes:
+    return _write_varint(field << 3 | WIRE_LEN) + _write_varint(len(payload)) + payload
+
+
+def _zigzag(value: int) -> int:
+    return (value << 1) ^ (value >> 63)
+
+
+def _unzigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+def _decode_geometry(data: bytes) -> List[Tuple[int, List[Tuple[int, int]]]]:
+    """Decodes packed geometry into list of commands with absolute coordinates."""
+    values, pos = [], 0
+    while pos < len(data):
+        value, pos = _read_varint(data, pos)
+        values.append(value)
+    commands, i, x, y = [], 0, 0, 0
+    while i < len(values):
+        cmd, count = values[i] & 7, values[i] >> 3
+        i += 1
+        points = []
+        if cmd in (CMD_MOVE_TO, CMD_LINE_TO):
+            for _ in range(count):
+                x += _unzigzag(values[i])
+                y += _unzigzag(values[i + 1])
+                i += 2
+                points.append((x, y))
+        commands.append((cmd, points))
+    return commands
+
+
+def _encode_geometry(commands: List[Tuple[int, List[Tuple[int, int]]]]) -> bytes:
+    out, x, y = bytearray(), 0, 0
+    for cmd, points in commands:
+        if cmd == CMD_CLOSE_PATH:
+            out += _write_varint(CMD_CLOSE_PATH | 1 << 3)
+            continue
+        out += _write_varint(cmd | len(points) << 3)
+        for px, py in points:
+            out += _write_varint(_zigzag(px - x))
+            out += _write_varint(_zigzag(py - y))
+            x, y = px, py
+    return bytes(out)
+
+
+def _feature(data: bytes, scale: int, offset_x: int, offset_y: int, extent: int) -> bytes:
+    """Returns feature with rescaled geometry or empty bytes if the feature is outside of the tile."""
+    out = bytearray()
+    for field, wire, value, end, start in _fields(data):
+        if field == FEATURE_GEOMETRY and wire == WIRE_LEN:
+            commands = [
+                (cmd, [(px * scale - offset_x, py * scale - offset_y) for px, py in points])
+                for cmd, points in _decode_geometry(data[value:end])
+            ]
+            xs = [px for _, points in commands for px, _ in points]
+            ys = [py for _, points in commands for _, py in points]
+            if not xs:
+                return b''
+            # bbox of the feature doesn't intersect the tile with its buffer
+            if max(xs) < -BUFFER or min(xs) > extent + BUFFER or max(ys) < -BUFFER or min(ys) > extent + BUFFER:
+                return b''
+            out += _len_field(FEATURE_GEOMETRY, _encode_geometry(commands))
+        else:
+            out += data[start:end]
+    return bytes(out)
+
+
+def _layer(data: bytes, dz: int, dx: int, dy: int) -> bytes:
+    extent = DEFAULT_EXTENT
+    for field, wire, value, _, _ in _fields(data):
+        if field == LAYER_EXTENT and wire == WIRE_VARINT:
+            extent = value
+    scale = 1 << dz
+    # position of the descendant tile within the ancestor in the coordinates of the descendant
+    offset_x, offset_y = dx * extent, dy * extent
+    out = bytearray()
+    for field, wire, value, end, start in _fields(data):
+        if field == LAYER_FEATURES and wire == WIRE_LEN:
+            feature = _feature(data[value:end], scale, offset_x, offset_y, extent)
+            if feature:
+                out += _len_field(LAYER_FEATURES, feature)
+        else:
+            out += data[start:end]
+    return bytes(out)
+
+
+def overzoom(mvt: bytes, dz: int, dx: int, dy: int) -> bytes:
+    """Returns descendant tile derived from (uncompressed) ancestor tile.
+    dz - zoom difference, dx, dy - position of the descendant among descendants of the ancestor at its zoom
+    (x - (ancestor_x << dz), y - (ancestor_y << dz))."""
+    out = bytearray()
+    for field, wire, value, end, start in _fields(mvt):
+        if field == TILE_LAYERS and wire == WIRE_LEN:
+            out += _len_field(TILE_LAYERS, _layer(mvt[value:end], dz, dx, dy))
+        else:
+            out += mvt[start:end]
+    return bytes(out)
@@ -11,10 +11,9 @@ a as (
         tourism,
         building_levels
     from bdot_buildings b
-    left join exclude_bdot_buildings ex on b.lokalnyid=ex.id
     where 1=1
-        and b.geom_4326 && ST_MakeEnvelope(%s, %s, %s, %s, 4326)
-        and ex.id is null
+        and b.geom_3857 && ST_Transform(ST_MakeEnvelope(%s, %s, %s, %s, 4326), 3857)
+        and not b.excluded
     limit 50000
 ),
 b as (
@@ -11,10 +11,9 @@ a as (
         tourism,
         building_levels
     from bdot_buildings b
-    left join exclude_bdot_buildings ex on b.lokalnyid=ex.id
     where 1=1
         and b.lokalnyid in %s
-        and ex.id is null
+        and not b.excluded
     limit 50000
 ),
 b as (
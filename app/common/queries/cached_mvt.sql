@@ -1,3 +1,3 @@
-select mvt
+select mvt, coalesce(hash, md5(mvt)) hash, coalesce(encoding, 'identity') encoding
 from tiles
 where z = %s and x = %s and y = %s ;
@@ -9,7 +9,6 @@ select
    st_x(st_transform(d.geom, 4326)) x4326,
    st_y(st_transform(d.geom, 4326)) y4326
 from prg.delta d
-left join exclude_prg on d.lokalnyid=exclude_prg.id
-where d.geom && st_transform(ST_MakeEnvelope(%s, %s, %s, %s, 4326), 2180)
-    and exclude_prg.id is null
+where d.geom_3857 && st_transform(ST_MakeEnvelope(%s, %s, %s, %s, 4326), 3857)
+    and not d.excluded
 limit 50000;
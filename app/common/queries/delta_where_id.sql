@@ -9,7 +9,6 @@ select
    st_x(st_transform(d.geom, 4326)) x4326,
    st_y(st_transform(d.geom, 4326)) y4326
 from prg.delta d
-left join exclude_prg on d.lokalnyid=exclude_prg.id
 where d.lokalnyid in %s
-    and exclude_prg.id is null
+    and not d.excluded
 limit 50000;
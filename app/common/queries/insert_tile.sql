@@ -0,0 +1,12 @@
+insert into tiles (z, x, y, mvt, bbox, hash, encoding)
+values (
+    %(z)s,
+    %(x)s,
+    %(y)s,
+    %(mvt)s,
+    ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857),
+    %(hash)s,
+    %(encoding)s
+)
+on conflict do nothing
+;
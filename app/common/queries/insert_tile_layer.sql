@@ -0,0 +1,11 @@
+insert into tile_layers (z, x, y, layer, mvt, bbox)
+values (
+    %(z)s,
+    %(x)s,
+    %(y)s,
+    %(layer)s,
+    %(mvt)s,
+    ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857)
+)
+on conflict do nothing
+;
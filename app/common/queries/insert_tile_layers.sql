@@ -0,0 +1,4 @@
+insert into tile_layers (z, x, y, layer, mvt, bbox)
+values %s
+on conflict do nothing
+;
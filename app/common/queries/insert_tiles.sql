@@ -0,0 +1,4 @@
+insert into tiles (z, x, y, mvt, bbox, hash, encoding)
+values %s
+on conflict do nothing
+;
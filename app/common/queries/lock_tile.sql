@@ -0,0 +1 @@
+select pg_advisory_xact_lock(%s) ;
@@ -0,0 +1,3 @@
+select x, y
+from tiles
+where z = %(z)s and x between %(x0)s and %(x1)s and y between %(y0)s and %(y1)s ;
@@ -0,0 +1,25 @@
+with b as (
+    select
+        lokalnyid,
+        ST_AsMVTGeom(geom_3857, ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857)::box2d) geom,
+        status_bdot,
+        kategoria_bdot,
+        funkcja_ogolna_budynku,
+        funkcja_szczegolowa_budynku,
+        aktualnosc_geometrii,
+        aktualnosc_atrybutow,
+        building,
+        amenity,
+        man_made,
+        leisure,
+        historic,
+        tourism,
+        building_levels
+    from bdot_buildings b
+    where geom_3857 && ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857)
+        and not b.excluded
+    limit 500000
+)
+select ST_AsMVT(b.*, 'buildings') mvt
+from b
+;
@@ -0,0 +1,65 @@
+-- renders buildings layer of all tiles of the metatile (block of tiles x0..x1, y0..y1 at zoom z) in one query,
+-- xmin, ymin, xmax, ymax is the bbox of the whole metatile and size is the size of a single tile (in EPSG:3857)
+with t as (
+    select
+        x,
+        y,
+        ST_MakeEnvelope(
+            %(xmin)s + (x - %(x0)s) * %(size)s,
+            %(ymax)s - (y - %(y0)s + 1) * %(size)s,
+            %(xmin)s + (x - %(x0)s + 1) * %(size)s,
+            %(ymax)s - (y - %(y0)s) * %(size)s,
+            3857
+        ) env
+    from generate_series(%(x0)s, %(x1)s) x, generate_series(%(y0)s, %(y1)s) y
+),
+b as materialized (
+    select
+        lokalnyid,
+        geom_3857 geom,
+        status_bdot,
+        kategoria_bdot,
+        funkcja_ogolna_budynku,
+        funkcja_szczegolowa_budynku,
+        aktualnosc_geometrii,
+        aktualnosc_atrybutow,
+        building,
+        amenity,
+        man_made,
+        leisure,
+        historic,
+        tourism,
+        building_levels
+    from bdot_buildings b
+    where geom_3857 && ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857)
+        and not b.excluded
+)
+select
+    t.x,
+    t.y,
+    (
+        select ST_AsMVT(c.*, 'buildings')
+        from (
+            select
+                b.lokalnyid,
+                ST_AsMVTGeom(b.geom, t.env::box2d) geom,
+                b.status_bdot,
+                b.kategoria_bdot,
+                b.funkcja_ogolna_budynku,
+                b.funkcja_szczegolowa_budynku,
+                b.aktualnosc_geometrii,
+                b.aktualnosc_atrybutow,
+                b.building,
+                b.amenity,
+                b.man_made,
+                b.leisure,
+                b.historic,
+                b.tourism,
+                b.building_levels
+            from b
+            where b.geom && t.env
+            limit 500000
+        ) c
+    ) mvt
+from t
+;
@@ -0,0 +1,21 @@
+with a as (
+    select
+       d.lokalnyid,
+       d.teryt_msc,
+       d.teryt_simc,
+       d.teryt_ulica,
+       d.teryt_ulic,
+       d.nr,
+       d.pna,
+       ST_AsMVTGeom(
+         d.geom_3857,
+         ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857)::box2d
+       ) geom
+    from prg.delta d
+    where d.geom_3857 && ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857)
+        and not d.excluded
+    limit 500000
+)
+select ST_AsMVT(a.*, 'prg2load') mvt
+from a
+;
@@ -0,0 +1,51 @@
+-- renders prg2load layer of all tiles of the metatile (block of tiles x0..x1, y0..y1 at zoom z) in one query,
+-- xmin, ymin, xmax, ymax is the bbox of the whole metatile and size is the size of a single tile (in EPSG:3857)
+with t as (
+    select
+        x,
+        y,
+        ST_MakeEnvelope(
+            %(xmin)s + (x - %(x0)s) * %(size)s,
+            %(ymax)s - (y - %(y0)s + 1) * %(size)s,
+            %(xmin)s + (x - %(x0)s + 1) * %(size)s,
+            %(ymax)s - (y - %(y0)s) * %(size)s,
+            3857
+        ) env
+    from generate_series(%(x0)s, %(x1)s) x, generate_series(%(y0)s, %(y1)s) y
+),
+d as materialized (
+    select
+       d.lokalnyid,
+       d.teryt_msc,
+       d.teryt_simc,
+       d.teryt_ulica,
+       d.teryt_ulic,
+       d.nr,
+       d.pna,
+       d.geom_3857 geom
+    from prg.delta d
+    where d.geom_3857 && ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857)
+        and not d.excluded
+)
+select
+    t.x,
+    t.y,
+    (
+        select ST_AsMVT(a.*, 'prg2load')
+        from (
+            select
+                d.lokalnyid,
+                d.teryt_msc,
+                d.teryt_simc,
+                d.teryt_ulica,
+                d.teryt_ulic,
+                d.nr,
+                d.pna,
+                ST_AsMVTGeom(d.geom, t.env::box2d) geom
+            from d
+            where d.geom && t.env
+            limit 500000
+        ) a
+    ) mvt
+from t
+;
@@ -0,0 +1,3 @@
+select coalesce(hash, md5(mvt)) hash, coalesce(encoding, 'identity') encoding
+from tiles
+where z = %s and x = %s and y = %s ;
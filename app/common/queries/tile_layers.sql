@@ -0,0 +1,3 @@
+select layer, mvt
+from tile_layers
+where z = %s and x = %s and y = %s ;
@@ -0,0 +1 @@
+update bdot_buildings set excluded = true where lokalnyid in %s and not excluded;
@@ -0,0 +1 @@
+update prg.delta set excluded = true where lokalnyid in %s and not excluded;
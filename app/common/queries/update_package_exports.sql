@@ -0,0 +1,6 @@
+update package_exports
+set
+    adresy = %(lb_adresow)s,
+    budynki = %(lb_budynkow)s
+where export_id = %(export_id)s
+;
@@ -0,0 +1,53 @@
+"""Compression of rendered vector tiles. Tiles are compressed once when rendered and stored compressed."""
+import hashlib
+import zlib
+from os import environ
+from typing import Tuple
+
+GZIP = 'gzip'
+BROTLI = 'br'
+IDENTITY = 'identity'
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def storage_encoding() -> str:
+    """Encoding used to store newly rendered tiles. Set with `tile_encoding` env variable (gzip by default),
+    `br` requires brotli package and falls back to gzip if it's not installed."""
+    encoding = environ.get('tile_encoding', GZIP).lower()
+    if encoding == BROTLI and _brotli() is None:
+        return GZIP
+    return encoding if encoding in (GZIP, BROTLI, IDENTITY) else GZIP
+
+
+def encode(mvt: bytes, encoding: str) -> bytes:
+    if encoding == GZIP:
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31 - gzip header and trailer
+        return compressor.compress(mvt) + compressor.flush()
+    elif encoding == BROTLI:
+        return _brotli().compress(mvt)
+    return mvt
+
+
+def decode(data: bytes, encoding: str) -> bytes:
+    if encoding == GZIP:
+        return zlib.decompress(data, 31)
+    elif encoding == BROTLI:
+        return _brotli().decompress(data)
+    return data
+
+
+def prepare(mvt: bytes, encoding: str) -> Tuple[bytes, str]:
+    """Returns tile compressed with given encoding and hash of the uncompressed tile."""
+    return encode(mvt, encoding), hashlib.md5(mvt).hexdigest()
+
+
+def etag(hash_: str, encoding: str) -> str:
+    """ETag of the representation of the tile (ETag has to be different for every Content-Encoding)."""
+    return hash_ if encoding == IDENTITY else f'{hash_}-{encoding}'
@@ -0,0 +1,37 @@
+"""Geometry of Web Mercator (EPSG:3857) tiles in the XYZ scheme computed in closed form (no reprojection needed)."""
+from typing import Dict
+
+# half of the Earth's circumference at the equator in Web Mercator metres (2 * pi * 6378137 / 2)
+ORIGIN = 20037508.342789244
+WORLD_SIZE = 2 * ORIGIN
+
+
+def tile_bounds(z: int, x: int, y: int) -> Dict[str, float]:
+    """Returns bounds of the tile in Web Mercator as dict with keys: west, south, east, north."""
+    size = WORLD_SIZE / (1 << int(z))
+    west = -ORIGIN + int(x) * size
+    north = ORIGIN - int(y) * size
+    return {'west': west, 'south': north - size, 'east': west + size, 'north': north}
+
+
+def tile_envelope(z: int, x: int, y: int) -> Dict[str, float]:
+    """Returns bounds of the tile as query parameters (xmin, ymin, xmax, ymax) used by tile SQL queries."""
+    b = tile_bounds(z, x, y)
+    return {'xmin': b['west'], 'ymin': b['south'], 'xmax': b['east'], 'ymax': b['north']}
+
+
+def tiles_bounds(z, x, y):
+    """Batch version of tile_bounds. Takes array-likes (or scalars) of zooms, columns and rows
+    and returns NumPy array of shape (n, 4) with xmin, ymin, xmax, ymax of every tile."""
+    import numpy as np
+
+    z, x, y = np.broadcast_arrays(
+        np.asarray(z, dtype=np.int64), np.asarray(x, dtype=np.int64), np.asarray(y, dtype=np.int64)
+    )
+    size = WORLD_SIZE / np.left_shift(1, z).astype(np.float64)
+    result = np.empty(z.shape + (4,), dtype=np.float64)
+    result[..., 0] = -ORIGIN + x * size
+    result[..., 3] = ORIGIN - y * size
+    result[..., 2] = result[..., 0] + size
+    result[..., 1] = result[..., 3] - size
+    return result.reshape(-1, 4)
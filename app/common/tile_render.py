@@ -0,0 +1,181 @@
+"""Rendering of vector tiles into the tiles table. Used by the app and by the tile seeder (processing/scripts)."""
+import io
+from collections import Counter, defaultdict
+from os import environ
+from typing import Tuple, Optional, Dict
+
+from common.database import execute_sql, execute_values, QUERIES
+from common.tile_encoding import storage_encoding, prepare
+from common.tile_math import tile_envelope, tile_bounds, WORLD_SIZE
+
+MAX_ZOOM = 22
+# tiles above this zoom are not rendered nor stored, they are derived from their ancestor at this zoom (overzoom)
+MAX_NATIVE_ZOOM = 16
+
+# layers of high zoom tiles (in the order they are concatenated) and queries rendering them
+# for a single tile and for all tiles of a metatile
+HL_LAYERS = (
+    ('prg2load', 'mvt_hl_prg', 'mvt_hl_prg_meta'),
+    ('buildings', 'mvt_hl_buildings', 'mvt_hl_buildings_meta'),
+)
+# high zoom tiles are rendered in blocks (metatiles) of METATILE_SIZE x METATILE_SIZE tiles, 1 disables metatiles
+METATILE_SIZE = int(environ.get('metatile_size', 4))
+
+INSERT_TILES_TEMPLATE = (
+    '(%(z)s, %(x)s, %(y)s, %(mvt)s, ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), %(hash)s, %(encoding)s)'
+)
+INSERT_TILE_LAYERS_TEMPLATE = (
+    '(%(z)s, %(x)s, %(y)s, %(layer)s, %(mvt)s, ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857))'
+)
+
+# metrics of the process
+counters = Counter()
+
+
+def query_for_zoom(z: int) -> Optional[str]:
+    """Returns name of the query rendering tiles at given zoom,
+    None for high zooms (tile is made of separately cached layers). Raises ValueError for zooms that are not rendered
+    (including zooms above MAX_NATIVE_ZOOM)."""
+    z = int(z)
+    if 6 <= z <= 7:
+        return 'mvt_ll_aggr_terc'
+    elif 8 <= z <= 9:
+        return 'mvt_ll_aggr_simc'
+    elif 10 <= z <= 11:
+        return 'mvt_ll_aggr_simc_ulic'
+    elif 12 <= z <= 12:
+        return 'mvt_ll'
+    elif 13 <= z <= MAX_NATIVE_ZOOM:
+        return None
+    raise ValueError(f'Tiles are not rendered at zoom {z}.')
+
+
+def lock_key(z: int, x: int, y: int) -> int:
+    """Key of the advisory lock taken while the tile is rendered (fits in bigint for z < 23)."""
+    return (int(z) << 44) | (int(x) << 22) | int(y)
+
+
+def render_layers(cur, z: int, x: int, y: int, params: dict) -> bytes:
+    """Returns high zoom tile concatenated from its layers. Only layers missing in the tile_layers table
+    (never rendered or invalidated after their source data changed) are rendered and stored."""
+    execute_sql(cur, QUERIES['tile_layers'], (z, x, y))
+    layers = {layer: bytes(mvt or b'') for layer, mvt in cur.fetchall()}
+    for layer, query, _ in HL_LAYERS:
+        if layer not in layers:
+            execute_sql(cur, QUERIES[query], params)
+            layers[layer] = bytes(cur.fetchone()[0] or b'')
+            execute_sql(cur, QUERIES['insert_tile_layer'], dict(params, z=z, x=x, y=y, layer=layer, mvt=layers[layer]))
+            counters['layer_renders'] += 1
+        else:
+            counters['layer_reuses'] += 1
+    return b''.join(layers[layer] for layer, _, _ in HL_LAYERS)
+
+
+def metatile(z: int, x: int, y: int, size: int = METATILE_SIZE) -> Tuple[int, int, int, int]:
+    """Returns range of tiles (x0, y0, x1, y1) of the metatile containing given tile."""
+    size = max(1, min(size, 1 << int(z)))
+    x0, y0 = int(x) // size * size, int(y) // size * size
+    return x0, y0, x0 + size - 1, y0 + size - 1
+
+
+def render_metatile(
+    cur, z: int, x0: int, y0: int, x1: int, y1: int
+) -> Dict[Tuple[int, int], Tuple[bytes, str, str]]:
+    """Renders all missing tiles of the metatile (high zooms only). Every layer is rendered for all tiles
+    of the metatile with a single query (only if any of the tiles misses that layer), tiles and their layers
+    are inserted in bulk. Returns dict (x, y) -> (compressed tile, hash, encoding) of the inserted tiles."""
+    params = {
+        'xmin': tile_bounds(z, x0, y0)['west'],
+        'ymax': tile_bounds(z, x0, y0)['north'],
+        'xmax': tile_bounds(z, x1, y1)['east'],
+        'ymin': tile_bounds(z, x1, y1)['south'],
+        'size': WORLD_SIZE / (1 << int(z)),
+        'z': z, 'x0': x0, 'y0': y0, 'x1': x1, 'y1': y1,
+    }
+    children = [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+
+    execute_sql(cur, QUERIES['metatile_layers'], params)
+    layers = defaultdict(dict)
+    for x, y, layer, mvt in cur.fetchall():
+        layers[(x, y)][layer] = bytes(mvt or b'')
+
+    new_layers = []
+    for layer, _, meta_query in HL_LAYERS:
+        missing = [child for child in children if layer not in layers[child]]
+        counters['layer_reuses'] += len(children) - len(missing)
+        if not missing:
+            continue
+        execute_sql(cur, QUERIES[meta_query], params)
+        rendered = {(x, y): bytes(mvt or b'') for x, y, mvt in cur.fetchall()}
+        for child in missing:
+            layers[child][layer] = rendered[child]
+            new_layers.append(dict(tile_envelope(z, *child), z=z, x=child[0], y=child[1], layer=layer,
+                                   mvt=rendered[child]))
+        counters['layer_renders'] += len(missing)
+    if new_layers:
+        execute_values(cur, QUERIES['insert_tile_layers'], new_layers, template=INSERT_TILE_LAYERS_TEMPLATE)
+
+    execute_sql(cur, QUERIES['metatile_cached'], params)
+    cached = {(x, y) for x, y in cur.fetchall()}
+    encoding = storage_encoding()
+    result, new_tiles = {}, []
+    for child in children:
+        if child in cached:
+            continue
+        data, hash_ = prepare(b''.join(layers[child][layer] for layer, _, _ in HL_LAYERS), encoding)
+        result[child] = (data, hash_, encoding)
+        new_tiles.append(dict(tile_envelope(z, *child), z=z, x=child[0], y=child[1], mvt=data, hash=hash_,
+                              encoding=encoding))
+    if new_tiles:
+        execute_values(cur, QUERIES['insert_tiles'], new_tiles, template=INSERT_TILES_TEMPLATE)
+    counters['renders'] += len(new_tiles)
+    counters['metatile_renders'] += 1
+    return result
+
+
+def render_tile(cur, z: int, x: int, y: int) -> Tuple[bytes, str, str]:
+    """Renders the tile, compresses it and inserts it into the tiles table.
+    Returns the same values as stored in the table: compressed tile, its hash and encoding."""
+    query = query_for_zoom(z)
+    params = tile_envelope(z, x, y)
+    if query is None:
+        mvt = render_layers(cur, z, x, y, params)
+    else:
+        execute_sql(cur, QUERIES[query], params)
+        mvt = bytes(cur.fetchone()[0] or b'')
+    encoding = storage_encoding()
+    data, hash_ = prepare(mvt, encoding)
+    params.update({'z': z, 'x': x, 'y': y, 'mvt': data, 'hash': hash_, 'encoding': encoding})
+    execute_sql(cur, QUERIES['insert_tile'], params)
+    counters['renders'] += 1
+    counters['tile_renders'] += 1
+    return data, hash_, encoding
+
+
+def get_or_render_tile(conn, z: int, x: int, y: int) -> Tuple[Tuple[bytes, str, str], str]:
+    """Returns stored (compressed) tile, its hash and encoding from the tiles table, renders the tile first
+    if it's missing. Second returned value tells where the tile came from: cached, rendered or rendered_elsewhere
+    (rendered by another process while this one was waiting for the tile lock)."""
+    # high zoom tiles are rendered (and locked) by metatiles
+    use_metatile = query_for_zoom(z) is None and METATILE_SIZE > 1
+    with conn.cursor() as cur:
+        execute_sql(cur, QUERIES['cached_mvt'], (z, x, y))
+        tup = cur.fetchone()
+        status = 'cached'
+        if tup is None:
+            # only one process renders given tile, others wait for the lock and read the rendered tile
+            key = lock_key(z, *metatile(z, x, y)[:2]) if use_metatile else lock_key(z, x, y)
+            execute_sql(cur, QUERIES['lock_tile'], (key,))
+            execute_sql(cur, QUERIES['cached_mvt'], (z, x, y))
+            tup = cur.fetchone()
+            if tup is None:
+                if use_metatile:
+                    tup = render_metatile(cur, z, *metatile(z, x, y))[(int(x), int(y))]
+                else:
+                    tup = render_tile(cur, z, x, y)
+                status = 'rendered'
+            else:
+                counters['rendered_elsewhere'] += 1
+                status = 'rendered_elsewhere'
+            conn.commit()  # releases the lock
+    return (io.BytesIO(tup[0]).getvalue(), tup[1], tup[2]), status
@@ -1,23 +1,32 @@
+import io
 from copy import deepcopy
+from itertools import chain
+from typing import Iterable, Iterator
+
 from lxml import etree
-import mercantile as m
-from mercantile import Tile, bounds
-from pyproj import Proj, transform
 
 
 BUILDING_TAG = etree.Element('tag', k='building', v='yes')
 SOURCE_BUILDING = etree.Element('tag', k='source', v='www.geoportal.gov.pl')
 SOURCE_ADDR = etree.Element('tag', k='source:addr', v='gugik.gov.pl')
+# osm keys of tags in the order of the columns returned by buildings queries (after way_id and array of points)
+BUILDING_TAG_KEYS = ('building', 'amenity', 'man_made', 'leisure', 'historic', 'tourism', 'building:levels')
+
+
+class CountingIterator:
+    """Iterator wrapper counting items that went through it."""
 
+    def __init__(self, iterable: Iterable):
+        self.iterator: Iterator = iter(iterable)
+        self.count: int = 0
 
-def to_merc(bbox: m.LngLatBbox) -> dict:
-    """Method reprojects BBox in WGS84 (latitude, longitude) to Web Mercator."""
-    in_proj = Proj('epsg:4326')
-    out_proj = Proj('epsg:3857')
-    res = dict()
-    res["west"], res["south"] = transform(in_proj, out_proj, bbox.south, bbox.west)
-    res["east"], res["north"] = transform(in_proj, out_proj, bbox.north, bbox.east)
-    return res
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        item = next(self.iterator)
+        self.count += 1
+        return item
 
 
 def addresses_nodes(list_of_tuples: list) -> etree.Element:
@@ -43,121 +52,48 @@ def addresses_nodes(list_of_tuples: list) -> etree.Element:
 
 def buildings_nodes(list_of_tuples: list) -> etree.Element:
     i = -100000  # counter for fake ids
-    n = {}  # list of nodes
-    lst = []  # list of ways
-    # cursor returns tuple of (way_id, array_of_points[])
+    n = {}  # dict of nodes (point coordinates -> node id)
+    lst = []  # list of ways kept as plain tuples (way_id, tags, node_ids) until all nodes are written
+    # cursor returns tuple of (way_id, array_of_points[], building, amenity, ... , building_levels)
     for t in list_of_tuples:
-        # create 'way' node for xml tree
-        way = etree.Element('way', id=str(t[0]))
-        way.append(deepcopy(SOURCE_BUILDING))
-
-        if t[2]:
-            way.append(etree.Element('tag', k='building', v=t[2]))
-        if t[3]:
-            way.append(etree.Element('tag', k='amenity', v=t[3]))
-        if t[4]:
-            way.append(etree.Element('tag', k='man_made', v=t[4]))
-        if t[5]:
-            way.append(etree.Element('tag', k='leisure', v=t[5]))
-        if t[6]:
-            way.append(etree.Element('tag', k='historic', v=t[6]))
-        if t[7]:
-            way.append(etree.Element('tag', k='tourism', v=t[7]))
-        if t[8]:
-            way.append(etree.Element('tag', k='building:levels', v=str(t[8])))
-
-        # iterate over array of points that make the polygon and add references to them to the way xml node
+        refs = []
+        # iterate over array of points that make the polygon
         for xy in t[1]:
-            # if given point is already in our list of nodes then:
-            if n.get(tuple(xy)):
-                way.append(deepcopy(n[tuple(xy)]['el']))
-                # appending doesn't work when you try to pass the same object
-                # you need to create new object if you want nodes with duplicate values
-                # since polygons start and end with the same node we need to deepcopy the object
-            else:
-                temp = etree.Element('nd', ref=str(i))
-                way.append(temp)
-                n[tuple(xy)] = {'el': temp, 'id': i}
+            # if given point is not in our list of nodes yet then create node for it right away
+            # so the nodes can be written out while we are still reading buildings
+            key = tuple(xy)
+            if key not in n:
+                n[key] = i
+                yield etree.Element('node', id=str(i), lat=str(xy[1]), lon=str(xy[0]))
+            refs.append(n[key])
             i -= 1
-        lst.append(way)
-
-    for k, v in n.items():
-        yield etree.Element('node', id=str(v['id']), lat=str(k[1]), lon=str(k[0]))
+        lst.append((t[0], t[2:9], refs))
 
-    for w in lst:
-        yield w
-
-
-def addresses_xml(list_of_tuples):
-    """Method creates XML with address points in OSM schema."""
-    root = etree.Element('osm', version='0.6')
-    i = -1  # counter for fake ids
-    for t in list_of_tuples:
-        el = etree.Element('node', id=str(i), lat=str(t[8]), lon=str(t[7]))
-        el.append(deepcopy(SOURCE_ADDR))
-        # do not add 'ref:addr' tag
-        # el.append(etree.Element('tag', k='ref:addr', v=t[0]))
-        el.append(etree.Element('tag', k='addr:city:simc', v=t[2]))
-        if t[3]:
-            el.append(etree.Element('tag', k='addr:city', v=t[1]))
-            el.append(etree.Element('tag', k='addr:street', v=t[3]))
-            el.append(etree.Element('tag', k='addr:street:sym_ul', v=t[4]))
-        else:
-            el.append(etree.Element('tag', k='addr:place', v=t[1]))
-        el.append(etree.Element('tag', k='addr:housenumber', v=t[5]))
-        if t[6]:
-            el.append(etree.Element('tag', k='addr:postcode', v=t[6]))
-        root.append(el)
-        i -= 1
-    return root
-
-
-def buildings_xml(list_of_tuples):
-    """Method creates XML with buildings (polygons) in OSM schema."""
-    root = etree.Element('osm', version='0.6')
-    i = -1  # counter for fake ids
-    n = {}  # list of nodes
-    lst = []  # list of ways
-    # cursor returns tuple of (way_id, array_of_points[])
-    for t in list_of_tuples:
+    for way_id, tags, refs in lst:
         # create 'way' node for xml tree
-        way = etree.Element('way', id=str(t[0]))
+        way = etree.Element('way', id=str(way_id))
         way.append(deepcopy(SOURCE_BUILDING))
-
-        if t[2]:
-            way.append(etree.Element('tag', k='building', v=t[2]))
-        if t[3]:
-            way.append(etree.Element('tag', k='amenity', v=t[3]))
-        if t[4]:
-            way.append(etree.Element('tag', k='man_made', v=t[4]))
-        if t[5]:
-            way.append(etree.Element('tag', k='leisure', v=t[5]))
-        if t[6]:
-            way.append(etree.Element('tag', k='historic', v=t[6]))
-        if t[7]:
-            way.append(etree.Element('tag', k='tourism', v=t[7]))
-        if t[8]:
-            way.append(etree.Element('tag', k='building:levels', v=str(t[8])))
-
-        # iterate over array of points that make the polygon and add references to them to the way xml node
-        for xy in t[1]:
-            # if given point is already in our list of nodes then:
-            if n.get(tuple(xy)):
-                way.append(deepcopy(n[tuple(xy)]['el']))
-                # appending doesn't work when you try to pass the same object
-                # you need to create new object if you want nodes with duplicate values
-                # since polygons start and end with the same node we need to deepcopy the object
-            else:
-                temp = etree.Element('nd', ref=str(i))
-                way.append(temp)
-                n[tuple(xy)] = {'el': temp, 'id': i}
-            i -= 1
-        lst.append(way)
-
-    for k, v in n.items():
-        root.append(etree.Element('node', id=str(v['id']), lat=str(k[1]), lon=str(k[0])))
-
-    for w in lst:
-        root.append(w)
-
-    return root
+        for k, v in zip(BUILDING_TAG_KEYS, tags):
+            if v:
+                way.append(etree.Element('tag', k=k, v=str(v)))
+        # add references to nodes that make the polygon
+        for ref in refs:
+            way.append(etree.Element('nd', ref=str(ref)))
+        yield way
+
+
+def osm_xml_stream(*elements: Iterable[etree.Element], flush_every: int = 1000) -> Iterator[bytes]:
+    """Method serializes elements into XML document in OSM schema chunk by chunk.
+    Elements are written as they come, so the whole document never has to be kept in memory."""
+    buffer = io.BytesIO()
+    with etree.xmlfile(buffer, encoding='UTF-8') as xf:
+        xf.write_declaration()
+        with xf.element('osm', version='0.6'):
+            for i, el in enumerate(chain.from_iterable(elements), 1):
+                xf.write(el)
+                if i % flush_every == 0:
+                    xf.flush()
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+    yield buffer.getvalue()
@@ -1,23 +1,27 @@
-import io
 from datetime import datetime, timedelta
 from random import choice, random
 from os import environ
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Iterator
 
 from flask import request, Response
 from flask_restful import Resource, abort
 import requests as requests_lib
-from lxml import etree
 
-from common.database import pgdb, execute_sql, QUERIES, execute_values, pg
-from common.util import to_merc, Tile, bounds, buildings_xml, addresses_xml, addresses_nodes, buildings_nodes
+from common.cache import tile_cache, tile_ttl, SingleFlight
+from common.database import pgdb, get_pool, execute_sql, stream_rows, QUERIES, execute_values, pg
+from common.overzoom import overzoom
+from common.tile_encoding import IDENTITY, decode, etag, prepare
+from common.tile_render import get_or_render_tile, counters as render_counters, MAX_NATIVE_ZOOM, MAX_ZOOM
+from common.util import (addresses_nodes, buildings_nodes, osm_xml_stream,
+                         CountingIterator)
 
 
 class Processes(Resource):
     """Lists processes (data update)."""
     def get(self):
-        cur = execute_sql(pgdb().cursor(), QUERIES['processes'])
-        list_of_processes = cur.fetchall()
+        with pgdb() as conn, conn.cursor() as cur:
+            execute_sql(cur, QUERIES['processes'])
+            list_of_processes = cur.fetchall()
         result = {
             'processes': [
                 {
@@ -53,16 +57,18 @@ class Excluded(Resource):
         if not(response.ok and response.json().get('success')):
             abort(400)
 
-        conn = pgdb()
-        with conn.cursor() as cur:
+        with pgdb() as conn, conn.cursor() as cur:
             prg_counter, lod1_counter = 0, 0
             if r.get('prg_ids'):
                 prg_ids = [(x,) for x in r['prg_ids']]
                 execute_values(cur, QUERIES['insert_to_exclude_prg'], prg_ids)
+                # hide them right away, tiles are invalidated when the queue is processed
+                execute_sql(cur, QUERIES['update_delta_excluded'], (tuple(r['prg_ids']),))
                 prg_counter = len(prg_ids)
             if r.get('bdot_ids'):
                 lod1_ids = [(x,) for x in r['bdot_ids']]
                 execute_values(cur, QUERIES['insert_to_exclude_bdot_buildings'], lod1_ids)
+                execute_sql(cur, QUERIES['update_bdot_buildings_excluded'], (tuple(r['bdot_ids']),))
                 lod1_counter = len(lod1_ids)
             conn.commit()
         return {'prg_ids_inserted': prg_counter, 'bdot_ids_inserted': lod1_counter}, 201
@@ -75,7 +81,7 @@ class RandomLocation(Resource):
             query = QUERIES['locations_most_count']
         else:
             query = QUERIES['locations_random']
-        with pgdb().cursor() as cur:
+        with pgdb() as conn, conn.cursor() as cur:
             execute_sql(cur, query)
             x, y = choice(cur.fetchall())
         return {'lon': x, 'lat': y}
@@ -83,7 +89,7 @@ class RandomLocation(Resource):
 
 class AddressPointInfo(Resource):
     def get(self, uuid: str):
-        with pgdb().cursor() as cur:
+        with pgdb() as conn, conn.cursor() as cur:
             try:
                 cur = execute_sql(cur, QUERIES['delta_point_info'], (uuid,))
             except pg.errors.InvalidTextRepresentation:
@@ -98,53 +104,117 @@ class AddressPointInfo(Resource):
 
 
 class MapboxVectorTile(Resource):
+    # concurrent requests for the same tile handled by this worker wait for a single database lookup/render
+    flight = SingleFlight()
+    # metrics
+    decompressed = 0  # responses to clients not accepting encoding of the stored tile
+    derived = 0  # tiles above MAX_NATIVE_ZOOM derived from their ancestors
+
     def get(self, z: int, x: int, y: int):
-        # calculate bbox
-        tile = Tile(x, y, z)
-        bbox = to_merc(bounds(tile))
-
-        # query db
-        conn = pgdb()
-        cur = execute_sql(conn.cursor(), QUERIES['cached_mvt'], (z, x, y))
-        tup = cur.fetchone()
-        if tup is None:
-            params = {
-                'xmin': bbox['west'],
-                'ymin': bbox['south'],
-                'xmax': bbox['east'],
-                'ymax': bbox['north'],
-                'z': z,
-                'x': x,
-                'y': y
-            }
-            if 6 <= int(z) <= 7:
-                cur = execute_sql(cur, QUERIES['mvt_ll_aggr_terc'], params)
-            elif 8 <= int(z) <= 9:
-                cur = execute_sql(cur, QUERIES['mvt_ll_aggr_simc'], params)
-            elif 10 <= int(z) <= 11:
-                cur = execute_sql(cur, QUERIES['mvt_ll_aggr_simc_ulic'], params)
-            elif 12 <= int(z) <= 12:
-                cur = execute_sql(cur, QUERIES['mvt_ll'], params)
-            elif 13 <= int(z) < 23:
-                cur = execute_sql(cur, QUERIES['mvt_hl'], params)
+        ttl = tile_ttl(int(z))
+        cached = tile_cache.get((z, x, y))
+        if cached is None and request.if_none_match and int(z) <= MAX_NATIVE_ZOOM:
+            # revalidation - compare only the hash, without reading the tile itself
+            tup = self.fetch_hash(z, x, y)
+            if tup is not None:
+                hash_, stored_encoding = tup
+                encoding = self.negotiate(stored_encoding)
+                if request.if_none_match.contains_weak(etag(hash_, encoding)):
+                    return self.response(None, etag(hash_, encoding), encoding, ttl)
+        if cached is None:
+            if int(z) <= MAX_NATIVE_ZOOM:
+                cached = self.flight.do((z, x, y), lambda: self.fetch(z, x, y))
             else:
-                abort(404)
-            conn.commit()
-            cur = execute_sql(cur, QUERIES['cached_mvt'], (z, x, y))
-            tup = cur.fetchone()
-        mvt = io.BytesIO(tup[0]).getvalue() if tup else abort(500)
-
-        # prepare and return response
-        response = Response(mvt)
-        response.headers['Content-Type'] = 'application/x-protobuf'
+                cached = self.flight.do((z, x, y), lambda: self.derive(z, x, y))
+            tile_cache.set((z, x, y), cached, ttl, size=len(cached[0]))
+        data, hash_, stored_encoding = cached
+        encoding = self.negotiate(stored_encoding)
+        if request.if_none_match.contains_weak(etag(hash_, encoding)):
+            return self.response(None, etag(hash_, encoding), encoding, ttl)
+        if encoding != stored_encoding:
+            data = decode(data, stored_encoding)
+            MapboxVectorTile.decompressed += 1
+        return self.response(data, etag(hash_, encoding), encoding, ttl)
+
+    @staticmethod
+    def negotiate(stored_encoding: str) -> str:
+        """Returns encoding of the response - encoding of the stored tile if client accepts it, identity otherwise."""
+        if stored_encoding == IDENTITY or request.accept_encodings[stored_encoding] > 0:
+            return stored_encoding
+        return IDENTITY
+
+    @staticmethod
+    def response(data: Optional[bytes], tag: str, encoding: str, ttl: int) -> Response:
+        """Prepares response with the tile or empty 304 (Not Modified) response if data is None."""
+        if data is None:
+            response = Response(status=304)
+        else:
+            response = Response(data)
+            response.headers['Content-Type'] = 'application/x-protobuf'
+            if encoding != IDENTITY:
+                response.headers['Content-Encoding'] = encoding
+        response.set_etag(tag)
+        response.headers['Vary'] = 'Accept-Encoding'
         response.headers['Access-Control-Allow-Origin'] = "*"
-        cur.close()
-        if 6 <= int(z) < 13:
-            response.headers['X-Accel-Expires'] = '10800'
-        elif 13 <= int(z) < 23:
-            response.headers['X-Accel-Expires'] = '60'
+        if ttl:
+            response.headers['X-Accel-Expires'] = str(ttl)
         return response
 
+    @staticmethod
+    def fetch_hash(z: int, x: int, y: int) -> Optional[Tuple[str, str]]:
+        """Returns hash and encoding of the tile from the tiles table or None if tile wasn't rendered yet."""
+        with pgdb() as conn, conn.cursor() as cur:
+            execute_sql(cur, QUERIES['tile_hash'], (z, x, y))
+            return cur.fetchone()
+
+    @staticmethod
+    def fetch(z: int, x: int, y: int) -> Tuple[bytes, str, str]:
+        """Returns stored (compressed) tile, its hash and encoding from the tiles table.
+        Renders the tile first if it's missing."""
+        try:
+            with pgdb() as conn:
+                tile, _ = get_or_render_tile(conn, z, x, y)
+        except ValueError:
+            abort(404)
+        return tile
+
+    @classmethod
+    def derive(cls, z: int, x: int, y: int) -> Tuple[bytes, str, str]:
+        """Derives tile above MAX_NATIVE_ZOOM from its ancestor (rescales geometries of the ancestor).
+        Derived tiles are not stored in the database, only in the in-process cache."""
+        if int(z) > MAX_ZOOM:
+            abort(404)
+        dz = int(z) - MAX_NATIVE_ZOOM
+        key = (MAX_NATIVE_ZOOM, int(x) >> dz, int(y) >> dz)
+        ancestor = tile_cache.get(key)
+        if ancestor is None:
+            ancestor = cls.flight.do(key, lambda: cls.fetch(*key))
+            tile_cache.set(key, ancestor, tile_ttl(MAX_NATIVE_ZOOM), size=len(ancestor[0]))
+        data, _, encoding = ancestor
+        mvt = overzoom(decode(data, encoding), dz, int(x) - (key[1] << dz), int(y) - (key[2] << dz))
+        data, hash_ = prepare(mvt, encoding)
+        cls.derived += 1
+        return data, hash_, encoding
+
+    @classmethod
+    def stats(cls) -> dict:
+        return {
+            # tiles rendered by this worker
+            'renders': render_counters['renders'],
+            # queries rendering a metatile (many tiles at once) / a single tile
+            'metatile_renders': render_counters['metatile_renders'],
+            'tile_renders': render_counters['tile_renders'],
+            # misses that found the tile rendered by another worker after waiting for the tile lock
+            'rendered_elsewhere': render_counters['rendered_elsewhere'],
+            'coalesced_in_worker': cls.flight.followers,
+            'in_flight': cls.flight.stats()['in_flight'],
+            'decompressed': cls.decompressed,
+            'derived': cls.derived,
+            # layers of high zoom tiles rendered / taken from tile_layers table
+            'layer_renders': render_counters['layer_renders'],
+            'layer_reuses': render_counters['layer_reuses'],
+        }
+
 
 class JosmData(Resource):
     """Newer version of the function returning data as osm file with the new endpoint."""
@@ -153,7 +223,6 @@ class JosmData(Resource):
         addresses_query, buildings_query = self.queries()
         addresses_params, buildings_params = None, None
         package_export_params = None
-        root = etree.Element('osm', version='0.6')
         if request.args.get('filter_by') == 'bbox':
             addresses_params = (float(request.args.get('xmin')),
                                 float(request.args.get('ymin')),
@@ -170,18 +239,12 @@ class JosmData(Resource):
             temp2 = request.args.get('buildings_ids')
             buildings_params = (tuple(temp2.split(',')),) if temp2 else None  # tuple of tuples was needed
 
-        a, b = self.data(addresses_query, addresses_params, buildings_query, buildings_params)
-        if package_export_params:
-            package_export_params['lb_adresow'] = len(a)
-            package_export_params['lb_budynkow'] = len(b)
-            conn = pgdb()
-            with pgdb().cursor() as cur:
-                cur.execute(QUERIES['insert_to_package_exports'], package_export_params)
-                conn.commit()
-        root = self.prepare_xml_tree(root, a, b)
+        # export is recorded before the response is streamed (so it's recorded even if the download doesn't finish),
+        # numbers of exported objects are filled in after the whole file was sent
+        export_id = self.record_export(package_export_params) if package_export_params else None
 
         return Response(
-            etree.tostring(root, encoding='UTF-8'),
+            self.xml_stream(addresses_query, addresses_params, buildings_query, buildings_params, export_id),
             mimetype='text/xml',
             headers={'Content-disposition': 'attachment; filename=paczka_danych.osm'})
 
@@ -190,7 +253,6 @@ class JosmData(Resource):
             abort(400)
 
         addresses_query, buildings_query = self.queries()
-        root = etree.Element('osm', version='0.6')
 
         temp = request.get_json()
         temp1 = temp.get('addresses_ids')
@@ -198,33 +260,56 @@ class JosmData(Resource):
         addresses_params = (tuple(temp1),) if temp1 and len(temp1) > 0 else None
         buildings_params = (tuple(temp2),) if temp2 and len(temp2) > 0 else None
 
-        a, b = self.data(addresses_query, addresses_params, buildings_query, buildings_params)
-        root = self.prepare_xml_tree(root, a, b)
-
         return Response(
-            etree.tostring(root, encoding='UTF-8'),
+            self.xml_stream(addresses_query, addresses_params, buildings_query, buildings_params),
             mimetype='text/xml',
             headers={'Content-disposition': 'attachment; filename=paczka_danych.osm'})
 
-    def data(self, addresses_query, addresses_params, buildings_query, buildings_params):
-        addresses, buildings = [], []
-        with pgdb().cursor() as cur:
-            if addresses_query and addresses_params and len(addresses_params) > 0:
-                cur = execute_sql(cur, addresses_query, addresses_params)
-                addresses = cur.fetchall()
+    @staticmethod
+    def record_export(package_export_params: dict) -> int:
+        """Records export of the package (without numbers of exported objects). Returns id of the export."""
+        with pgdb() as conn:
+            with conn.cursor() as cur:
+                execute_sql(cur, QUERIES['insert_to_package_exports'],
+                            dict(package_export_params, lb_adresow=None, lb_budynkow=None))
+                export_id = cur.fetchone()[0]
+            conn.commit()
+        return export_id
+
+    def xml_stream(self, addresses_query, addresses_params, buildings_query, buildings_params,
+                   export_id: Optional[int] = None) -> Iterator[bytes]:
+        """Generates osm file while rows are still being fetched from the database.
+        Connection stays checked out from the pool until the whole response is sent.
+        Status of the response is already sent when fetching fails, so the file ends with a comment about it
+        (and isn't a valid osm file) and the error is raised again to abort the response."""
+        with pgdb() as conn:
+            a, b = self.data(conn, addresses_query, addresses_params, buildings_query, buildings_params)
+            try:
+                yield from osm_xml_stream(addresses_nodes(a), buildings_nodes(b))
+            except GeneratorExit:
+                print(datetime.now().isoformat(), f'- Export {export_id} aborted by the client after',
+                      f'{a.count} addresses and {b.count} buildings.')
+                raise
+            except Exception as e:
+                print(datetime.now().isoformat(), f'- Export {export_id} failed after',
+                      f'{a.count} addresses and {b.count} buildings: {e!r}')
+                yield b'\n<!-- ERROR: export failed, the file is incomplete. -->\n'
+                raise
+            if export_id is not None:
+                with conn.cursor() as cur:
+                    execute_sql(cur, QUERIES['update_package_exports'],
+                                {'export_id': export_id, 'lb_adresow': a.count, 'lb_budynkow': b.count})
+                conn.commit()
 
-            if buildings_query and buildings_params and len(buildings_params) > 0:
-                cur = execute_sql(cur, buildings_query, buildings_params)
-                buildings = cur.fetchall()
+    def data(self, conn, addresses_query, addresses_params, buildings_query, buildings_params):
+        addresses, buildings = [], []
+        if addresses_query and addresses_params and len(addresses_params) > 0:
+            addresses = stream_rows(conn, addresses_query, addresses_params)
 
-        return addresses, buildings
+        if buildings_query and buildings_params and len(buildings_params) > 0:
+            buildings = stream_rows(conn, buildings_query, buildings_params)
 
-    def prepare_xml_tree(self, root, addresses, buildings):
-        for an in addresses_nodes(addresses):
-            root.append(an)
-        for bn in buildings_nodes(buildings):
-            root.append(bn)
-        return root
+        return CountingIterator(addresses), CountingIterator(buildings)
 
     def queries(self) -> Tuple[Optional[str], Optional[str]]:
         if request.args.get('filter_by') == 'bbox':
@@ -260,19 +345,17 @@ class PrgAddressesNotInOSM(Resource):
         if request.args.get('format') not in {'osm', 'xml'}:
             abort(400)
 
-        with pgdb().cursor() as cur:
-            execute_sql(
-                cur,
-                QUERIES['delta_where_bbox'],
-                (float(request.args.get('xmin')),
-                 float(request.args.get('ymin')),
-                 float(request.args.get('xmax')),
-                 float(request.args.get('ymax')))
-            )
-            root = addresses_xml(cur.fetchall())
+        params = (float(request.args.get('xmin')),
+                  float(request.args.get('ymin')),
+                  float(request.args.get('xmax')),
+                  float(request.args.get('ymax')))
+
+        def xml_stream():
+            with pgdb() as conn:
+                yield from osm_xml_stream(addresses_nodes(stream_rows(conn, QUERIES['delta_where_bbox'], params)))
 
         return Response(
-            etree.tostring(root, encoding='UTF-8'),
+            xml_stream(),
             mimetype='text/xml',
             headers={'Content-disposition': 'attachment; filename=prg_addresses.osm'})
 
@@ -291,17 +374,15 @@ class BuildingsNotInOSM(Resource):
         if request.args.get('format') not in {'osm', 'xml'}:
             abort(400)
 
-        with pgdb().cursor() as cur:
-            execute_sql(
-                cur,
-                QUERIES['buildings_vertices'],
-                (float(request.args.get('xmin')), float(request.args.get('ymin')),
-                 float(request.args.get('xmax')), float(request.args.get('ymax')))
-            )
-            root = buildings_xml(cur.fetchall())
+        params = (float(request.args.get('xmin')), float(request.args.get('ymin')),
+                  float(request.args.get('xmax')), float(request.args.get('ymax')))
+
+        def xml_stream():
+            with pgdb() as conn:
+                yield from osm_xml_stream(buildings_nodes(stream_rows(conn, QUERIES['buildings_vertices'], params)))
 
         return Response(
-            etree.tostring(root, encoding='UTF-8'),
+            xml_stream(),
             mimetype='text/xml',
             headers={'Content-disposition': 'attachment; filename=buildings.osm'})
 
@@ -319,7 +400,7 @@ class LatestUpdates(Resource):
         if ts - datetime.now() > timedelta(hours=24, minutes=5):
             abort(400)
 
-        with pgdb().cursor() as cur:
+        with pgdb() as conn, conn.cursor() as cur:
             execute_sql(
                 cur,
                 QUERIES['latest_updates'],
@@ -335,3 +416,13 @@ class LatestUpdates(Resource):
         }
 
         return response_dict
+
+
+class Stats(Resource):
+    """Internal statistics of the worker that handled the request (e.g. database connection pool and tile cache usage)."""
+    def get(self):
+        return {
+            'db_pool': get_pool().stats(),
+            'tile_cache': tile_cache.stats(),
+            'tile_render': MapboxVectorTile.stats(),
+        }
@@ -0,0 +1,276 @@
+"""Generator of synthetic PRG (addresses) and BDOT10k (buildings) GML files for benchmarking of the parsers.
+
+PRG files contain all four types of records read by prg.py: administrative units (country, voivodeship, counties,
+communes), localities, streets and address points referencing them (komponent links) like the files published
+by GUGiK do. BDOT10k files contain OT_BUBD_A buildings with codes taken from lookups of bdot10k.py.
+Generated data is random but deterministic for given seed, so runs on the same machine are comparable.
+
+Output files are named like the original ones: XX_Punkty_Adresowe.(xml|zip) for PRG (XX - TERYT code
+of voivodeship) and BDOT10k_XXXX.zip for BDOT10k (XXXX - TERYT code of county). BDOT10k parser reads only zip files
+so BDOT10k files are always zipped.
+
+Usage:
+python gml_generator.py --dataset prg --scale 1000000 --files 4 --zip --output /tmp/prg
+python gml_generator.py --dataset bdot --scale 200000 --output /tmp/bdot
+"""
+import argparse
+import math
+import random
+import sys
+import uuid
+import zipfile
+from io import TextIOWrapper
+from os.path import join, dirname, abspath
+from typing import Iterator, List, TextIO
+
+sys.path.append(join(dirname(dirname(abspath(__file__))), 'processing', 'parsers'))
+from bdot10k import lookup_x_kod, lookup_x_katIstnienia, lookup_funOgolnaBudynku, lookup_funSzczegolowaBudynku
+
+PRG_HEADER = '''<?xml version="1.0" encoding="UTF-8"?>
+<gml:FeatureCollection
+ xmlns:gml="http://www.opengis.net/gml/3.2"
+ xmlns:prg-ad="urn:gugik:specyfikacje:gmlas:panstwowyRejestrGranicAdresy:1.0"
+ xmlns:bt="urn:gugik:specyfikacje:gmlas:modelPodstawowy:1.0"
+ xmlns:mua="urn:gugik:specyfikacje:gmlas:ewidencjaMiejscowosciUlicAdresow:1.0"
+ xmlns:xlink="http://www.w3.org/1999/xlink"
+ gml:id="PRG_{code}">
+'''
+BDOT_HEADER = '''<?xml version="1.0" encoding="UTF-8"?>
+<gml:FeatureCollection
+ xmlns:gml="http://www.opengis.net/gml/3.2"
+ xmlns:ot="urn:gugik:specyfikacje:gmlas:bazaDanychObiektowTopograficznych10k:1.0"
+ xmlns:bt="urn:gugik:specyfikacje:gmlas:modelPodstawowy:1.0"
+ xmlns:xlink="http://www.w3.org/1999/xlink"
+ gml:id="BDOT10k_{code}">
+'''
+FOOTER = '</gml:FeatureCollection>\n'
+
+PRG_NS = 'PL.PZGIK.200'
+PRG_HREF = 'http://geoportal.gov.pl/PZGIK/dane/'
+SRS_NAME = 'http://www.opengis.net/def/crs/EPSG/0/2180'
+
+PRG_ID = (
+    '<prg-ad:idIIP><bt:BT_Identyfikator><bt:lokalnyId>{lid}</bt:lokalnyId><bt:przestrzenNazw>' + PRG_NS +
+    '</bt:przestrzenNazw><bt:wersjaId>{wersja}</bt:wersjaId></bt:BT_Identyfikator></prg-ad:idIIP>'
+    '<prg-ad:cyklZycia><bt:BT_CyklZyciaInfo><bt:poczatekWersjiObiektu>{wersja}</bt:poczatekWersjiObiektu>'
+    '</bt:BT_CyklZyciaInfo></prg-ad:cyklZycia><prg-ad:waznyOd>{wazny_od}</prg-ad:waznyOd>'
+)
+PRG_POINT = ('<gml:Point gml:id="P.{lid}" srsName="' + SRS_NAME + '"><gml:pos>{y:.2f} {x:.2f}</gml:pos></gml:Point>')
+JA = (
+    '<gml:featureMember><prg-ad:PRG_JednostkaAdministracyjnaNazwa gml:id="' + PRG_NS + '.{lid}">' + PRG_ID +
+    '<prg-ad:nazwa>{nazwa}</prg-ad:nazwa><prg-ad:idTERYT>{teryt}</prg-ad:idTERYT><prg-ad:poziom>{poziom}</prg-ad:poziom>'
+    '<prg-ad:jednostkaPodzialuTeryt xlink:href="' + PRG_HREF + 'PL.PZGIK.201.{teryt}"/>'
+    '</prg-ad:PRG_JednostkaAdministracyjnaNazwa></gml:featureMember>\n'
+)
+MSC = (
+    '<gml:featureMember><prg-ad:PRG_MiejscowoscNazwa gml:id="' + PRG_NS + '.{lid}">' + PRG_ID +
+    '<prg-ad:nazwa>{nazwa}</prg-ad:nazwa><prg-ad:idTERYT>{teryt}</prg-ad:idTERYT>'
+    '<prg-ad:geometria>' + PRG_POINT + '</prg-ad:geometria>'
+    '<prg-ad:miejscowosc xlink:href="' + PRG_HREF + 'PL.PZGIK.202.{teryt}"/>'
+    '</prg-ad:PRG_MiejscowoscNazwa></gml:featureMember>\n'
+)
+UL = (
+    '<gml:featureMember><prg-ad:PRG_UlicaNazwa gml:id="' + PRG_NS + '.{lid}">' + PRG_ID +
+    '<prg-ad:nazwaGlownaCzesc>{nazwa}</prg-ad:nazwaGlownaCzesc><prg-ad:idTERYT>{teryt}</prg-ad:idTERYT>'
+    '<prg-ad:geometria>' + PRG_POINT + '</prg-ad:geometria>'
+    '<prg-ad:ulica xlink:href="' + PRG_HREF + 'PL.PZGIK.203.{teryt}"/>'
+    '</prg-ad:PRG_UlicaNazwa></gml:featureMember>\n'
+)
+PA = (
+    '<gml:featureMember><prg-ad:PRG_PunktAdresowy gml:id="' + PRG_NS + '.{lid}">' + PRG_ID +
+    '{jednostki}<prg-ad:miejscowosc>{msc}</prg-ad:miejscowosc><prg-ad:czescMiejscowosci/>'
+    '<prg-ad:ulica>{ul}</prg-ad:ulica><prg-ad:numerPorzadkowy>{nr}</prg-ad:numerPorzadkowy>'
+    '<prg-ad:kodPocztowy>{pna}</prg-ad:kodPocztowy><prg-ad:status>{status}</prg-ad:status>'
+    '<prg-ad:pozycja>' + PRG_POINT + '</prg-ad:pozycja>{komponenty}'
+    '<prg-ad:obiektEMUiA xlink:href="' + PRG_HREF + 'PL.PZGIK.204.{emuia}"/>'
+    '</prg-ad:PRG_PunktAdresowy></gml:featureMember>\n'
+)
+BUBD = (
+    '<gml:featureMember><ot:OT_BUBD_A gml:id="PL.PZGiK.994.BDOT10k.{lid}">'
+    '<ot:idIIP><bt:BT_Identyfikator><bt:lokalnyId>{lid}</bt:lokalnyId><bt:przestrzenNazw>PL.PZGiK.994.BDOT10k'
+    '</bt:przestrzenNazw><bt:wersjaId>{wersja}</bt:wersjaId></bt:BT_Identyfikator></ot:idIIP>'
+    '<ot:czyObiektBDOO>false</ot:czyObiektBDOO><ot:x_kod>{x_kod}</ot:x_kod><ot:x_skrKarto>{skr}</ot:x_skrKarto>'
+    '<ot:x_katDoklGeom>{dokl}</ot:x_katDoklGeom><ot:x_doklGeom>0.10</ot:x_doklGeom>'
+    '<ot:x_zrodloDanychG>EGiB</ot:x_zrodloDanychG><ot:x_zrodloDanychA>EGiB</ot:x_zrodloDanychA>'
+    '<ot:x_katIstnienia>{istnienie}</ot:x_katIstnienia><ot:x_rodzajReprGeom>powierzchnia</ot:x_rodzajReprGeom>'
+    '<ot:x_uzytkownik>{powiat}</ot:x_uzytkownik><ot:x_aktualnoscG>{aktualnosc}</ot:x_aktualnoscG>'
+    '<ot:x_aktualnoscA>{aktualnosc}</ot:x_aktualnoscA>'
+    '<ot:cyklZycia><bt:BT_CyklZyciaInfo><bt:poczatekWersjiObiektu>{wersja}</bt:poczatekWersjiObiektu>'
+    '</bt:BT_CyklZyciaInfo></ot:cyklZycia><ot:x_dataUtworzenia>{wersja}</ot:x_dataUtworzenia>'
+    '<ot:x_kodKarto10k>BUBD01</ot:x_kodKarto10k>'
+    '<ot:funOgolnaBudynku>{fun_ogolna}</ot:funOgolnaBudynku><ot:funSzczegolowaBudynku>{fun_szczeg}'
+    '</ot:funSzczegolowaBudynku><ot:liczbaKondygnacji>{kondygnacje}</ot:liczbaKondygnacji>{nazwa}'
+    '<ot:zabytek>{zabytek}</ot:zabytek><ot:geometria><gml:Polygon gml:id="G.{lid}" srsName="' + SRS_NAME + '">'
+    '<gml:exterior><gml:LinearRing><gml:posList>{pos_list}</gml:posList></gml:LinearRing></gml:exterior>'
+    '</gml:Polygon></ot:geometria></ot:OT_BUBD_A></gml:featureMember>\n'
+)
+
+# syllables of random names of places and streets
+SYLLABLES = ('ka', 'no', 'wa', 'ro', 'le', 'szy', 'mo', 'ki', 'bo', 'rze', 'lin', 'dąb', 'sła', 'wie', 'cze', 'góra')
+STREET_PREFIXES = ('ul. ', 'ul. ', 'ul. ', 'al. ', 'pl. ', '')
+STATUSES = ('istniejacy',) * 17 + ('wTrakcieBudowy', 'prognozowany', 'nieistniejacy')
+# bbox of Poland in EPSG:2180
+X_RANGE = (170000.0, 860000.0)
+Y_RANGE = (140000.0, 775000.0)
+
+
+def random_name(rnd: random.Random, syllables: int = 3) -> str:
+    return ''.join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(2, syllables))).capitalize()
+
+
+def random_uuid(rnd: random.Random) -> str:
+    return str(uuid.UUID(int=rnd.getrandbits(128), version=4))
+
+
+def random_date(rnd: random.Random) -> str:
+    return f'{rnd.randint(2012, 2021)}-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}'
+
+
+def prg_records(scale: int, code: str, rnd: random.Random) -> Iterator[str]:
+    """Yields PRG records (one line each) of a voivodeship with scale address points.
+    Proportions of records are similar to the ones in real data."""
+    gmi_count = max(1, scale // 3500)
+    pow_count = max(1, gmi_count // 7)
+    msc_count = max(1, scale // 80)
+    ul_count = max(1, scale // 27)
+
+    def ja(nazwa: str, teryt: str, poziom: str) -> dict:
+        return {'lid': random_uuid(rnd), 'nazwa': nazwa, 'teryt': teryt, 'poziom': poziom}
+
+    polska = ja('Polska', 'PL', '1stopnia')
+    woj = ja(random_name(rnd, 4).lower(), code, '2stopnia')
+    powiaty = [ja(random_name(rnd), code + f'{i + 1:02d}', '3stopnia') for i in range(pow_count)]
+    gminy = [dict(ja(random_name(rnd), powiaty[i % pow_count]['teryt'] + f'{i // pow_count + 1:02d}2', '4stopnia'),
+                  powiat=powiaty[i % pow_count])
+             for i in range(gmi_count)]
+    for unit in [polska, woj] + powiaty + gminy:
+        yield JA.format(wersja=random_date(rnd) + 'T00:00:00', wazny_od=random_date(rnd), **unit)
+
+    # localities are placed in the commune, addresses and streets around their locality
+    miejscowosci: List[dict] = []
+    for i in range(msc_count):
+        msc = {'lid': random_uuid(rnd), 'nazwa': random_name(rnd), 'teryt': f'{rnd.randint(1, 9999999):07d}',
+               'x': rnd.uniform(*X_RANGE), 'y': rnd.uniform(*Y_RANGE), 'gmina': gminy[i % gmi_count]}
+        miejscowosci.append(msc)
+        yield MSC.format(wersja=random_date(rnd) + 'T00:00:00', wazny_od=random_date(rnd), **msc)
+    ulice: List[dict] = []
+    for i in range(ul_count):
+        msc = miejscowosci[i % msc_count]
+        ul = {'lid': random_uuid(rnd), 'nazwa': rnd.choice(STREET_PREFIXES) + random_name(rnd, 4),
+              'teryt': f'{rnd.randint(1, 99999):05d}', 'x': msc['x'] + rnd.uniform(-2000, 2000),
+              'y': msc['y'] + rnd.uniform(-2000, 2000), 'msc': msc}
+        ulice.append(ul)
+        yield UL.format(wersja=random_date(rnd) + 'T00:00:00', wazny_od=random_date(rnd), **ul)
+
+    for i in range(scale):
+        # every 5th address has no street (villages)
+        ul = ulice[rnd.randrange(ul_count)] if i % 5 else None
+        msc = ul['msc'] if ul else miejscowosci[rnd.randrange(msc_count)]
+        units = [polska, woj, msc['gmina']['powiat'], msc['gmina']]
+        komponenty = units + [msc] + ([ul] if ul else [])
+        nr = str(rnd.randint(1, 250)) + (rnd.choice('ABCD') if rnd.random() < 0.1 else '')
+        yield PA.format(
+            lid=random_uuid(rnd),
+            wersja=random_date(rnd) + 'T00:00:00',
+            wazny_od=random_date(rnd),
+            jednostki=''.join(f'<prg-ad:jednostkaAdmnistracyjna>{u["nazwa"]}</prg-ad:jednostkaAdmnistracyjna>'
+                              for u in units),
+            msc=msc['nazwa'],
+            ul=ul['nazwa'] if ul else msc['nazwa'],
+            nr=nr,
+            pna=f'{rnd.randint(0, 99):02d}-{rnd.randint(0, 999):03d}',
+            status=rnd.choice(STATUSES),
+            x=msc['x'] + rnd.uniform(-2000, 2000),
+            y=msc['y'] + rnd.uniform(-2000, 2000),
+            komponenty=''.join(f'<prg-ad:komponent xlink:href="{PRG_HREF}{PRG_NS}.{k["lid"]}"/>'
+                               for k in komponenty),
+            emuia=random_uuid(rnd)
+        )
+
+
+def bdot_records(scale: int, code: str, rnd: random.Random) -> Iterator[str]:
+    """Yields scale BDOT10k buildings (one line each) of a county: rotated rectangles, some with extra vertices.
+    Positions of polygons are written in the order bdot10k.py reads them (x y)."""
+    x_kody = sorted(lookup_x_kod)
+    katistnienia = ('Eks',) * 17 + ('Bud', 'Zns', 'Tmc')
+    funkcje = sorted(lookup_funSzczegolowaBudynku)
+    funkcje_ogolne = sorted(lookup_funOgolnaBudynku)
+    cx, cy = rnd.uniform(*X_RANGE), rnd.uniform(*Y_RANGE)
+    for _ in range(scale):
+        x, y = cx + rnd.uniform(-15000, 15000), cy + rnd.uniform(-15000, 15000)
+        w, h, angle = rnd.uniform(6, 30), rnd.uniform(6, 20), rnd.uniform(0, math.pi)
+        corners = [(-w / 2, -h / 2), (w / 2, -h / 2), (w / 2, h / 2), (-w / 2, h / 2)]
+        if rnd.random() < 0.3:  # L-shaped buildings
+            corners = [(-w / 2, -h / 2), (w / 2, -h / 2), (w / 2, 0), (0, 0), (0, h / 2), (-w / 2, h / 2)]
+        points = [(x + dx * math.cos(angle) - dy * math.sin(angle), y + dx * math.sin(angle) + dy * math.cos(angle))
+                  for dx, dy in corners]
+        points.append(points[0])
+        fun_szczeg = rnd.choice(funkcje)
+        fun_ogolna = fun_szczeg.split('.')[0]
+        yield BUBD.format(
+            lid=random_uuid(rnd),
+            wersja=random_date(rnd) + 'T00:00:00',
+            x_kod=rnd.choice(x_kody),
+            skr=rnd.choice(('', 'G', 'K', 'M')),
+            dokl=rnd.choice(('0', '1', '2')),
+            istnienie=rnd.choice(katistnienia) if rnd.random() < 0.99 else rnd.choice(sorted(lookup_x_katIstnienia)),
+            powiat=code,
+            aktualnosc=random_date(rnd),
+            fun_ogolna=fun_ogolna if fun_ogolna in funkcje_ogolne else rnd.choice(funkcje_ogolne),
+            fun_szczeg=fun_szczeg,
+            kondygnacje=rnd.randint(1, 11),
+            nazwa=f'<ot:nazwa>{random_name(rnd)}</ot:nazwa>' if rnd.random() < 0.05 else '',
+            zabytek='true' if rnd.random() < 0.01 else 'false',
+            pos_list=' '.join(f'{px:.2f} {py:.2f}' for px, py in points)
+        )
+
+
+def write_records(f: TextIO, header: str, records: Iterator[str]) -> None:
+    f.write(header)
+    for record in records:
+        f.write(record)
+    f.write(FOOTER)
+
+
+def generate(dataset: str, scale: int, code: str, output_dir: str, zipped: bool, seed: int) -> str:
+    """Writes one file and returns its path."""
+    rnd = random.Random(f'{seed}-{dataset}-{code}')
+    if dataset == 'prg':
+        file_name, member_name = f'{code}_Punkty_Adresowe', f'{code}_Punkty_Adresowe.xml'
+        header, records = PRG_HEADER.format(code=code), prg_records(scale, code, rnd)
+    else:
+        file_name, member_name = f'BDOT10k_{code}', f'PL.PZGiK.994.{code}__OT_BUBD_A.xml'
+        header, records = BDOT_HEADER.format(code=code), bdot_records(scale, code, rnd)
+
+    if zipped:
+        path = join(output_dir, file_name + '.zip')
+        with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as zip_file:
+            with zip_file.open(member_name, 'w', force_zip64=True) as member:
+                with TextIOWrapper(member, encoding='UTF-8', newline='\n') as f:
+                    write_records(f, header, records)
+    else:
+        path = join(output_dir, file_name + '.xml')
+        with open(path, 'w', encoding='UTF-8', newline='\n') as f:
+            write_records(f, header, records)
+    return path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dataset', help='Type of generated files.', choices=('prg', 'bdot'), nargs=1, required=True)
+    parser.add_argument('--scale', help='Number of address points (PRG) or buildings (BDOT10k) per file.', nargs=1,
+                        type=int, default=[100000])
+    parser.add_argument('--files', help='Number of generated files (voivodeships or counties).', nargs=1, type=int,
+                        default=[1])
+    parser.add_argument('--output', help='Output directory.', nargs=1, required=True)
+    parser.add_argument('--zip', help='Zip generated files (BDOT10k files are always zipped).', action='store_true')
+    parser.add_argument('--seed', help='Seed of random generator.', nargs=1, type=int, default=[0])
+    args = vars(parser.parse_args())
+
+    dataset = args['dataset'][0]
+    for i in range(args['files'][0]):
+        # TERYT codes of voivodeships are even numbers, codes of counties consist of voivodeship and county number
+        code = f'{2 * (i + 1):02d}' if dataset == 'prg' else f'02{i + 1:02d}'
+        path = generate(dataset, args['scale'][0], code, args['output'][0], args['zip'] or dataset == 'bdot',
+                        args['seed'][0])
+        print(path)
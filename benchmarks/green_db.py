@@ -0,0 +1,87 @@
+"""Benchmark showing whether one slow vector tile render stalls other requests served by the same gevent worker.
+
+The app is served in-process by gevent's WSGI server (single worker, like one gunicorn gevent worker).
+First the tile is removed from `tiles` and `tile_layers` so it has to be rendered, then while it renders
+a number of `/processes/` and `/random/` requests is sent. The run is repeated with psycopg2 in blocking
+and in cooperative (green) mode.
+
+Usage:
+python green_db.py --dsn "host=localhost port=5432 dbname=gugik2osm user=user password=password" --tile 14/9153/5400
+"""
+from gevent import monkey
+monkey.patch_all()
+
+import argparse
+import statistics
+import sys
+import time
+import urllib.request
+from os import environ
+from os.path import join, dirname, abspath
+
+import gevent
+from gevent.pywsgi import WSGIServer
+
+sys.path.append(join(dirname(dirname(abspath(__file__))), 'app'))
+
+
+def timed_get(url: str) -> float:
+    sts = time.perf_counter()
+    with urllib.request.urlopen(url) as response:
+        response.read()
+    return time.perf_counter() - sts
+
+
+def run(base_url: str, dsn: str, z: int, x: int, y: int, fast_requests: int) -> dict:
+    import psycopg2
+    with psycopg2.connect(dsn) as conn:
+        with conn.cursor() as cur:
+            cur.execute('delete from tiles where z = %s and x = %s and y = %s', (z, x, y))
+            cur.execute('delete from tile_layers where z = %s and x = %s and y = %s', (z, x, y))
+        conn.commit()
+
+    slow = gevent.spawn(timed_get, f'{base_url}/tiles/{z}/{x}/{y}.pbf')
+    gevent.sleep(0.05)  # make sure the slow request reached the database first
+    fast = [
+        gevent.spawn(timed_get, base_url + ('/processes/' if i % 2 == 0 else '/random/'))
+        for i in range(fast_requests)
+    ]
+    gevent.joinall([slow] + fast, raise_error=True)
+    fast_times = sorted(g.value for g in fast)
+    return {
+        'slow_tile_s': slow.value,
+        'fast_p50_s': statistics.median(fast_times),
+        'fast_max_s': fast_times[-1],
+        'fast_finished_before_tile': sum(1 for t in fast_times if t + 0.05 < slow.value),
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dsn', help='Connection string for PostgreSQL DB.', nargs=1, required=True)
+    parser.add_argument('--tile', help='Tile (z/x/y) with zoom 13 or higher to render.', nargs=1, default=['14/9153/5400'])
+    parser.add_argument('--fast_requests', help='Number of requests sent while the tile renders.', nargs=1, type=int,
+                        default=[20])
+    args = vars(parser.parse_args())
+
+    environ['dsn'] = args['dsn'][0]
+    environ.setdefault('db_pool_max_size', str(args['fast_requests'][0] + 1))
+    environ['tile_cache_max_bytes'] = '0'  # the tile has to be rendered from the database in every mode
+    from common import database
+    from app import app
+
+    server = WSGIServer(('127.0.0.1', 0), app, log=None)
+    server.start()
+    base_url = f'http://127.0.0.1:{server.server_port}'
+    tz, tx, ty = [int(v) for v in args['tile'][0].split('/')]
+
+    for mode, switch in (('blocking', database.make_psycopg_blocking), ('green', database.make_psycopg_green)):
+        switch()
+        database.get_pool().closeall()
+        database.pool = None
+        result = run(base_url, args['dsn'][0], tz, tx, ty, args['fast_requests'][0])
+        print(f'{mode:>8}: tile render {result["slow_tile_s"]:.3f}s',
+              f'- other requests p50 {result["fast_p50_s"]:.3f}s, max {result["fast_max_s"]:.3f}s',
+              f'- finished before the tile: {result["fast_finished_before_tile"]}/{args["fast_requests"][0]}')
+
+    server.stop()
@@ -0,0 +1,81 @@
+"""Benchmark of /josm_data queries (addresses and buildings in bbox): p50/p99 of query time for random bboxes.
+
+Like tile_query_latency.py the queries can be compared with another version of them (e.g. before exclusions were
+applied at write time) by passing directory with exported query files as baseline:
+
+git archive <commit> app/common/queries | tar -x -C /tmp/baseline
+
+Usage:
+python josm_data_latency.py --dsn "host=localhost port=5432 dbname=gugik2osm user=user password=password" --baseline /tmp/baseline/app/common/queries
+"""
+import argparse
+import random
+import sys
+import time
+from os.path import join, dirname, abspath
+from typing import Dict, List, Tuple
+
+import psycopg2
+
+sys.path.append(join(dirname(dirname(abspath(__file__))), 'app'))
+from common.database import QUERIES
+from tile_query_latency import percentile
+
+JOSM_QUERIES = ('delta_where_bbox', 'buildings_vertices')
+
+
+def load_queries(path: str) -> Dict[str, str]:
+    return {name: str(open(join(path, name + '.sql'), 'r').read()) for name in JOSM_QUERIES}
+
+
+def random_bboxes(bbox: List[float], size: float, n: int) -> List[Tuple[float, float, float, float]]:
+    """Returns n bboxes (WGS84) of given size (degrees) randomly placed within bbox."""
+    west, south, east, north = bbox
+    bboxes = []
+    for _ in range(n):
+        x, y = random.uniform(west, east - size), random.uniform(south, north - size)
+        bboxes.append((x, y, x + size, y + size))
+    return bboxes
+
+
+def query_times(cur, queries: Dict[str, str], bboxes: list) -> Dict[str, List[float]]:
+    """Returns query name -> list of times (query and fetching all rows) in seconds."""
+    for params in bboxes:
+        for name in JOSM_QUERIES:
+            cur.execute(queries[name], params)
+            cur.fetchall()
+    times = {name: [] for name in JOSM_QUERIES}
+    for params in bboxes:
+        for name in JOSM_QUERIES:
+            sts = time.perf_counter()
+            cur.execute(queries[name], params)
+            cur.fetchall()
+            times[name].append(time.perf_counter() - sts)
+    return times
+
+
+def report(label: str, times: Dict[str, List[float]]) -> None:
+    for name, values in times.items():
+        print(f'{label:>10} {name:>18}: {len(values)} bboxes,',
+              f'p50: {percentile(values, 50) * 1000:.1f} ms, p99: {percentile(values, 99) * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dsn', help='Connection string for PostgreSQL DB.', nargs=1, required=True)
+    parser.add_argument('--bbox', help='Area to sample bboxes from (WGS84): west south east north.', nargs=4,
+                        type=float, default=[20.85, 52.10, 21.15, 52.35])
+    parser.add_argument('--size', help='Size of the requested bbox in degrees.', nargs=1, type=float,
+                        default=[0.01])
+    parser.add_argument('--requests', help='Number of bboxes.', nargs=1, type=int, default=[200])
+    parser.add_argument('--baseline', help='Directory with query files to compare with.', nargs=1)
+    args = vars(parser.parse_args())
+
+    random.seed(0)
+    bboxes = random_bboxes(args['bbox'], args['size'][0], args['requests'][0])
+    with psycopg2.connect(args['dsn'][0]) as conn:
+        with conn.cursor() as cur:
+            if args.get('baseline'):
+                report('baseline', query_times(cur, load_queries(args['baseline'][0]), bboxes))
+            report('current', query_times(cur, QUERIES, bboxes))
+        conn.rollback()
@@ -0,0 +1,92 @@
+"""Benchmark of high zoom tile rendering: one query per tile and layer vs one query per metatile and layer.
+
+Both variants only run the render queries (nothing is stored). To make the comparison fair every variant
+is run twice and only the second (warm cache) run is reported.
+
+Usage:
+python metatile_render.py --dsn "host=localhost port=5432 dbname=gugik2osm user=user password=password" --zoom 14 --metatile_size 4
+"""
+import argparse
+import math
+import sys
+import time
+from os.path import join, dirname, abspath
+
+import mercantile as m
+import psycopg2
+
+sys.path.append(join(dirname(dirname(abspath(__file__))), 'app'))
+from common.database import QUERIES
+from common.tile_math import tile_envelope, tile_bounds, WORLD_SIZE
+from common.tile_render import HL_LAYERS, metatile
+
+
+def area_km2(tiles: list) -> float:
+    """Approximate area on the ground covered by tiles (Web Mercator scale factor at the centre of each tile)."""
+    total = 0.0
+    for t in tiles:
+        lat = math.radians(m.ul(t.x + 0.5, t.y + 0.5, t.z).lat)
+        size = WORLD_SIZE / (1 << t.z) * math.cos(lat)
+        total += size * size / 1e6
+    return total
+
+
+def per_tile(cur, tiles: list) -> None:
+    for t in tiles:
+        params = tile_envelope(t.z, t.x, t.y)
+        for _, query, _ in HL_LAYERS:
+            cur.execute(QUERIES[query], params)
+            cur.fetchall()
+
+
+def per_metatile(cur, tiles: list, size: int) -> None:
+    for z, x0, y0, x1, y1 in sorted({(t.z,) + metatile(t.z, t.x, t.y, size) for t in tiles}):
+        params = {
+            'xmin': tile_bounds(z, x0, y0)['west'],
+            'ymax': tile_bounds(z, x0, y0)['north'],
+            'xmax': tile_bounds(z, x1, y1)['east'],
+            'ymin': tile_bounds(z, x1, y1)['south'],
+            'size': WORLD_SIZE / (1 << z),
+            'z': z, 'x0': x0, 'y0': y0, 'x1': x1, 'y1': y1,
+        }
+        for _, _, meta_query in HL_LAYERS:
+            cur.execute(QUERIES[meta_query], params)
+            cur.fetchall()
+
+
+def timed(fn) -> float:
+    fn()  # warm up
+    sts = time.perf_counter()
+    fn()
+    return time.perf_counter() - sts
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dsn', help='Connection string for PostgreSQL DB.', nargs=1, required=True)
+    parser.add_argument('--bbox', help='Area to render (WGS84): west south east north.', nargs=4, type=float,
+                        default=[20.95, 52.20, 21.05, 52.26])
+    parser.add_argument('--zoom', help='Zoom of the tiles (13 or higher).', nargs=1, type=int, default=[14])
+    parser.add_argument('--metatile_size', help='Metatile size (tiles per side).', nargs='+', type=int,
+                        default=[4, 8])
+    args = vars(parser.parse_args())
+
+    tiles = list(m.tiles(*args['bbox'], [args['zoom'][0]]))
+    km2 = area_km2(tiles)
+    with psycopg2.connect(args['dsn'][0]) as conn:
+        with conn.cursor() as cur:
+            elapsed = timed(lambda: per_tile(cur, tiles))
+            print(f'{"per tile":>16}: {len(tiles)} tiles, {km2:.1f} km2, {elapsed:.3f}s,',
+                  f'{elapsed / km2 * 1000:.1f} ms/km2')
+            for size in args['metatile_size']:
+                # whole metatiles are rendered so they may cover more than the requested area
+                rendered = [
+                    m.Tile(x, y, z)
+                    for z, x0, y0, x1, y1 in {(t.z,) + metatile(t.z, t.x, t.y, size) for t in tiles}
+                    for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)
+                ]
+                rendered_km2 = area_km2(rendered)
+                elapsed = timed(lambda: per_metatile(cur, tiles, size))
+                print(f'{f"metatile {size}x{size}":>16}: {len(rendered)} tiles, {rendered_km2:.1f} km2,',
+                      f'{elapsed:.3f}s, {elapsed / rendered_km2 * 1000:.1f} ms/km2')
+        conn.rollback()
@@ -0,0 +1,116 @@
+"""Benchmark of writers of the PRG and BDOT10k parsers: records/s, MB/s (of uncompressed xml) and peak RSS.
+
+Every writer runs in a new process so peak RSS of one writer doesn't include memory of the others.
+Output of csv, parquet (needs pyarrow) and sqlite writers goes to a temporary directory, output of stdout writer
+to /dev/null, postgresql writers recreate tables in a separate schema (benchmark by default) of given database.
+Input files can be generated with gml_generator.py.
+
+Usage:
+python parser_writers.py --parser prg --input /tmp/prg/02_Punkty_Adresowe.zip --writers csv parquet sqlite stdout
+python parser_writers.py --parser bdot10k --input /tmp/bdot/BDOT10k_0201.zip --writers postgresql postgresql_copy --dsn "host=localhost port=5432 dbname=gugik2osm user=user password=password"
+"""
+import argparse
+import importlib
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from os.path import join, dirname, abspath, getsize
+from typing import Tuple
+
+sys.path.append(join(dirname(dirname(abspath(__file__))), 'processing', 'parsers'))
+
+WRITERS = ('csv', 'parquet', 'sqlite', 'stdout', 'postgresql', 'postgresql_copy')
+
+
+def xml_size(file_path: str) -> int:
+    """Returns size of xml/gml data of the file in bytes (uncompressed size of its xml files if it's a zip)."""
+    if file_path.endswith('.zip'):
+        with zipfile.ZipFile(file_path, 'r') as zip_file:
+            return sum(info.file_size for info in zip_file.infolist() if info.filename.endswith(('.xml', '.gml')))
+    return getsize(file_path)
+
+
+def run_writer(parser: str, writer: str, file_path: str, options: dict) -> Tuple[int, float, int]:
+    """Runs writer on the file in the current process.
+    Returns number of records, time it took and peak RSS of the process in bytes."""
+    import resource
+    module = importlib.import_module(parser)
+    kwargs = {'geometry_format': options['geometry_format']}
+    run_kwargs = {}
+    if writer == 'csv':
+        w = module.CSVWriter(file_path, options['directory'], **kwargs)
+    elif writer == 'parquet':
+        w = module.ParquetWriter(file_path, options['directory'], **kwargs)
+    elif writer == 'sqlite':
+        w = module.SQLiteWriter(file_path, join(options['directory'], 'benchmark.sqlite'), **kwargs)
+        run_kwargs = {'prepare_tables': True}
+    elif writer == 'stdout':
+        w = module.StdOutWriter(file_path, **kwargs)
+    elif writer == 'postgresql':
+        w = module.PostgreSQLWriter(file_path, options['dsn'], options['schema'], **kwargs)
+        run_kwargs = {'prepare_tables': True}
+    elif writer == 'postgresql_copy':
+        w = module.PostgreSQLCopyWriter(file_path, options['dsn'], options['schema'], **kwargs)
+        run_kwargs = {'prepare_tables': True}
+    else:
+        raise ValueError(f'Unknown writer: {writer}.')
+
+    # not every writer returns number of records, so they are counted while being read from the parser
+    records = 0
+    iterator = w.Parser.iterator
+
+    def counting_iterator(*args, **kwargs):
+        nonlocal records
+        for record in iterator(*args, **kwargs):
+            records += 1
+            yield record
+
+    w.Parser.iterator = counting_iterator
+    # writers print their progress (and stdout writer its records)
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        sts = time.perf_counter()
+        w.run(**run_kwargs)
+        elapsed = time.perf_counter() - sts
+    finally:
+        sys.stdout.close()
+        sys.stdout = sys.__stdout__
+    # ru_maxrss is in kilobytes on Linux
+    return records, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--parser', help='Parser to benchmark.', choices=('prg', 'bdot10k'), nargs=1, required=True)
+    parser.add_argument('--input', help='Input file (xml/gml or zip).', nargs=1, required=True)
+    parser.add_argument('--writers', help='Writers to benchmark.', choices=WRITERS, nargs='+',
+                        default=['csv', 'sqlite', 'stdout'])
+    parser.add_argument('--geometry_format', help='Format of geometries.', choices=('gml', 'wkb'), nargs=1,
+                        default=['gml'])
+    parser.add_argument('--dsn', help='Connection string for PostgreSQL DB (postgresql writers).', nargs=1)
+    parser.add_argument('--schema', help='Schema for tables of postgresql writers.', nargs=1, default=['benchmark'])
+    args = vars(parser.parse_args())
+
+    if any(w.startswith('postgresql') for w in args['writers']) and not args['dsn']:
+        parser.error('--dsn is required for postgresql writers.')
+
+    file_path = args['input'][0]
+    size_mb = xml_size(file_path) / 1024 / 1024
+    print(f'{file_path}: {size_mb:.1f} MB of xml, geometry format: {args["geometry_format"][0]}')
+    # every writer gets a fresh process, spawned (not forked) so it doesn't share memory pages with this one
+    ctx = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as directory:
+        options = {
+            'directory': directory,
+            'dsn': args['dsn'][0] if args['dsn'] else None,
+            'schema': args['schema'][0],
+            'geometry_format': args['geometry_format'][0],
+        }
+        for writer in args['writers']:
+            with ctx.Pool(1) as pool:
+                records, elapsed, peak_rss = pool.apply(run_writer, (args['parser'][0], writer, file_path, options))
+            print(f'{writer:>16}: {records} records in {elapsed:.2f}s, {records / elapsed:.0f} records/s,',
+                  f'{size_mb / elapsed:.1f} MB/s, peak RSS: {peak_rss / 1024 / 1024:.0f} MB')
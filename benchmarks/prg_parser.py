@@ -0,0 +1,83 @@
+"""Micro-benchmark of parsing of PRG records: records/s of the parser with precompiled tag dispatch tables
+compared to the previous recursive parser (kept here as LegacyXML). Nothing is written, records are only parsed.
+Both parsers have to return the same values for every record, otherwise the benchmark fails.
+
+Usage:
+python prg_parser.py --input /path/to/02_Punkty_Adresowe.zip --limit 200000
+"""
+import argparse
+import sys
+import time
+from itertools import islice
+from os.path import join, dirname, abspath
+from typing import Dict, Tuple, Union
+
+from lxml import etree
+
+sys.path.append(join(dirname(dirname(abspath(__file__))), 'processing', 'parsers'))
+from prg import Parser, XML, fix_typo, incremented_name
+
+
+class LegacyXML(XML):
+    """Parser of records before dispatch tables were introduced."""
+
+    def parse_element(self, el: etree.Element) -> Tuple[str, Dict[str, str]]:
+        return self._parse_element_helper(el, (el.tag, {'gmlid': el.get('{' + self.NS.NS_GML + '}id')}))
+
+    def _parse_element_helper(
+            self,
+            el: etree.Element,
+            carryover_values: Tuple[str, Dict[str, Union[str, None]]]
+    ) -> Tuple[str, Dict[str, str]]:
+        typ, result = carryover_values
+        for x in el:
+            if x.prefix:
+                x.tag = etree.QName(x).localname
+            name = fix_typo(x.tag)
+            if len(list(x)) == 0 and name in self.Fields.tag[typ]:
+                if name in result:
+                    last_name = sorted([x for x in result.keys() if str(x).startswith(name)], reverse=True)[0]
+                    name = incremented_name(last_name)
+                if x.text and x.text.startswith('http://geoportal.gov.pl'):
+                    val = str(x.text)[35:]
+                elif x.text is None and x.get(self.NS.XLINK) and x.get(self.NS.XLINK).startswith('http://geoportal.gov.pl'):
+                    val = str(x.get(self.NS.XLINK))[35:]
+                else:
+                    val = x.text
+                result[name] = x.get(self.NS.XLINK) if val is None and x.get(self.NS.XLINK) else val
+            elif x.tag in self.geometry_names:
+                if len(x.getchildren()) > 0:
+                    gml = etree.Element('geometry', nsmap={'gml': self.NS.NS_GML})
+                    gml.insert(0, x.getchildren()[0])
+                    result['geometry'] = etree.tostring(gml, pretty_print=False).decode()
+                else:
+                    result['geometry'] = None
+            else:
+                self._parse_element_helper(x, (typ, result))
+        return typ, result
+
+
+def parse(file_path: str, limit: int, only_basic_fields: bool, legacy: bool) -> Tuple[list, float]:
+    """Returns parsed records and time it took."""
+    parser = Parser(file_path, only_basic_fields)
+    if legacy:
+        parser.XML = LegacyXML(parser.NS, parser.Tags, parser.Fields)
+    sts = time.perf_counter()
+    records = list(islice(parser.iterator(), limit))
+    return records, time.perf_counter() - sts
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--input', help='PRG file (xml/gml or zip).', nargs=1, required=True)
+    parser.add_argument('--limit', help='Number of records to parse.', nargs=1, type=int, default=[100000])
+    parser.add_argument('--basic_fields', help='Only parse basic fields.', action='store_true')
+    args = vars(parser.parse_args())
+
+    results = {}
+    for label, legacy in (('legacy', True), ('dispatch', False)):
+        records, elapsed = parse(args['input'][0], args['limit'][0], args['basic_fields'], legacy)
+        results[label] = records
+        print(f'{label:>10}: {len(records)} records in {elapsed:.2f}s, {len(records) / elapsed:.0f} records/s')
+    if results['legacy'] != results['dispatch']:
+        sys.exit('Parsers returned different values.')
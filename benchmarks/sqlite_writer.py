@@ -0,0 +1,94 @@
+"""Benchmark of loads of the SQLite writer of the PRG and BDOT10k parsers: records/s and size of the database file.
+
+Records are parsed once and replayed from memory, so only the cost of writing is measured. Loads compared:
+- execute: one insert per record, commit every 50000 records (SQLiteWriter.run), indexes created afterwards,
+- bulk: batched inserts in a single transaction with bulk pragmas, indexes created after the load
+  (SQLiteWriter.run_bulk), text columns,
+- bulk_typed: the same with typed columns.
+Indexes include R*Trees of geometries with geometry format wkb.
+
+Usage:
+python sqlite_writer.py --parser bdot10k --input /tmp/bdot/BDOT10k_0201.zip --geometry_format wkb
+python sqlite_writer.py --parser prg --input /tmp/prg/02_Punkty_Adresowe.zip --pragmas synchronous=NORMAL mmap_size=0
+"""
+import argparse
+import importlib
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from itertools import islice
+from os.path import join, dirname, abspath, getsize
+from typing import Dict, Tuple
+
+sys.path.append(join(dirname(dirname(abspath(__file__))), 'processing', 'parsers'))
+
+LOADS = ('execute', 'bulk', 'bulk_typed')
+
+
+def run_load(module, load: str, file_path: str, db_file_path: str, records: list, options: dict) -> float:
+    """Writes records to a new database with given load. Returns time it took."""
+    w = module.SQLiteWriter(file_path, db_file_path, geometry_format=options['geometry_format'],
+                            typed_columns=load == 'bulk_typed')
+    w.Parser.iterator = lambda *args, **kwargs: iter(records)
+    # writers print their progress
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        sts = time.perf_counter()
+        if load == 'execute':
+            w.run(prepare_tables=True)
+            db = sqlite3.connect(db_file_path)
+            w.create_indexes(db)
+            db.commit()
+            # move pages from write-ahead log of the writer to the database file
+            db.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            db.close()
+        else:
+            w.run_bulk(prepare_tables=True, batch_size=options['batch_size'], pragmas=options['pragmas'])
+        elapsed = time.perf_counter() - sts
+    finally:
+        sys.stdout.close()
+        sys.stdout = sys.__stdout__
+    return elapsed
+
+
+def parse_pragma(v: str) -> Tuple[str, str]:
+    name, _, value = v.partition('=')
+    return name, value
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--parser', help='Parser to benchmark.', choices=('prg', 'bdot10k'), nargs=1, required=True)
+    parser.add_argument('--input', help='Input file (xml/gml or zip).', nargs=1, required=True)
+    parser.add_argument('--loads', help='Loads to benchmark.', choices=LOADS, nargs='+', default=list(LOADS))
+    parser.add_argument('--geometry_format', help='Format of geometries.', choices=('gml', 'wkb'), nargs=1,
+                        default=['wkb'])
+    parser.add_argument('--limit', help='Number of records to load.', nargs=1, type=int)
+    parser.add_argument('--batch_size', help='Number of records inserted at once by bulk loads.', nargs=1, type=int,
+                        default=[10000])
+    parser.add_argument('--pragmas', help='Pragmas of bulk loads overriding the defaults, e.g. synchronous=NORMAL.',
+                        nargs='+', type=parse_pragma, default=[])
+    args = vars(parser.parse_args())
+
+    module = importlib.import_module(args['parser'][0])
+    file_path = args['input'][0]
+    geometry_format = args['geometry_format'][0]
+    sts = time.perf_counter()
+    records = list(islice(module.Parser(file_path, geometry_format=geometry_format).iterator(),
+                          args['limit'][0] if args['limit'] else None))
+    print(f'{file_path}: {len(records)} records parsed in {time.perf_counter() - sts:.2f}s,',
+          f'geometry format: {geometry_format}')
+
+    options: Dict = {
+        'geometry_format': geometry_format,
+        'batch_size': args['batch_size'][0],
+        'pragmas': dict(args['pragmas']),
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        for load in args['loads']:
+            db_file_path = join(directory, load + '.sqlite')
+            elapsed = run_load(module, load, file_path, db_file_path, records, options)
+            print(f'{load:>10}: {len(records)} records in {elapsed:.2f}s, {len(records) / elapsed:.0f} records/s,',
+                  f'file size: {getsize(db_file_path) / 1024 / 1024:.1f} MB')
@@ -0,0 +1,63 @@
+"""Benchmark of tile bounds calculation: previous pyproj based `to_merc` vs closed form `common.tile_math`.
+
+Usage:
+python tile_math.py --zoom 13 --tiles 10000
+"""
+import argparse
+import random
+import sys
+import time
+from os.path import join, dirname, abspath
+
+import mercantile as m
+import numpy as np
+from pyproj import Proj, transform
+
+sys.path.append(join(dirname(dirname(abspath(__file__))), 'app'))
+from common.tile_math import tile_bounds, tiles_bounds
+
+
+def to_merc(bbox: m.LngLatBbox) -> dict:
+    """Previous implementation (common.util.to_merc) kept here for comparison."""
+    in_proj = Proj('epsg:4326')
+    out_proj = Proj('epsg:3857')
+    res = dict()
+    res["west"], res["south"] = transform(in_proj, out_proj, bbox.south, bbox.west)
+    res["east"], res["north"] = transform(in_proj, out_proj, bbox.north, bbox.east)
+    return res
+
+
+def timed(label: str, n: int, fn) -> float:
+    sts = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - sts
+    print(f'{label:>24}: {elapsed:.4f}s total, {elapsed / n * 1e6:.2f}us per tile')
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--zoom', help='Zoom of the tiles.', nargs=1, type=int, default=[13])
+    parser.add_argument('--tiles', help='Number of random tiles (within Poland).', nargs=1, type=int, default=[10000])
+    args = vars(parser.parse_args())
+    zoom, n = args['zoom'][0], args['tiles'][0]
+
+    candidates = list(m.tiles(14.0, 49.0, 24.03, 54.86, zoom))
+    tiles = [random.choice(candidates) for _ in range(n)]
+    zs = np.array([t.z for t in tiles])
+    xs = np.array([t.x for t in tiles])
+    ys = np.array([t.y for t in tiles])
+
+    old = timed('pyproj to_merc', n, lambda: [to_merc(m.bounds(t)) for t in tiles])
+    new = timed('tile_math.tile_bounds', n, lambda: [tile_bounds(t.z, t.x, t.y) for t in tiles])
+    batch = timed('tile_math.tiles_bounds', n, lambda: tiles_bounds(zs, xs, ys))
+
+    max_diff = max(
+        max(abs(o[k] - b[k]) for k in ('west', 'south', 'east', 'north'))
+        for o, b in zip(old, new)
+    )
+    max_batch_diff = max(
+        max(abs(b['west'] - r[0]), abs(b['south'] - r[1]), abs(b['east'] - r[2]), abs(b['north'] - r[3]))
+        for b, r in zip(new, batch)
+    )
+    print(f'max difference to pyproj: {max_diff:.9f}m, batch vs scalar: {max_batch_diff:.9f}m')
@@ -0,0 +1,92 @@
+"""Benchmark of vector tile render queries: p50/p99 of render time of tiles sampled from the bbox.
+
+Only the render queries are run (nothing is stored), every query runs once per tile before timing to warm the cache.
+To compare with another version of the queries (e.g. before web mercator geometry columns were introduced)
+export its query files and pass the directory as baseline:
+
+git archive <commit> app/common/queries | tar -x -C /tmp/baseline
+
+Usage:
+python tile_query_latency.py --dsn "host=localhost port=5432 dbname=gugik2osm user=user password=password" --baseline /tmp/baseline/app/common/queries
+"""
+import argparse
+import random
+import sys
+import time
+from os.path import join, dirname, abspath
+from typing import Dict, List
+
+import mercantile as m
+import psycopg2
+
+sys.path.append(join(dirname(dirname(abspath(__file__))), 'app'))
+from common.database import QUERIES
+from common.tile_math import tile_envelope
+
+# zoom -> render queries (only single tile queries, low zoom aggregates are not affected by the geometry columns)
+ZOOM_QUERIES = {
+    12: ('mvt_ll',),
+    13: ('mvt_hl_prg', 'mvt_hl_buildings'),
+    14: ('mvt_hl_prg', 'mvt_hl_buildings'),
+    15: ('mvt_hl_prg', 'mvt_hl_buildings'),
+    16: ('mvt_hl_prg', 'mvt_hl_buildings'),
+}
+
+
+def percentile(values: List[float], p: float) -> float:
+    """Nearest rank percentile."""
+    values = sorted(values)
+    return values[max(0, min(len(values) - 1, int(round(p / 100 * len(values))) - 1))]
+
+
+def load_queries(path: str) -> Dict[str, str]:
+    names = {q for queries in ZOOM_QUERIES.values() for q in queries}
+    return {name: str(open(join(path, name + '.sql'), 'r').read()) for name in names}
+
+
+def render_times(cur, queries: Dict[str, str], tiles: list) -> Dict[int, List[float]]:
+    """Returns zoom -> list of render times (all layers of the tile) in seconds."""
+    for t in tiles:
+        for name in ZOOM_QUERIES[t.z]:
+            cur.execute(queries[name], tile_envelope(t.z, t.x, t.y))
+            cur.fetchall()
+    times = {}
+    for t in tiles:
+        sts = time.perf_counter()
+        for name in ZOOM_QUERIES[t.z]:
+            cur.execute(queries[name], tile_envelope(t.z, t.x, t.y))
+            cur.fetchall()
+        times.setdefault(t.z, []).append(time.perf_counter() - sts)
+    return times
+
+
+def report(label: str, times: Dict[int, List[float]]) -> None:
+    for z in sorted(times):
+        print(f'{label:>10} z{z}: {len(times[z])} tiles,',
+              f'p50: {percentile(times[z], 50) * 1000:.1f} ms, p99: {percentile(times[z], 99) * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dsn', help='Connection string for PostgreSQL DB.', nargs=1, required=True)
+    parser.add_argument('--bbox', help='Area to sample tiles from (WGS84): west south east north.', nargs=4,
+                        type=float, default=[20.85, 52.10, 21.15, 52.35])
+    parser.add_argument('--zoom', help='Zooms of the tiles.', nargs='+', type=int, default=[12, 14, 16])
+    parser.add_argument('--tiles', help='Number of tiles sampled per zoom.', nargs=1, type=int, default=[200])
+    parser.add_argument('--baseline', help='Directory with query files to compare with.', nargs=1)
+    args = vars(parser.parse_args())
+
+    random.seed(0)
+    tiles = []
+    for z in args['zoom']:
+        if z not in ZOOM_QUERIES:
+            parser.error(f'Zoom {z} is not supported, use one of: {", ".join(str(k) for k in ZOOM_QUERIES)}.')
+        candidates = list(m.tiles(*args['bbox'], [z]))
+        tiles += random.sample(candidates, min(args['tiles'][0], len(candidates)))
+
+    with psycopg2.connect(args['dsn'][0]) as conn:
+        with conn.cursor() as cur:
+            if args.get('baseline'):
+                report('baseline', render_times(cur, load_queries(args['baseline'][0]), tiles))
+            report('current', render_times(cur, QUERIES, tiles))
+        conn.rollback()
@@ -0,0 +1,79 @@
+"""Load test showing how many duplicate renders of the same vector tile are avoided by request coalescing.
+
+The tile is removed from `tiles` and `tile_layers` (like partial update does after data changes) and then requested
+at the same time by a number of processes (workers) each sending a number of concurrent requests (greenlets).
+Without coalescing every request would render the tile, with it exactly one render should happen.
+
+Usage:
+python tile_render_coalescing.py --dsn "host=localhost port=5432 dbname=gugik2osm user=user password=password" --tile 14/9153/5400
+"""
+import argparse
+import multiprocessing
+import sys
+import time
+from os import environ
+from os.path import join, dirname, abspath
+
+sys.path.append(join(dirname(dirname(abspath(__file__))), 'app'))
+
+
+def worker(dsn: str, tile: str, requests_per_worker: int, barrier) -> dict:
+    from gevent import monkey
+    monkey.patch_all()
+    import gevent
+
+    environ['dsn'] = dsn
+    environ['db_pool_max_size'] = str(requests_per_worker)
+    environ['tile_cache_max_bytes'] = '0'  # every request has to reach the database
+    from common import database
+    database.make_psycopg_green()
+    from app import app
+    from resources.internal import MapboxVectorTile
+
+    client = app.test_client()
+
+    def get() -> int:
+        return client.get(f'/tiles/{tile}.pbf').status_code
+
+    barrier.wait()
+    greenlets = [gevent.spawn(get) for _ in range(requests_per_worker)]
+    gevent.joinall(greenlets, raise_error=True)
+    stats = MapboxVectorTile.stats()
+    stats['errors'] = sum(1 for g in greenlets if g.value != 200)
+    return stats
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dsn', help='Connection string for PostgreSQL DB.', nargs=1, required=True)
+    parser.add_argument('--tile', help='Tile (z/x/y) to render.', nargs=1, default=['14/9153/5400'])
+    parser.add_argument('--workers', help='Number of worker processes.', nargs=1, type=int, default=[4])
+    parser.add_argument('--requests', help='Number of concurrent requests per worker.', nargs=1, type=int,
+                        default=[25])
+    args = vars(parser.parse_args())
+    dsn, tile, workers, requests = args['dsn'][0], args['tile'][0], args['workers'][0], args['requests'][0]
+
+    import psycopg2
+    z, x, y = [int(v) for v in tile.split('/')]
+    with psycopg2.connect(dsn) as conn:
+        with conn.cursor() as cur:
+            cur.execute('delete from tiles where z = %s and x = %s and y = %s', (z, x, y))
+            cur.execute('delete from tile_layers where z = %s and x = %s and y = %s', (z, x, y))
+        conn.commit()
+
+    ctx = multiprocessing.get_context('spawn')
+    barrier = ctx.Manager().Barrier(workers)
+    sts = time.perf_counter()
+    with ctx.Pool(workers) as pool:
+        results = pool.starmap(worker, [(dsn, tile, requests, barrier) for _ in range(workers)])
+    elapsed = time.perf_counter() - sts
+
+    total = workers * requests
+    # a metatile render stores up to 16 tiles with one query, so renders are counted by queries
+    renders = sum(r['metatile_renders'] + r['tile_renders'] for r in results)
+    print(f'requests: {total} ({workers} workers x {requests}), errors: {sum(r["errors"] for r in results)}')
+    print(f'renders: {renders} (without coalescing: {total})')
+    print(f'duplicate renders avoided: {total - renders}',
+          f'- coalesced in worker: {sum(r["coalesced_in_worker"] for r in results)}',
+          f'- rendered by another worker: {sum(r["rendered_elsewhere"] for r in results)}')
+    print(f'time: {elapsed:.3f}s')
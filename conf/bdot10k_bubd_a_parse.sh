@@ -3,16 +3,12 @@
 source /opt/gugik2osm/conf/.env
 
 date >> /opt/gugik2osm/log/bdot_processing.log
-echo "BDOT2CSV" >> /opt/gugik2osm/log/bdot_processing.log
-python3.7 -u /opt/gugik2osm/git/processing/parsers/bdot10k.py --input /opt/gugik2osm/tempbdot/BDOT10k_*.zip --writer csv --csv_directory /opt/gugik2osm/tempbdot2/ --basic_fields >> /opt/gugik2osm/log/bdot_processing.log 2>&1
-date >> /opt/gugik2osm/log/bdot_processing.log
-echo "CSV2PGSQL" >> /opt/gugik2osm/log/bdot_processing.log
+echo "BDOT2PGSQL" >> /opt/gugik2osm/log/bdot_processing.log
 psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "truncate table bdot.stg_budynki_ogolne_poligony" >> /opt/gugik2osm/log/bdot_processing.log 2>&1
-for infile in /opt/gugik2osm/tempbdot2/*.csv
-do
-  cat $infile | psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "copy bdot.stg_budynki_ogolne_poligony FROM stdin with CSV header delimiter ','" >> /opt/gugik2osm/log/bdot_processing.log 2>&1
-done
-date >> /opt/gugik2osm/log/bdot_processing.log
-echo "Cleaning temp csv files..." >> /opt/gugik2osm/log/bdot_processing.log
-rm /opt/gugik2osm/tempbdot2/*.csv
+# geometries are loaded as EWKB so staging table needs geometry column (no-op on empty table of earlier installs),
+# the view using the column is recreated by the ddl script
+psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "drop view if exists bdot.v_bubd_a; alter table bdot.stg_budynki_ogolne_poligony alter column geometry type geometry using geometry::geometry" >> /opt/gugik2osm/log/bdot_processing.log 2>&1
+psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -f /opt/gugik2osm/git/processing/sql/ddl/bdot_stg_buildings.sql >> /opt/gugik2osm/log/bdot_processing.log 2>&1
+# parsed records are streamed straight into the staging table with COPY (no intermediate csv files)
+python3.7 -u /opt/gugik2osm/git/processing/parsers/bdot10k.py --input /opt/gugik2osm/tempbdot/BDOT10k_*.zip --writer postgresql_copy --geometry_format wkb --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" --basic_fields >> /opt/gugik2osm/log/bdot_processing.log 2>&1
 date >> /opt/gugik2osm/log/bdot_processing.log
@@ -1,16878 +0,0 @@
-curl -s localhost/tiles/6/34/20.pbf > /dev/null 
-curl -s localhost/tiles/6/34/21.pbf > /dev/null 
-curl -s localhost/tiles/6/35/20.pbf > /dev/null 
-curl -s localhost/tiles/6/35/21.pbf > /dev/null 
-curl -s localhost/tiles/6/36/20.pbf > /dev/null 
-curl -s localhost/tiles/6/36/21.pbf > /dev/null 
-curl -s localhost/tiles/7/68/40.pbf > /dev/null 
-curl -s localhost/tiles/7/68/41.pbf > /dev/null 
-curl -s localhost/tiles/7/68/42.pbf > /dev/null 
-curl -s localhost/tiles/7/68/43.pbf > /dev/null 
-curl -s localhost/tiles/7/69/40.pbf > /dev/null 
-curl -s localhost/tiles/7/69/41.pbf > /dev/null 
-curl -s localhost/tiles/7/69/42.pbf > /dev/null 
-curl -s localhost/tiles/7/69/43.pbf > /dev/null 
-curl -s localhost/tiles/7/70/40.pbf > /dev/null 
-curl -s localhost/tiles/7/70/41.pbf > /dev/null 
-curl -s localhost/tiles/7/70/42.pbf > /dev/null 
-curl -s localhost/tiles/7/70/43.pbf > /dev/null 
-curl -s localhost/tiles/7/71/40.pbf > /dev/null 
-curl -s localhost/tiles/7/71/41.pbf > /dev/null 
-curl -s localhost/tiles/7/71/42.pbf > /dev/null 
-curl -s localhost/tiles/7/71/43.pbf > /dev/null 
-curl -s localhost/tiles/7/72/40.pbf > /dev/null 
-curl -s localhost/tiles/7/72/41.pbf > /dev/null 
-curl -s localhost/tiles/7/72/42.pbf > /dev/null 
-curl -s localhost/tiles/7/72/43.pbf > /dev/null 
-curl -s localhost/tiles/8/137/81.pbf > /dev/null 
-curl -s localhost/tiles/8/137/82.pbf > /dev/null 
-curl -s localhost/tiles/8/137/83.pbf > /dev/null 
-curl -s localhost/tiles/8/137/84.pbf > /dev/null 
-curl -s localhost/tiles/8/137/85.pbf > /dev/null 
-curl -s localhost/tiles/8/137/86.pbf > /dev/null 
-curl -s localhost/tiles/8/137/87.pbf > /dev/null 
-curl -s localhost/tiles/8/138/81.pbf > /dev/null 
-curl -s localhost/tiles/8/138/82.pbf > /dev/null 
-curl -s localhost/tiles/8/138/83.pbf > /dev/null 
-curl -s localhost/tiles/8/138/84.pbf > /dev/null 
-curl -s localhost/tiles/8/138/85.pbf > /dev/null 
-curl -s localhost/tiles/8/138/86.pbf > /dev/null 
-curl -s localhost/tiles/8/138/87.pbf > /dev/null 
-curl -s localhost/tiles/8/139/81.pbf > /dev/null 
-curl -s localhost/tiles/8/139/82.pbf > /dev/null 
-curl -s localhost/tiles/8/139/83.pbf > /dev/null 
-curl -s localhost/tiles/8/139/84.pbf > /dev/null 
-curl -s localhost/tiles/8/139/85.pbf > /dev/null 
-curl -s localhost/tiles/8/139/86.pbf > /dev/null 
-curl -s localhost/tiles/8/139/87.pbf > /dev/null 
-curl -s localhost/tiles/8/140/81.pbf > /dev/null 
-curl -s localhost/tiles/8/140/82.pbf > /dev/null 
-curl -s localhost/tiles/8/140/83.pbf > /dev/null 
-curl -s localhost/tiles/8/140/84.pbf > /dev/null 
-curl -s localhost/tiles/8/140/85.pbf > /dev/null 
-curl -s localhost/tiles/8/140/86.pbf > /dev/null 
-curl -s localhost/tiles/8/140/87.pbf > /dev/null 
-curl -s localhost/tiles/8/141/81.pbf > /dev/null 
-curl -s localhost/tiles/8/141/82.pbf > /dev/null 
-curl -s localhost/tiles/8/141/83.pbf > /dev/null 
-curl -s localhost/tiles/8/141/84.pbf > /dev/null 
-curl -s localhost/tiles/8/141/85.pbf > /dev/null 
-curl -s localhost/tiles/8/141/86.pbf > /dev/null 
-curl -s localhost/tiles/8/141/87.pbf > /dev/null 
-curl -s localhost/tiles/8/142/81.pbf > /dev/null 
-curl -s localhost/tiles/8/142/82.pbf > /dev/null 
-curl -s localhost/tiles/8/142/83.pbf > /dev/null 
-curl -s localhost/tiles/8/142/84.pbf > /dev/null 
-curl -s localhost/tiles/8/142/85.pbf > /dev/null 
-curl -s localhost/tiles/8/142/86.pbf > /dev/null 
-curl -s localhost/tiles/8/142/87.pbf > /dev/null 
-curl -s localhost/tiles/8/143/81.pbf > /dev/null 
-curl -s localhost/tiles/8/143/82.pbf > /dev/null 
-curl -s localhost/tiles/8/143/83.pbf > /dev/null 
-curl -s localhost/tiles/8/143/84.pbf > /dev/null 
-curl -s localhost/tiles/8/143/85.pbf > /dev/null 
-curl -s localhost/tiles/8/143/86.pbf > /dev/null 
-curl -s localhost/tiles/8/143/87.pbf > /dev/null 
-curl -s localhost/tiles/8/144/81.pbf > /dev/null 
-curl -s localhost/tiles/8/144/82.pbf > /dev/null 
-curl -s localhost/tiles/8/144/83.pbf > /dev/null 
-curl -s localhost/tiles/8/144/84.pbf > /dev/null 
-curl -s localhost/tiles/8/144/85.pbf > /dev/null 
-curl -s localhost/tiles/8/144/86.pbf > /dev/null 
-curl -s localhost/tiles/8/144/87.pbf > /dev/null 
-curl -s localhost/tiles/8/145/81.pbf > /dev/null 
-curl -s localhost/tiles/8/145/82.pbf > /dev/null 
-curl -s localhost/tiles/8/145/83.pbf > /dev/null 
-curl -s localhost/tiles/8/145/84.pbf > /dev/null 
-curl -s localhost/tiles/8/145/85.pbf > /dev/null 
-curl -s localhost/tiles/8/145/86.pbf > /dev/null 
-curl -s localhost/tiles/8/145/87.pbf > /dev/null 
-curl -s localhost/tiles/9/275/162.pbf > /dev/null 
-curl -s localhost/tiles/9/275/163.pbf > /dev/null 
-curl -s localhost/tiles/9/275/164.pbf > /dev/null 
-curl -s localhost/tiles/9/275/165.pbf > /dev/null 
-curl -s localhost/tiles/9/275/166.pbf > /dev/null 
-curl -s localhost/tiles/9/275/167.pbf > /dev/null 
-curl -s localhost/tiles/9/275/168.pbf > /dev/null 
-curl -s localhost/tiles/9/275/169.pbf > /dev/null 
-curl -s localhost/tiles/9/275/170.pbf > /dev/null 
-curl -s localhost/tiles/9/275/171.pbf > /dev/null 
-curl -s localhost/tiles/9/275/172.pbf > /dev/null 
-curl -s localhost/tiles/9/275/173.pbf > /dev/null 
-curl -s localhost/tiles/9/275/174.pbf > /dev/null 
-curl -s localhost/tiles/9/275/175.pbf > /dev/null 
-curl -s localhost/tiles/9/276/162.pbf > /dev/null 
-curl -s localhost/tiles/9/276/163.pbf > /dev/null 
-curl -s localhost/tiles/9/276/164.pbf > /dev/null 
-curl -s localhost/tiles/9/276/165.pbf > /dev/null 
-curl -s localhost/tiles/9/276/166.pbf > /dev/null 
-curl -s localhost/tiles/9/276/167.pbf > /dev/null 
-curl -s localhost/tiles/9/276/168.pbf > /dev/null 
-curl -s localhost/tiles/9/276/169.pbf > /dev/null 
-curl -s localhost/tiles/9/276/170.pbf > /dev/null 
-curl -s localhost/tiles/9/276/171.pbf > /dev/null 
-curl -s localhost/tiles/9/276/172.pbf > /dev/null 
-curl -s localhost/tiles/9/276/173.pbf > /dev/null 
-curl -s localhost/tiles/9/276/174.pbf > /dev/null 
-curl -s localhost/tiles/9/276/175.pbf > /dev/null 
-curl -s localhost/tiles/9/277/162.pbf > /dev/null 
-curl -s localhost/tiles/9/277/163.pbf > /dev/null 
-curl -s localhost/tiles/9/277/164.pbf > /dev/null 
-curl -s localhost/tiles/9/277/165.pbf > /dev/null 
-curl -s localhost/tiles/9/277/166.pbf > /dev/null 
-curl -s localhost/tiles/9/277/167.pbf > /dev/null 
-curl -s localhost/tiles/9/277/168.pbf > /dev/null 
-curl -s localhost/tiles/9/277/169.pbf > /dev/null 
-curl -s localhost/tiles/9/277/170.pbf > /dev/null 
-curl -s localhost/tiles/9/277/171.pbf > /dev/null 
-curl -s localhost/tiles/9/277/172.pbf > /dev/null 
-curl -s localhost/tiles/9/277/173.pbf > /dev/null 
-curl -s localhost/tiles/9/277/174.pbf > /dev/null 
-curl -s localhost/tiles/9/277/175.pbf > /dev/null 
-curl -s localhost/tiles/9/278/162.pbf > /dev/null 
-curl -s localhost/tiles/9/278/163.pbf > /dev/null 
-curl -s localhost/tiles/9/278/164.pbf > /dev/null 
-curl -s localhost/tiles/9/278/165.pbf > /dev/null 
-curl -s localhost/tiles/9/278/166.pbf > /dev/null 
-curl -s localhost/tiles/9/278/167.pbf > /dev/null 
-curl -s localhost/tiles/9/278/168.pbf > /dev/null 
-curl -s localhost/tiles/9/278/169.pbf > /dev/null 
-curl -s localhost/tiles/9/278/170.pbf > /dev/null 
-curl -s localhost/tiles/9/278/171.pbf > /dev/null 
-curl -s localhost/tiles/9/278/172.pbf > /dev/null 
-curl -s localhost/tiles/9/278/173.pbf > /dev/null 
-curl -s localhost/tiles/9/278/174.pbf > /dev/null 
-curl -s localhost/tiles/9/278/175.pbf > /dev/null 
-curl -s localhost/tiles/9/279/162.pbf > /dev/null 
-curl -s localhost/tiles/9/279/163.pbf > /dev/null 
-curl -s localhost/tiles/9/279/164.pbf > /dev/null 
-curl -s localhost/tiles/9/279/165.pbf > /dev/null 
-curl -s localhost/tiles/9/279/166.pbf > /dev/null 
-curl -s localhost/tiles/9/279/167.pbf > /dev/null 
-curl -s localhost/tiles/9/279/168.pbf > /dev/null 
-curl -s localhost/tiles/9/279/169.pbf > /dev/null 
-curl -s localhost/tiles/9/279/170.pbf > /dev/null 
-curl -s localhost/tiles/9/279/171.pbf > /dev/null 
-curl -s localhost/tiles/9/279/172.pbf > /dev/null 
-curl -s localhost/tiles/9/279/173.pbf > /dev/null 
-curl -s localhost/tiles/9/279/174.pbf > /dev/null 
-curl -s localhost/tiles/9/279/175.pbf > /dev/null 
-curl -s localhost/tiles/9/280/162.pbf > /dev/null 
-curl -s localhost/tiles/9/280/163.pbf > /dev/null 
-curl -s localhost/tiles/9/280/164.pbf > /dev/null 
-curl -s localhost/tiles/9/280/165.pbf > /dev/null 
-curl -s localhost/tiles/9/280/166.pbf > /dev/null 
-curl -s localhost/tiles/9/280/167.pbf > /dev/null 
-curl -s localhost/tiles/9/280/168.pbf > /dev/null 
-curl -s localhost/tiles/9/280/169.pbf > /dev/null 
-curl -s localhost/tiles/9/280/170.pbf > /dev/null 
-curl -s localhost/tiles/9/280/171.pbf > /dev/null 
-curl -s localhost/tiles/9/280/172.pbf > /dev/null 
-curl -s localhost/tiles/9/280/173.pbf > /dev/null 
-curl -s localhost/tiles/9/280/174.pbf > /dev/null 
-curl -s localhost/tiles/9/280/175.pbf > /dev/null 
-curl -s localhost/tiles/9/281/162.pbf > /dev/null 
-curl -s localhost/tiles/9/281/163.pbf > /dev/null 
-curl -s localhost/tiles/9/281/164.pbf > /dev/null 
-curl -s localhost/tiles/9/281/165.pbf > /dev/null 
-curl -s localhost/tiles/9/281/166.pbf > /dev/null 
-curl -s localhost/tiles/9/281/167.pbf > /dev/null 
-curl -s localhost/tiles/9/281/168.pbf > /dev/null 
-curl -s localhost/tiles/9/281/169.pbf > /dev/null 
-curl -s localhost/tiles/9/281/170.pbf > /dev/null 
-curl -s localhost/tiles/9/281/171.pbf > /dev/null 
-curl -s localhost/tiles/9/281/172.pbf > /dev/null 
-curl -s localhost/tiles/9/281/173.pbf > /dev/null 
-curl -s localhost/tiles/9/281/174.pbf > /dev/null 
-curl -s localhost/tiles/9/281/175.pbf > /dev/null 
-curl -s localhost/tiles/9/282/162.pbf > /dev/null 
-curl -s localhost/tiles/9/282/163.pbf > /dev/null 
-curl -s localhost/tiles/9/282/164.pbf > /dev/null 
-curl -s localhost/tiles/9/282/165.pbf > /dev/null 
-curl -s localhost/tiles/9/282/166.pbf > /dev/null 
-curl -s localhost/tiles/9/282/167.pbf > /dev/null 
-curl -s localhost/tiles/9/282/168.pbf > /dev/null 
-curl -s localhost/tiles/9/282/169.pbf > /dev/null 
-curl -s localhost/tiles/9/282/170.pbf > /dev/null 
-curl -s localhost/tiles/9/282/171.pbf > /dev/null 
-curl -s localhost/tiles/9/282/172.pbf > /dev/null 
-curl -s localhost/tiles/9/282/173.pbf > /dev/null 
-curl -s localhost/tiles/9/282/174.pbf > /dev/null 
-curl -s localhost/tiles/9/282/175.pbf > /dev/null 
-curl -s localhost/tiles/9/283/162.pbf > /dev/null 
-curl -s localhost/tiles/9/283/163.pbf > /dev/null 
-curl -s localhost/tiles/9/283/164.pbf > /dev/null 
-curl -s localhost/tiles/9/283/165.pbf > /dev/null 
-curl -s localhost/tiles/9/283/166.pbf > /dev/null 
-curl -s localhost/tiles/9/283/167.pbf > /dev/null 
-curl -s localhost/tiles/9/283/168.pbf > /dev/null 
-curl -s localhost/tiles/9/283/169.pbf > /dev/null 
-curl -s localhost/tiles/9/283/170.pbf > /dev/null 
-curl -s localhost/tiles/9/283/171.pbf > /dev/null 
-curl -s localhost/tiles/9/283/172.pbf > /dev/null 
-curl -s localhost/tiles/9/283/173.pbf > /dev/null 
-curl -s localhost/tiles/9/283/174.pbf > /dev/null 
-curl -s localhost/tiles/9/283/175.pbf > /dev/null 
-curl -s localhost/tiles/9/284/162.pbf > /dev/null 
-curl -s localhost/tiles/9/284/163.pbf > /dev/null 
-curl -s localhost/tiles/9/284/164.pbf > /dev/null 
-curl -s localhost/tiles/9/284/165.pbf > /dev/null 
-curl -s localhost/tiles/9/284/166.pbf > /dev/null 
-curl -s localhost/tiles/9/284/167.pbf > /dev/null 
-curl -s localhost/tiles/9/284/168.pbf > /dev/null 
-curl -s localhost/tiles/9/284/169.pbf > /dev/null 
-curl -s localhost/tiles/9/284/170.pbf > /dev/null 
-curl -s localhost/tiles/9/284/171.pbf > /dev/null 
-curl -s localhost/tiles/9/284/172.pbf > /dev/null 
-curl -s localhost/tiles/9/284/173.pbf > /dev/null 
-curl -s localhost/tiles/9/284/174.pbf > /dev/null 
-curl -s localhost/tiles/9/284/175.pbf > /dev/null 
-curl -s localhost/tiles/9/285/162.pbf > /dev/null 
-curl -s localhost/tiles/9/285/163.pbf > /dev/null 
-curl -s localhost/tiles/9/285/164.pbf > /dev/null 
-curl -s localhost/tiles/9/285/165.pbf > /dev/null 
-curl -s localhost/tiles/9/285/166.pbf > /dev/null 
-curl -s localhost/tiles/9/285/167.pbf > /dev/null 
-curl -s localhost/tiles/9/285/168.pbf > /dev/null 
-curl -s localhost/tiles/9/285/169.pbf > /dev/null 
-curl -s localhost/tiles/9/285/170.pbf > /dev/null 
-curl -s localhost/tiles/9/285/171.pbf > /dev/null 
-curl -s localhost/tiles/9/285/172.pbf > /dev/null 
-curl -s localhost/tiles/9/285/173.pbf > /dev/null 
-curl -s localhost/tiles/9/285/174.pbf > /dev/null 
-curl -s localhost/tiles/9/285/175.pbf > /dev/null 
-curl -s localhost/tiles/9/286/162.pbf > /dev/null 
-curl -s localhost/tiles/9/286/163.pbf > /dev/null 
-curl -s localhost/tiles/9/286/164.pbf > /dev/null 
-curl -s localhost/tiles/9/286/165.pbf > /dev/null 
-curl -s localhost/tiles/9/286/166.pbf > /dev/null 
-curl -s localhost/tiles/9/286/167.pbf > /dev/null 
-curl -s localhost/tiles/9/286/168.pbf > /dev/null 
-curl -s localhost/tiles/9/286/169.pbf > /dev/null 
-curl -s localhost/tiles/9/286/170.pbf > /dev/null 
-curl -s localhost/tiles/9/286/171.pbf > /dev/null 
-curl -s localhost/tiles/9/286/172.pbf > /dev/null 
-curl -s localhost/tiles/9/286/173.pbf > /dev/null 
-curl -s localhost/tiles/9/286/174.pbf > /dev/null 
-curl -s localhost/tiles/9/286/175.pbf > /dev/null 
-curl -s localhost/tiles/9/287/162.pbf > /dev/null 
-curl -s localhost/tiles/9/287/163.pbf > /dev/null 
-curl -s localhost/tiles/9/287/164.pbf > /dev/null 
-curl -s localhost/tiles/9/287/165.pbf > /dev/null 
-curl -s localhost/tiles/9/287/166.pbf > /dev/null 
-curl -s localhost/tiles/9/287/167.pbf > /dev/null 
-curl -s localhost/tiles/9/287/168.pbf > /dev/null 
-curl -s localhost/tiles/9/287/169.pbf > /dev/null 
-curl -s localhost/tiles/9/287/170.pbf > /dev/null 
-curl -s localhost/tiles/9/287/171.pbf > /dev/null 
-curl -s localhost/tiles/9/287/172.pbf > /dev/null 
-curl -s localhost/tiles/9/287/173.pbf > /dev/null 
-curl -s localhost/tiles/9/287/174.pbf > /dev/null 
-curl -s localhost/tiles/9/287/175.pbf > /dev/null 
-curl -s localhost/tiles/9/288/162.pbf > /dev/null 
-curl -s localhost/tiles/9/288/163.pbf > /dev/null 
-curl -s localhost/tiles/9/288/164.pbf > /dev/null 
-curl -s localhost/tiles/9/288/165.pbf > /dev/null 
-curl -s localhost/tiles/9/288/166.pbf > /dev/null 
-curl -s localhost/tiles/9/288/167.pbf > /dev/null 
-curl -s localhost/tiles/9/288/168.pbf > /dev/null 
-curl -s localhost/tiles/9/288/169.pbf > /dev/null 
-curl -s localhost/tiles/9/288/170.pbf > /dev/null 
-curl -s localhost/tiles/9/288/171.pbf > /dev/null 
-curl -s localhost/tiles/9/288/172.pbf > /dev/null 
-curl -s localhost/tiles/9/288/173.pbf > /dev/null 
-curl -s localhost/tiles/9/288/174.pbf > /dev/null 
-curl -s localhost/tiles/9/288/175.pbf > /dev/null 
-curl -s localhost/tiles/9/289/162.pbf > /dev/null 
-curl -s localhost/tiles/9/289/163.pbf > /dev/null 
-curl -s localhost/tiles/9/289/164.pbf > /dev/null 
-curl -s localhost/tiles/9/289/165.pbf > /dev/null 
-curl -s localhost/tiles/9/289/166.pbf > /dev/null 
-curl -s localhost/tiles/9/289/167.pbf > /dev/null 
-curl -s localhost/tiles/9/289/168.pbf > /dev/null 
-curl -s localhost/tiles/9/289/169.pbf > /dev/null 
-curl -s localhost/tiles/9/289/170.pbf > /dev/null 
-curl -s localhost/tiles/9/289/171.pbf > /dev/null 
-curl -s localhost/tiles/9/289/172.pbf > /dev/null 
-curl -s localhost/tiles/9/289/173.pbf > /dev/null 
-curl -s localhost/tiles/9/289/174.pbf > /dev/null 
-curl -s localhost/tiles/9/289/175.pbf > /dev/null 
-curl -s localhost/tiles/9/290/162.pbf > /dev/null 
-curl -s localhost/tiles/9/290/163.pbf > /dev/null 
-curl -s localhost/tiles/9/290/164.pbf > /dev/null 
-curl -s localhost/tiles/9/290/165.pbf > /dev/null 
-curl -s localhost/tiles/9/290/166.pbf > /dev/null 
-curl -s localhost/tiles/9/290/167.pbf > /dev/null 
-curl -s localhost/tiles/9/290/168.pbf > /dev/null 
-curl -s localhost/tiles/9/290/169.pbf > /dev/null 
-curl -s localhost/tiles/9/290/170.pbf > /dev/null 
-curl -s localhost/tiles/9/290/171.pbf > /dev/null 
-curl -s localhost/tiles/9/290/172.pbf > /dev/null 
-curl -s localhost/tiles/9/290/173.pbf > /dev/null 
-curl -s localhost/tiles/9/290/174.pbf > /dev/null 
-curl -s localhost/tiles/9/290/175.pbf > /dev/null 
-curl -s localhost/tiles/10/551/324.pbf > /dev/null 
-curl -s localhost/tiles/10/551/325.pbf > /dev/null 
-curl -s localhost/tiles/10/551/326.pbf > /dev/null 
-curl -s localhost/tiles/10/551/327.pbf > /dev/null 
-curl -s localhost/tiles/10/551/328.pbf > /dev/null 
-curl -s localhost/tiles/10/551/329.pbf > /dev/null 
-curl -s localhost/tiles/10/551/330.pbf > /dev/null 
-curl -s localhost/tiles/10/551/331.pbf > /dev/null 
-curl -s localhost/tiles/10/551/332.pbf > /dev/null 
-curl -s localhost/tiles/10/551/333.pbf > /dev/null 
-curl -s localhost/tiles/10/551/334.pbf > /dev/null 
-curl -s localhost/tiles/10/551/335.pbf > /dev/null 
-curl -s localhost/tiles/10/551/336.pbf > /dev/null 
-curl -s localhost/tiles/10/551/337.pbf > /dev/null 
-curl -s localhost/tiles/10/551/338.pbf > /dev/null 
-curl -s localhost/tiles/10/551/339.pbf > /dev/null 
-curl -s localhost/tiles/10/551/340.pbf > /dev/null 
-curl -s localhost/tiles/10/551/341.pbf > /dev/null 
-curl -s localhost/tiles/10/551/342.pbf > /dev/null 
-curl -s localhost/tiles/10/551/343.pbf > /dev/null 
-curl -s localhost/tiles/10/551/344.pbf > /dev/null 
-curl -s localhost/tiles/10/551/345.pbf > /dev/null 
-curl -s localhost/tiles/10/551/346.pbf > /dev/null 
-curl -s localhost/tiles/10/551/347.pbf > /dev/null 
-curl -s localhost/tiles/10/551/348.pbf > /dev/null 
-curl -s localhost/tiles/10/551/349.pbf > /dev/null 
-curl -s localhost/tiles/10/551/350.pbf > /dev/null 
-curl -s localhost/tiles/10/551/351.pbf > /dev/null 
-curl -s localhost/tiles/10/552/324.pbf > /dev/null 
-curl -s localhost/tiles/10/552/325.pbf > /dev/null 
-curl -s localhost/tiles/10/552/326.pbf > /dev/null 
-curl -s localhost/tiles/10/552/327.pbf > /dev/null 
-curl -s localhost/tiles/10/552/328.pbf > /dev/null 
-curl -s localhost/tiles/10/552/329.pbf > /dev/null 
-curl -s localhost/tiles/10/552/330.pbf > /dev/null 
-curl -s localhost/tiles/10/552/331.pbf > /dev/null 
-curl -s localhost/tiles/10/552/332.pbf > /dev/null 
-curl -s localhost/tiles/10/552/333.pbf > /dev/null 
-curl -s localhost/tiles/10/552/334.pbf > /dev/null 
-curl -s localhost/tiles/10/552/335.pbf > /dev/null 
-curl -s localhost/tiles/10/552/336.pbf > /dev/null 
-curl -s localhost/tiles/10/552/337.pbf > /dev/null 
-curl -s localhost/tiles/10/552/338.pbf > /dev/null 
-curl -s localhost/tiles/10/552/339.pbf > /dev/null 
-curl -s localhost/tiles/10/552/340.pbf > /dev/null 
-curl -s localhost/tiles/10/552/341.pbf > /dev/null 
-curl -s localhost/tiles/10/552/342.pbf > /dev/null 
-curl -s localhost/tiles/10/552/343.pbf > /dev/null 
-curl -s localhost/tiles/10/552/344.pbf > /dev/null 
-curl -s localhost/tiles/10/552/345.pbf > /dev/null 
-curl -s localhost/tiles/10/552/346.pbf > /dev/null 
-curl -s localhost/tiles/10/552/347.pbf > /dev/null 
-curl -s localhost/tiles/10/552/348.pbf > /dev/null 
-curl -s localhost/tiles/10/552/349.pbf > /dev/null 
-curl -s localhost/tiles/10/552/350.pbf > /dev/null 
-curl -s localhost/tiles/10/552/351.pbf > /dev/null 
-curl -s localhost/tiles/10/553/324.pbf > /dev/null 
-curl -s localhost/tiles/10/553/325.pbf > /dev/null 
-curl -s localhost/tiles/10/553/326.pbf > /dev/null 
-curl -s localhost/tiles/10/553/327.pbf > /dev/null 
-curl -s localhost/tiles/10/553/328.pbf > /dev/null 
-curl -s localhost/tiles/10/553/329.pbf > /dev/null 
-curl -s localhost/tiles/10/553/330.pbf > /dev/null 
-curl -s localhost/tiles/10/553/331.pbf > /dev/null 
-curl -s localhost/tiles/10/553/332.pbf > /dev/null 
-curl -s localhost/tiles/10/553/333.pbf > /dev/null 
-curl -s localhost/tiles/10/553/334.pbf > /dev/null 
-curl -s localhost/tiles/10/553/335.pbf > /dev/null 
-curl -s localhost/tiles/10/553/336.pbf > /dev/null 
-curl -s localhost/tiles/10/553/337.pbf > /dev/null 
-curl -s localhost/tiles/10/553/338.pbf > /dev/null 
-curl -s localhost/tiles/10/553/339.pbf > /dev/null 
-curl -s localhost/tiles/10/553/340.pbf > /dev/null 
-curl -s localhost/tiles/10/553/341.pbf > /dev/null 
-curl -s localhost/tiles/10/553/342.pbf > /dev/null 
-curl -s localhost/tiles/10/553/343.pbf > /dev/null 
-curl -s localhost/tiles/10/553/344.pbf > /dev/null 
-curl -s localhost/tiles/10/553/345.pbf > /dev/null 
-curl -s localhost/tiles/10/553/346.pbf > /dev/null 
-curl -s localhost/tiles/10/553/347.pbf > /dev/null 
-curl -s localhost/tiles/10/553/348.pbf > /dev/null 
-curl -s localhost/tiles/10/553/349.pbf > /dev/null 
-curl -s localhost/tiles/10/553/350.pbf > /dev/null 
-curl -s localhost/tiles/10/553/351.pbf > /dev/null 
-curl -s localhost/tiles/10/554/324.pbf > /dev/null 
-curl -s localhost/tiles/10/554/325.pbf > /dev/null 
-curl -s localhost/tiles/10/554/326.pbf > /dev/null 
-curl -s localhost/tiles/10/554/327.pbf > /dev/null 
-curl -s localhost/tiles/10/554/328.pbf > /dev/null 
-curl -s localhost/tiles/10/554/329.pbf > /dev/null 
-curl -s localhost/tiles/10/554/330.pbf > /dev/null 
-curl -s localhost/tiles/10/554/331.pbf > /dev/null 
-curl -s localhost/tiles/10/554/332.pbf > /dev/null 
-curl -s localhost/tiles/10/554/333.pbf > /dev/null 
-curl -s localhost/tiles/10/554/334.pbf > /dev/null 
-curl -s localhost/tiles/10/554/335.pbf > /dev/null 
-curl -s localhost/tiles/10/554/336.pbf > /dev/null 
-curl -s localhost/tiles/10/554/337.pbf > /dev/null 
-curl -s localhost/tiles/10/554/338.pbf > /dev/null 
-curl -s localhost/tiles/10/554/339.pbf > /dev/null 
-curl -s localhost/tiles/10/554/340.pbf > /dev/null 
-curl -s localhost/tiles/10/554/341.pbf > /dev/null 
-curl -s localhost/tiles/10/554/342.pbf > /dev/null 
-curl -s localhost/tiles/10/554/343.pbf > /dev/null 
-curl -s localhost/tiles/10/554/344.pbf > /dev/null 
-curl -s localhost/tiles/10/554/345.pbf > /dev/null 
-curl -s localhost/tiles/10/554/346.pbf > /dev/null 
-curl -s localhost/tiles/10/554/347.pbf > /dev/null 
-curl -s localhost/tiles/10/554/348.pbf > /dev/null 
-curl -s localhost/tiles/10/554/349.pbf > /dev/null 
-curl -s localhost/tiles/10/554/350.pbf > /dev/null 
-curl -s localhost/tiles/10/554/351.pbf > /dev/null 
-curl -s localhost/tiles/10/555/324.pbf > /dev/null 
-curl -s localhost/tiles/10/555/325.pbf > /dev/null 
-curl -s localhost/tiles/10/555/326.pbf > /dev/null 
-curl -s localhost/tiles/10/555/327.pbf > /dev/null 
-curl -s localhost/tiles/10/555/328.pbf > /dev/null 
-curl -s localhost/tiles/10/555/329.pbf > /dev/null 
-curl -s localhost/tiles/10/555/330.pbf > /dev/null 
-curl -s localhost/tiles/10/555/331.pbf > /dev/null 
-curl -s localhost/tiles/10/555/332.pbf > /dev/null 
-curl -s localhost/tiles/10/555/333.pbf > /dev/null 
-curl -s localhost/tiles/10/555/334.pbf > /dev/null 
-curl -s localhost/tiles/10/555/335.pbf > /dev/null 
-curl -s localhost/tiles/10/555/336.pbf > /dev/null 
-curl -s localhost/tiles/10/555/337.pbf > /dev/null 
-curl -s localhost/tiles/10/555/338.pbf > /dev/null 
-curl -s localhost/tiles/10/555/339.pbf > /dev/null 
-curl -s localhost/tiles/10/555/340.pbf > /dev/null 
-curl -s localhost/tiles/10/555/341.pbf > /dev/null 
-curl -s localhost/tiles/10/555/342.pbf > /dev/null 
-curl -s localhost/tiles/10/555/343.pbf > /dev/null 
-curl -s localhost/tiles/10/555/344.pbf > /dev/null 
-curl -s localhost/tiles/10/555/345.pbf > /dev/null 
-curl -s localhost/tiles/10/555/346.pbf > /dev/null 
-curl -s localhost/tiles/10/555/347.pbf > /dev/null 
-curl -s localhost/tiles/10/555/348.pbf > /dev/null 
-curl -s localhost/tiles/10/555/349.pbf > /dev/null 
-curl -s localhost/tiles/10/555/350.pbf > /dev/null 
-curl -s localhost/tiles/10/555/351.pbf > /dev/null 
-curl -s localhost/tiles/10/556/324.pbf > /dev/null 
-curl -s localhost/tiles/10/556/325.pbf > /dev/null 
-curl -s localhost/tiles/10/556/326.pbf > /dev/null 
-curl -s localhost/tiles/10/556/327.pbf > /dev/null 
-curl -s localhost/tiles/10/556/328.pbf > /dev/null 
-curl -s localhost/tiles/10/556/329.pbf > /dev/null 
-curl -s localhost/tiles/10/556/330.pbf > /dev/null 
-curl -s localhost/tiles/10/556/331.pbf > /dev/null 
-curl -s localhost/tiles/10/556/332.pbf > /dev/null 
-curl -s localhost/tiles/10/556/333.pbf > /dev/null 
-curl -s localhost/tiles/10/556/334.pbf > /dev/null 
-curl -s localhost/tiles/10/556/335.pbf > /dev/null 
-curl -s localhost/tiles/10/556/336.pbf > /dev/null 
-curl -s localhost/tiles/10/556/337.pbf > /dev/null 
-curl -s localhost/tiles/10/556/338.pbf > /dev/null 
-curl -s localhost/tiles/10/556/339.pbf > /dev/null 
-curl -s localhost/tiles/10/556/340.pbf > /dev/null 
-curl -s localhost/tiles/10/556/341.pbf > /dev/null 
-curl -s localhost/tiles/10/556/342.pbf > /dev/null 
-curl -s localhost/tiles/10/556/343.pbf > /dev/null 
-curl -s localhost/tiles/10/556/344.pbf > /dev/null 
-curl -s localhost/tiles/10/556/345.pbf > /dev/null 
-curl -s localhost/tiles/10/556/346.pbf > /dev/null 
-curl -s localhost/tiles/10/556/347.pbf > /dev/null 
-curl -s localhost/tiles/10/556/348.pbf > /dev/null 
-curl -s localhost/tiles/10/556/349.pbf > /dev/null 
-curl -s localhost/tiles/10/556/350.pbf > /dev/null 
-curl -s localhost/tiles/10/556/351.pbf > /dev/null 
-curl -s localhost/tiles/10/557/324.pbf > /dev/null 
-curl -s localhost/tiles/10/557/325.pbf > /dev/null 
-curl -s localhost/tiles/10/557/326.pbf > /dev/null 
-curl -s localhost/tiles/10/557/327.pbf > /dev/null 
-curl -s localhost/tiles/10/557/328.pbf > /dev/null 
-curl -s localhost/tiles/10/557/329.pbf > /dev/null 
-curl -s localhost/tiles/10/557/330.pbf > /dev/null 
-curl -s localhost/tiles/10/557/331.pbf > /dev/null 
-curl -s localhost/tiles/10/557/332.pbf > /dev/null 
-curl -s localhost/tiles/10/557/333.pbf > /dev/null 
-curl -s localhost/tiles/10/557/334.pbf > /dev/null 
-curl -s localhost/tiles/10/557/335.pbf > /dev/null 
-curl -s localhost/tiles/10/557/336.pbf > /dev/null 
-curl -s localhost/tiles/10/557/337.pbf > /dev/null 
-curl -s localhost/tiles/10/557/338.pbf > /dev/null 
-curl -s localhost/tiles/10/557/339.pbf > /dev/null 
-curl -s localhost/tiles/10/557/340.pbf > /dev/null 
-curl -s localhost/tiles/10/557/341.pbf > /dev/null 
-curl -s localhost/tiles/10/557/342.pbf > /dev/null 
-curl -s localhost/tiles/10/557/343.pbf > /dev/null 
-curl -s localhost/tiles/10/557/344.pbf > /dev/null 
-curl -s localhost/tiles/10/557/345.pbf > /dev/null 
-curl -s localhost/tiles/10/557/346.pbf > /dev/null 
-curl -s localhost/tiles/10/557/347.pbf > /dev/null 
-curl -s localhost/tiles/10/557/348.pbf > /dev/null 
-curl -s localhost/tiles/10/557/349.pbf > /dev/null 
-curl -s localhost/tiles/10/557/350.pbf > /dev/null 
-curl -s localhost/tiles/10/557/351.pbf > /dev/null 
-curl -s localhost/tiles/10/558/324.pbf > /dev/null 
-curl -s localhost/tiles/10/558/325.pbf > /dev/null 
-curl -s localhost/tiles/10/558/326.pbf > /dev/null 
-curl -s localhost/tiles/10/558/327.pbf > /dev/null 
-curl -s localhost/tiles/10/558/328.pbf > /dev/null 
-curl -s localhost/tiles/10/558/329.pbf > /dev/null 
-curl -s localhost/tiles/10/558/330.pbf > /dev/null 
-curl -s localhost/tiles/10/558/331.pbf > /dev/null 
-curl -s localhost/tiles/10/558/332.pbf > /dev/null 
-curl -s localhost/tiles/10/558/333.pbf > /dev/null 
-curl -s localhost/tiles/10/558/334.pbf > /dev/null 
-curl -s localhost/tiles/10/558/335.pbf > /dev/null 
-curl -s localhost/tiles/10/558/336.pbf > /dev/null 
-curl -s localhost/tiles/10/558/337.pbf > /dev/null 
-curl -s localhost/tiles/10/558/338.pbf > /dev/null 
-curl -s localhost/tiles/10/558/339.pbf > /dev/null 
-curl -s localhost/tiles/10/558/340.pbf > /dev/null 
-curl -s localhost/tiles/10/558/341.pbf > /dev/null 
-curl -s localhost/tiles/10/558/342.pbf > /dev/null 
-curl -s localhost/tiles/10/558/343.pbf > /dev/null 
-curl -s localhost/tiles/10/558/344.pbf > /dev/null 
-curl -s localhost/tiles/10/558/345.pbf > /dev/null 
-curl -s localhost/tiles/10/558/346.pbf > /dev/null 
-curl -s localhost/tiles/10/558/347.pbf > /dev/null 
-curl -s localhost/tiles/10/558/348.pbf > /dev/null 
-curl -s localhost/tiles/10/558/349.pbf > /dev/null 
-curl -s localhost/tiles/10/558/350.pbf > /dev/null 
-curl -s localhost/tiles/10/558/351.pbf > /dev/null 
-curl -s localhost/tiles/10/559/324.pbf > /dev/null 
-curl -s localhost/tiles/10/559/325.pbf > /dev/null 
-curl -s localhost/tiles/10/559/326.pbf > /dev/null 
-curl -s localhost/tiles/10/559/327.pbf > /dev/null 
-curl -s localhost/tiles/10/559/328.pbf > /dev/null 
-curl -s localhost/tiles/10/559/329.pbf > /dev/null 
-curl -s localhost/tiles/10/559/330.pbf > /dev/null 
-curl -s localhost/tiles/10/559/331.pbf > /dev/null 
-curl -s localhost/tiles/10/559/332.pbf > /dev/null 
-curl -s localhost/tiles/10/559/333.pbf > /dev/null 
-curl -s localhost/tiles/10/559/334.pbf > /dev/null 
-curl -s localhost/tiles/10/559/335.pbf > /dev/null 
-curl -s localhost/tiles/10/559/336.pbf > /dev/null 
-curl -s localhost/tiles/10/559/337.pbf > /dev/null 
-curl -s localhost/tiles/10/559/338.pbf > /dev/null 
-curl -s localhost/tiles/10/559/339.pbf > /dev/null 
-curl -s localhost/tiles/10/559/340.pbf > /dev/null 
-curl -s localhost/tiles/10/559/341.pbf > /dev/null 
-curl -s localhost/tiles/10/559/342.pbf > /dev/null 
-curl -s localhost/tiles/10/559/343.pbf > /dev/null 
-curl -s localhost/tiles/10/559/344.pbf > /dev/null 
-curl -s localhost/tiles/10/559/345.pbf > /dev/null 
-curl -s localhost/tiles/10/559/346.pbf > /dev/null 
-curl -s localhost/tiles/10/559/347.pbf > /dev/null 
-curl -s localhost/tiles/10/559/348.pbf > /dev/null 
-curl -s localhost/tiles/10/559/349.pbf > /dev/null 
-curl -s localhost/tiles/10/559/350.pbf > /dev/null 
-curl -s localhost/tiles/10/559/351.pbf > /dev/null 
-curl -s localhost/tiles/10/560/324.pbf > /dev/null 
-curl -s localhost/tiles/10/560/325.pbf > /dev/null 
-curl -s localhost/tiles/10/560/326.pbf > /dev/null 
-curl -s localhost/tiles/10/560/327.pbf > /dev/null 
-curl -s localhost/tiles/10/560/328.pbf > /dev/null 
-curl -s localhost/tiles/10/560/329.pbf > /dev/null 
-curl -s localhost/tiles/10/560/330.pbf > /dev/null 
-curl -s localhost/tiles/10/560/331.pbf > /dev/null 
-curl -s localhost/tiles/10/560/332.pbf > /dev/null 
-curl -s localhost/tiles/10/560/333.pbf > /dev/null 
-curl -s localhost/tiles/10/560/334.pbf > /dev/null 
-curl -s localhost/tiles/10/560/335.pbf > /dev/null 
-curl -s localhost/tiles/10/560/336.pbf > /dev/null 
-curl -s localhost/tiles/10/560/337.pbf > /dev/null 
-curl -s localhost/tiles/10/560/338.pbf > /dev/null 
-curl -s localhost/tiles/10/560/339.pbf > /dev/null 
-curl -s localhost/tiles/10/560/340.pbf > /dev/null 
-curl -s localhost/tiles/10/560/341.pbf > /dev/null 
-curl -s localhost/tiles/10/560/342.pbf > /dev/null 
-curl -s localhost/tiles/10/560/343.pbf > /dev/null 
-curl -s localhost/tiles/10/560/344.pbf > /dev/null 
-curl -s localhost/tiles/10/560/345.pbf > /dev/null 
-curl -s localhost/tiles/10/560/346.pbf > /dev/null 
-curl -s localhost/tiles/10/560/347.pbf > /dev/null 
-curl -s localhost/tiles/10/560/348.pbf > /dev/null 
-curl -s localhost/tiles/10/560/349.pbf > /dev/null 
-curl -s localhost/tiles/10/560/350.pbf > /dev/null 
-curl -s localhost/tiles/10/560/351.pbf > /dev/null 
-curl -s localhost/tiles/10/561/324.pbf > /dev/null 
-curl -s localhost/tiles/10/561/325.pbf > /dev/null 
-curl -s localhost/tiles/10/561/326.pbf > /dev/null 
-curl -s localhost/tiles/10/561/327.pbf > /dev/null 
-curl -s localhost/tiles/10/561/328.pbf > /dev/null 
-curl -s localhost/tiles/10/561/329.pbf > /dev/null 
-curl -s localhost/tiles/10/561/330.pbf > /dev/null 
-curl -s localhost/tiles/10/561/331.pbf > /dev/null 
-curl -s localhost/tiles/10/561/332.pbf > /dev/null 
-curl -s localhost/tiles/10/561/333.pbf > /dev/null 
-curl -s localhost/tiles/10/561/334.pbf > /dev/null 
-curl -s localhost/tiles/10/561/335.pbf > /dev/null 
-curl -s localhost/tiles/10/561/336.pbf > /dev/null 
-curl -s localhost/tiles/10/561/337.pbf > /dev/null 
-curl -s localhost/tiles/10/561/338.pbf > /dev/null 
-curl -s localhost/tiles/10/561/339.pbf > /dev/null 
-curl -s localhost/tiles/10/561/340.pbf > /dev/null 
-curl -s localhost/tiles/10/561/341.pbf > /dev/null 
-curl -s localhost/tiles/10/561/342.pbf > /dev/null 
-curl -s localhost/tiles/10/561/343.pbf > /dev/null 
-curl -s localhost/tiles/10/561/344.pbf > /dev/null 
-curl -s localhost/tiles/10/561/345.pbf > /dev/null 
-curl -s localhost/tiles/10/561/346.pbf > /dev/null 
-curl -s localhost/tiles/10/561/347.pbf > /dev/null 
-curl -s localhost/tiles/10/561/348.pbf > /dev/null 
-curl -s localhost/tiles/10/561/349.pbf > /dev/null 
-curl -s localhost/tiles/10/561/350.pbf > /dev/null 
-curl -s localhost/tiles/10/561/351.pbf > /dev/null 
-curl -s localhost/tiles/10/562/324.pbf > /dev/null 
-curl -s localhost/tiles/10/562/325.pbf > /dev/null 
-curl -s localhost/tiles/10/562/326.pbf > /dev/null 
-curl -s localhost/tiles/10/562/327.pbf > /dev/null 
-curl -s localhost/tiles/10/562/328.pbf > /dev/null 
-curl -s localhost/tiles/10/562/329.pbf > /dev/null 
-curl -s localhost/tiles/10/562/330.pbf > /dev/null 
-curl -s localhost/tiles/10/562/331.pbf > /dev/null 
-curl -s localhost/tiles/10/562/332.pbf > /dev/null 
-curl -s localhost/tiles/10/562/333.pbf > /dev/null 
-curl -s localhost/tiles/10/562/334.pbf > /dev/null 
-curl -s localhost/tiles/10/562/335.pbf > /dev/null 
-curl -s localhost/tiles/10/562/336.pbf > /dev/null 
-curl -s localhost/tiles/10/562/337.pbf > /dev/null 
-curl -s localhost/tiles/10/562/338.pbf > /dev/null 
-curl -s localhost/tiles/10/562/339.pbf > /dev/null 
-curl -s localhost/tiles/10/562/340.pbf > /dev/null 
-curl -s localhost/tiles/10/562/341.pbf > /dev/null 
-curl -s localhost/tiles/10/562/342.pbf > /dev/null 
-curl -s localhost/tiles/10/562/343.pbf > /dev/null 
-curl -s localhost/tiles/10/562/344.pbf > /dev/null 
-curl -s localhost/tiles/10/562/345.pbf > /dev/null 
-curl -s localhost/tiles/10/562/346.pbf > /dev/null 
-curl -s localhost/tiles/10/562/347.pbf > /dev/null 
-curl -s localhost/tiles/10/562/348.pbf > /dev/null 
-curl -s localhost/tiles/10/562/349.pbf > /dev/null 
-curl -s localhost/tiles/10/562/350.pbf > /dev/null 
-curl -s localhost/tiles/10/562/351.pbf > /dev/null 
-curl -s localhost/tiles/10/563/324.pbf > /dev/null 
-curl -s localhost/tiles/10/563/325.pbf > /dev/null 
-curl -s localhost/tiles/10/563/326.pbf > /dev/null 
-curl -s localhost/tiles/10/563/327.pbf > /dev/null 
-curl -s localhost/tiles/10/563/328.pbf > /dev/null 
-curl -s localhost/tiles/10/563/329.pbf > /dev/null 
-curl -s localhost/tiles/10/563/330.pbf > /dev/null 
-curl -s localhost/tiles/10/563/331.pbf > /dev/null 
-curl -s localhost/tiles/10/563/332.pbf > /dev/null 
-curl -s localhost/tiles/10/563/333.pbf > /dev/null 
-curl -s localhost/tiles/10/563/334.pbf > /dev/null 
-curl -s localhost/tiles/10/563/335.pbf > /dev/null 
-curl -s localhost/tiles/10/563/336.pbf > /dev/null 
-curl -s localhost/tiles/10/563/337.pbf > /dev/null 
-curl -s localhost/tiles/10/563/338.pbf > /dev/null 
-curl -s localhost/tiles/10/563/339.pbf > /dev/null 
-curl -s localhost/tiles/10/563/340.pbf > /dev/null 
-curl -s localhost/tiles/10/563/341.pbf > /dev/null 
-curl -s localhost/tiles/10/563/342.pbf > /dev/null 
-curl -s localhost/tiles/10/563/343.pbf > /dev/null 
-curl -s localhost/tiles/10/563/344.pbf > /dev/null 
-curl -s localhost/tiles/10/563/345.pbf > /dev/null 
-curl -s localhost/tiles/10/563/346.pbf > /dev/null 
-curl -s localhost/tiles/10/563/347.pbf > /dev/null 
-curl -s localhost/tiles/10/563/348.pbf > /dev/null 
-curl -s localhost/tiles/10/563/349.pbf > /dev/null 
-curl -s localhost/tiles/10/563/350.pbf > /dev/null 
-curl -s localhost/tiles/10/563/351.pbf > /dev/null 
-curl -s localhost/tiles/10/564/324.pbf > /dev/null 
-curl -s localhost/tiles/10/564/325.pbf > /dev/null 
-curl -s localhost/tiles/10/564/326.pbf > /dev/null 
-curl -s localhost/tiles/10/564/327.pbf > /dev/null 
-curl -s localhost/tiles/10/564/328.pbf > /dev/null 
-curl -s localhost/tiles/10/564/329.pbf > /dev/null 
-curl -s localhost/tiles/10/564/330.pbf > /dev/null 
-curl -s localhost/tiles/10/564/331.pbf > /dev/null 
-curl -s localhost/tiles/10/564/332.pbf > /dev/null 
-curl -s localhost/tiles/10/564/333.pbf > /dev/null 
-curl -s localhost/tiles/10/564/334.pbf > /dev/null 
-curl -s localhost/tiles/10/564/335.pbf > /dev/null 
-curl -s localhost/tiles/10/564/336.pbf > /dev/null 
-curl -s localhost/tiles/10/564/337.pbf > /dev/null 
-curl -s localhost/tiles/10/564/338.pbf > /dev/null 
-curl -s localhost/tiles/10/564/339.pbf > /dev/null 
-curl -s localhost/tiles/10/564/340.pbf > /dev/null 
-curl -s localhost/tiles/10/564/341.pbf > /dev/null 
-curl -s localhost/tiles/10/564/342.pbf > /dev/null 
-curl -s localhost/tiles/10/564/343.pbf > /dev/null 
-curl -s localhost/tiles/10/564/344.pbf > /dev/null 
-curl -s localhost/tiles/10/564/345.pbf > /dev/null 
-curl -s localhost/tiles/10/564/346.pbf > /dev/null 
-curl -s localhost/tiles/10/564/347.pbf > /dev/null 
-curl -s localhost/tiles/10/564/348.pbf > /dev/null 
-curl -s localhost/tiles/10/564/349.pbf > /dev/null 
-curl -s localhost/tiles/10/564/350.pbf > /dev/null 
-curl -s localhost/tiles/10/564/351.pbf > /dev/null 
-curl -s localhost/tiles/10/565/324.pbf > /dev/null 
-curl -s localhost/tiles/10/565/325.pbf > /dev/null 
-curl -s localhost/tiles/10/565/326.pbf > /dev/null 
-curl -s localhost/tiles/10/565/327.pbf > /dev/null 
-curl -s localhost/tiles/10/565/328.pbf > /dev/null 
-curl -s localhost/tiles/10/565/329.pbf > /dev/null 
-curl -s localhost/tiles/10/565/330.pbf > /dev/null 
-curl -s localhost/tiles/10/565/331.pbf > /dev/null 
-curl -s localhost/tiles/10/565/332.pbf > /dev/null 
-curl -s localhost/tiles/10/565/333.pbf > /dev/null 
-curl -s localhost/tiles/10/565/334.pbf > /dev/null 
-curl -s localhost/tiles/10/565/335.pbf > /dev/null 
-curl -s localhost/tiles/10/565/336.pbf > /dev/null 
-curl -s localhost/tiles/10/565/337.pbf > /dev/null 
-curl -s localhost/tiles/10/565/338.pbf > /dev/null 
-curl -s localhost/tiles/10/565/339.pbf > /dev/null 
-curl -s localhost/tiles/10/565/340.pbf > /dev/null 
-curl -s localhost/tiles/10/565/341.pbf > /dev/null 
-curl -s localhost/tiles/10/565/342.pbf > /dev/null 
-curl -s localhost/tiles/10/565/343.pbf > /dev/null 
-curl -s localhost/tiles/10/565/344.pbf > /dev/null 
-curl -s localhost/tiles/10/565/345.pbf > /dev/null 
-curl -s localhost/tiles/10/565/346.pbf > /dev/null 
-curl -s localhost/tiles/10/565/347.pbf > /dev/null 
-curl -s localhost/tiles/10/565/348.pbf > /dev/null 
-curl -s localhost/tiles/10/565/349.pbf > /dev/null 
-curl -s localhost/tiles/10/565/350.pbf > /dev/null 
-curl -s localhost/tiles/10/565/351.pbf > /dev/null 
-curl -s localhost/tiles/10/566/324.pbf > /dev/null 
-curl -s localhost/tiles/10/566/325.pbf > /dev/null 
-curl -s localhost/tiles/10/566/326.pbf > /dev/null 
-curl -s localhost/tiles/10/566/327.pbf > /dev/null 
-curl -s localhost/tiles/10/566/328.pbf > /dev/null 
-curl -s localhost/tiles/10/566/329.pbf > /dev/null 
-curl -s localhost/tiles/10/566/330.pbf > /dev/null 
-curl -s localhost/tiles/10/566/331.pbf > /dev/null 
-curl -s localhost/tiles/10/566/332.pbf > /dev/null 
-curl -s localhost/tiles/10/566/333.pbf > /dev/null 
-curl -s localhost/tiles/10/566/334.pbf > /dev/null 
-curl -s localhost/tiles/10/566/335.pbf > /dev/null 
-curl -s localhost/tiles/10/566/336.pbf > /dev/null 
-curl -s localhost/tiles/10/566/337.pbf > /dev/null 
-curl -s localhost/tiles/10/566/338.pbf > /dev/null 
-curl -s localhost/tiles/10/566/339.pbf > /dev/null 
-curl -s localhost/tiles/10/566/340.pbf > /dev/null 
-curl -s localhost/tiles/10/566/341.pbf > /dev/null 
-curl -s localhost/tiles/10/566/342.pbf > /dev/null 
-curl -s localhost/tiles/10/566/343.pbf > /dev/null 
-curl -s localhost/tiles/10/566/344.pbf > /dev/null 
-curl -s localhost/tiles/10/566/345.pbf > /dev/null 
-curl -s localhost/tiles/10/566/346.pbf > /dev/null 
-curl -s localhost/tiles/10/566/347.pbf > /dev/null 
-curl -s localhost/tiles/10/566/348.pbf > /dev/null 
-curl -s localhost/tiles/10/566/349.pbf > /dev/null 
-curl -s localhost/tiles/10/566/350.pbf > /dev/null 
-curl -s localhost/tiles/10/566/351.pbf > /dev/null 
-curl -s localhost/tiles/10/567/324.pbf > /dev/null 
-curl -s localhost/tiles/10/567/325.pbf > /dev/null 
-curl -s localhost/tiles/10/567/326.pbf > /dev/null 
-curl -s localhost/tiles/10/567/327.pbf > /dev/null 
-curl -s localhost/tiles/10/567/328.pbf > /dev/null 
-curl -s localhost/tiles/10/567/329.pbf > /dev/null 
-curl -s localhost/tiles/10/567/330.pbf > /dev/null 
-curl -s localhost/tiles/10/567/331.pbf > /dev/null 
-curl -s localhost/tiles/10/567/332.pbf > /dev/null 
-curl -s localhost/tiles/10/567/333.pbf > /dev/null 
-curl -s localhost/tiles/10/567/334.pbf > /dev/null 
-curl -s localhost/tiles/10/567/335.pbf > /dev/null 
-curl -s localhost/tiles/10/567/336.pbf > /dev/null 
-curl -s localhost/tiles/10/567/337.pbf > /dev/null 
-curl -s localhost/tiles/10/567/338.pbf > /dev/null 
-curl -s localhost/tiles/10/567/339.pbf > /dev/null 
-curl -s localhost/tiles/10/567/340.pbf > /dev/null 
-curl -s localhost/tiles/10/567/341.pbf > /dev/null 
-curl -s localhost/tiles/10/567/342.pbf > /dev/null 
-curl -s localhost/tiles/10/567/343.pbf > /dev/null 
-curl -s localhost/tiles/10/567/344.pbf > /dev/null 
-curl -s localhost/tiles/10/567/345.pbf > /dev/null 
-curl -s localhost/tiles/10/567/346.pbf > /dev/null 
-curl -s localhost/tiles/10/567/347.pbf > /dev/null 
-curl -s localhost/tiles/10/567/348.pbf > /dev/null 
-curl -s localhost/tiles/10/567/349.pbf > /dev/null 
-curl -s localhost/tiles/10/567/350.pbf > /dev/null 
-curl -s localhost/tiles/10/567/351.pbf > /dev/null 
-curl -s localhost/tiles/10/568/324.pbf > /dev/null 
-curl -s localhost/tiles/10/568/325.pbf > /dev/null 
-curl -s localhost/tiles/10/568/326.pbf > /dev/null 
-curl -s localhost/tiles/10/568/327.pbf > /dev/null 
-curl -s localhost/tiles/10/568/328.pbf > /dev/null 
-curl -s localhost/tiles/10/568/329.pbf > /dev/null 
-curl -s localhost/tiles/10/568/330.pbf > /dev/null 
-curl -s localhost/tiles/10/568/331.pbf > /dev/null 
-curl -s localhost/tiles/10/568/332.pbf > /dev/null 
-curl -s localhost/tiles/10/568/333.pbf > /dev/null 
-curl -s localhost/tiles/10/568/334.pbf > /dev/null 
-curl -s localhost/tiles/10/568/335.pbf > /dev/null 
-curl -s localhost/tiles/10/568/336.pbf > /dev/null 
-curl -s localhost/tiles/10/568/337.pbf > /dev/null 
-curl -s localhost/tiles/10/568/338.pbf > /dev/null 
-curl -s localhost/tiles/10/568/339.pbf > /dev/null 
-curl -s localhost/tiles/10/568/340.pbf > /dev/null 
-curl -s localhost/tiles/10/568/341.pbf > /dev/null 
-curl -s localhost/tiles/10/568/342.pbf > /dev/null 
-curl -s localhost/tiles/10/568/343.pbf > /dev/null 
-curl -s localhost/tiles/10/568/344.pbf > /dev/null 
-curl -s localhost/tiles/10/568/345.pbf > /dev/null 
-curl -s localhost/tiles/10/568/346.pbf > /dev/null 
-curl -s localhost/tiles/10/568/347.pbf > /dev/null 
-curl -s localhost/tiles/10/568/348.pbf > /dev/null 
-curl -s localhost/tiles/10/568/349.pbf > /dev/null 
-curl -s localhost/tiles/10/568/350.pbf > /dev/null 
-curl -s localhost/tiles/10/568/351.pbf > /dev/null 
-curl -s localhost/tiles/10/569/324.pbf > /dev/null 
-curl -s localhost/tiles/10/569/325.pbf > /dev/null 
-curl -s localhost/tiles/10/569/326.pbf > /dev/null 
-curl -s localhost/tiles/10/569/327.pbf > /dev/null 
-curl -s localhost/tiles/10/569/328.pbf > /dev/null 
-curl -s localhost/tiles/10/569/329.pbf > /dev/null 
-curl -s localhost/tiles/10/569/330.pbf > /dev/null 
-curl -s localhost/tiles/10/569/331.pbf > /dev/null 
-curl -s localhost/tiles/10/569/332.pbf > /dev/null 
-curl -s localhost/tiles/10/569/333.pbf > /dev/null 
-curl -s localhost/tiles/10/569/334.pbf > /dev/null 
-curl -s localhost/tiles/10/569/335.pbf > /dev/null 
-curl -s localhost/tiles/10/569/336.pbf > /dev/null 
-curl -s localhost/tiles/10/569/337.pbf > /dev/null 
-curl -s localhost/tiles/10/569/338.pbf > /dev/null 
-curl -s localhost/tiles/10/569/339.pbf > /dev/null 
-curl -s localhost/tiles/10/569/340.pbf > /dev/null 
-curl -s localhost/tiles/10/569/341.pbf > /dev/null 
-curl -s localhost/tiles/10/569/342.pbf > /dev/null 
-curl -s localhost/tiles/10/569/343.pbf > /dev/null 
-curl -s localhost/tiles/10/569/344.pbf > /dev/null 
-curl -s localhost/tiles/10/569/345.pbf > /dev/null 
-curl -s localhost/tiles/10/569/346.pbf > /dev/null 
-curl -s localhost/tiles/10/569/347.pbf > /dev/null 
-curl -s localhost/tiles/10/569/348.pbf > /dev/null 
-curl -s localhost/tiles/10/569/349.pbf > /dev/null 
-curl -s localhost/tiles/10/569/350.pbf > /dev/null 
-curl -s localhost/tiles/10/569/351.pbf > /dev/null 
-curl -s localhost/tiles/10/570/324.pbf > /dev/null 
-curl -s localhost/tiles/10/570/325.pbf > /dev/null 
-curl -s localhost/tiles/10/570/326.pbf > /dev/null 
-curl -s localhost/tiles/10/570/327.pbf > /dev/null 
-curl -s localhost/tiles/10/570/328.pbf > /dev/null 
-curl -s localhost/tiles/10/570/329.pbf > /dev/null 
-curl -s localhost/tiles/10/570/330.pbf > /dev/null 
-curl -s localhost/tiles/10/570/331.pbf > /dev/null 
-curl -s localhost/tiles/10/570/332.pbf > /dev/null 
-curl -s localhost/tiles/10/570/333.pbf > /dev/null 
-curl -s localhost/tiles/10/570/334.pbf > /dev/null 
-curl -s localhost/tiles/10/570/335.pbf > /dev/null 
-curl -s localhost/tiles/10/570/336.pbf > /dev/null 
-curl -s localhost/tiles/10/570/337.pbf > /dev/null 
-curl -s localhost/tiles/10/570/338.pbf > /dev/null 
-curl -s localhost/tiles/10/570/339.pbf > /dev/null 
-curl -s localhost/tiles/10/570/340.pbf > /dev/null 
-curl -s localhost/tiles/10/570/341.pbf > /dev/null 
-curl -s localhost/tiles/10/570/342.pbf > /dev/null 
-curl -s localhost/tiles/10/570/343.pbf > /dev/null 
-curl -s localhost/tiles/10/570/344.pbf > /dev/null 
-curl -s localhost/tiles/10/570/345.pbf > /dev/null 
-curl -s localhost/tiles/10/570/346.pbf > /dev/null 
-curl -s localhost/tiles/10/570/347.pbf > /dev/null 
-curl -s localhost/tiles/10/570/348.pbf > /dev/null 
-curl -s localhost/tiles/10/570/349.pbf > /dev/null 
-curl -s localhost/tiles/10/570/350.pbf > /dev/null 
-curl -s localhost/tiles/10/570/351.pbf > /dev/null 
-curl -s localhost/tiles/10/571/324.pbf > /dev/null 
-curl -s localhost/tiles/10/571/325.pbf > /dev/null 
-curl -s localhost/tiles/10/571/326.pbf > /dev/null 
-curl -s localhost/tiles/10/571/327.pbf > /dev/null 
-curl -s localhost/tiles/10/571/328.pbf > /dev/null 
-curl -s localhost/tiles/10/571/329.pbf > /dev/null 
-curl -s localhost/tiles/10/571/330.pbf > /dev/null 
-curl -s localhost/tiles/10/571/331.pbf > /dev/null 
-curl -s localhost/tiles/10/571/332.pbf > /dev/null 
-curl -s localhost/tiles/10/571/333.pbf > /dev/null 
-curl -s localhost/tiles/10/571/334.pbf > /dev/null 
-curl -s localhost/tiles/10/571/335.pbf > /dev/null 
-curl -s localhost/tiles/10/571/336.pbf > /dev/null 
-curl -s localhost/tiles/10/571/337.pbf > /dev/null 
-curl -s localhost/tiles/10/571/338.pbf > /dev/null 
-curl -s localhost/tiles/10/571/339.pbf > /dev/null 
-curl -s localhost/tiles/10/571/340.pbf > /dev/null 
-curl -s localhost/tiles/10/571/341.pbf > /dev/null 
-curl -s localhost/tiles/10/571/342.pbf > /dev/null 
-curl -s localhost/tiles/10/571/343.pbf > /dev/null 
-curl -s localhost/tiles/10/571/344.pbf > /dev/null 
-curl -s localhost/tiles/10/571/345.pbf > /dev/null 
-curl -s localhost/tiles/10/571/346.pbf > /dev/null 
-curl -s localhost/tiles/10/571/347.pbf > /dev/null 
-curl -s localhost/tiles/10/571/348.pbf > /dev/null 
-curl -s localhost/tiles/10/571/349.pbf > /dev/null 
-curl -s localhost/tiles/10/571/350.pbf > /dev/null 
-curl -s localhost/tiles/10/571/351.pbf > /dev/null 
-curl -s localhost/tiles/10/572/324.pbf > /dev/null 
-curl -s localhost/tiles/10/572/325.pbf > /dev/null 
-curl -s localhost/tiles/10/572/326.pbf > /dev/null 
-curl -s localhost/tiles/10/572/327.pbf > /dev/null 
-curl -s localhost/tiles/10/572/328.pbf > /dev/null 
-curl -s localhost/tiles/10/572/329.pbf > /dev/null 
-curl -s localhost/tiles/10/572/330.pbf > /dev/null 
-curl -s localhost/tiles/10/572/331.pbf > /dev/null 
-curl -s localhost/tiles/10/572/332.pbf > /dev/null 
-curl -s localhost/tiles/10/572/333.pbf > /dev/null 
-curl -s localhost/tiles/10/572/334.pbf > /dev/null 
-curl -s localhost/tiles/10/572/335.pbf > /dev/null 
-curl -s localhost/tiles/10/572/336.pbf > /dev/null 
-curl -s localhost/tiles/10/572/337.pbf > /dev/null 
-curl -s localhost/tiles/10/572/338.pbf > /dev/null 
-curl -s localhost/tiles/10/572/339.pbf > /dev/null 
-curl -s localhost/tiles/10/572/340.pbf > /dev/null 
-curl -s localhost/tiles/10/572/341.pbf > /dev/null 
-curl -s localhost/tiles/10/572/342.pbf > /dev/null 
-curl -s localhost/tiles/10/572/343.pbf > /dev/null 
-curl -s localhost/tiles/10/572/344.pbf > /dev/null 
-curl -s localhost/tiles/10/572/345.pbf > /dev/null 
-curl -s localhost/tiles/10/572/346.pbf > /dev/null 
-curl -s localhost/tiles/10/572/347.pbf > /dev/null 
-curl -s localhost/tiles/10/572/348.pbf > /dev/null 
-curl -s localhost/tiles/10/572/349.pbf > /dev/null 
-curl -s localhost/tiles/10/572/350.pbf > /dev/null 
-curl -s localhost/tiles/10/572/351.pbf > /dev/null 
-curl -s localhost/tiles/10/573/324.pbf > /dev/null 
-curl -s localhost/tiles/10/573/325.pbf > /dev/null 
-curl -s localhost/tiles/10/573/326.pbf > /dev/null 
-curl -s localhost/tiles/10/573/327.pbf > /dev/null 
-curl -s localhost/tiles/10/573/328.pbf > /dev/null 
-curl -s localhost/tiles/10/573/329.pbf > /dev/null 
-curl -s localhost/tiles/10/573/330.pbf > /dev/null 
-curl -s localhost/tiles/10/573/331.pbf > /dev/null 
-curl -s localhost/tiles/10/573/332.pbf > /dev/null 
-curl -s localhost/tiles/10/573/333.pbf > /dev/null 
-curl -s localhost/tiles/10/573/334.pbf > /dev/null 
-curl -s localhost/tiles/10/573/335.pbf > /dev/null 
-curl -s localhost/tiles/10/573/336.pbf > /dev/null 
-curl -s localhost/tiles/10/573/337.pbf > /dev/null 
-curl -s localhost/tiles/10/573/338.pbf > /dev/null 
-curl -s localhost/tiles/10/573/339.pbf > /dev/null 
-curl -s localhost/tiles/10/573/340.pbf > /dev/null 
-curl -s localhost/tiles/10/573/341.pbf > /dev/null 
-curl -s localhost/tiles/10/573/342.pbf > /dev/null 
-curl -s localhost/tiles/10/573/343.pbf > /dev/null 
-curl -s localhost/tiles/10/573/344.pbf > /dev/null 
-curl -s localhost/tiles/10/573/345.pbf > /dev/null 
-curl -s localhost/tiles/10/573/346.pbf > /dev/null 
-curl -s localhost/tiles/10/573/347.pbf > /dev/null 
-curl -s localhost/tiles/10/573/348.pbf > /dev/null 
-curl -s localhost/tiles/10/573/349.pbf > /dev/null 
-curl -s localhost/tiles/10/573/350.pbf > /dev/null 
-curl -s localhost/tiles/10/573/351.pbf > /dev/null 
-curl -s localhost/tiles/10/574/324.pbf > /dev/null 
-curl -s localhost/tiles/10/574/325.pbf > /dev/null 
-curl -s localhost/tiles/10/574/326.pbf > /dev/null 
-curl -s localhost/tiles/10/574/327.pbf > /dev/null 
-curl -s localhost/tiles/10/574/328.pbf > /dev/null 
-curl -s localhost/tiles/10/574/329.pbf > /dev/null 
-curl -s localhost/tiles/10/574/330.pbf > /dev/null 
-curl -s localhost/tiles/10/574/331.pbf > /dev/null 
-curl -s localhost/tiles/10/574/332.pbf > /dev/null 
-curl -s localhost/tiles/10/574/333.pbf > /dev/null 
-curl -s localhost/tiles/10/574/334.pbf > /dev/null 
-curl -s localhost/tiles/10/574/335.pbf > /dev/null 
-curl -s localhost/tiles/10/574/336.pbf > /dev/null 
-curl -s localhost/tiles/10/574/337.pbf > /dev/null 
-curl -s localhost/tiles/10/574/338.pbf > /dev/null 
-curl -s localhost/tiles/10/574/339.pbf > /dev/null 
-curl -s localhost/tiles/10/574/340.pbf > /dev/null 
-curl -s localhost/tiles/10/574/341.pbf > /dev/null 
-curl -s localhost/tiles/10/574/342.pbf > /dev/null 
-curl -s localhost/tiles/10/574/343.pbf > /dev/null 
-curl -s localhost/tiles/10/574/344.pbf > /dev/null 
-curl -s localhost/tiles/10/574/345.pbf > /dev/null 
-curl -s localhost/tiles/10/574/346.pbf > /dev/null 
-curl -s localhost/tiles/10/574/347.pbf > /dev/null 
-curl -s localhost/tiles/10/574/348.pbf > /dev/null 
-curl -s localhost/tiles/10/574/349.pbf > /dev/null 
-curl -s localhost/tiles/10/574/350.pbf > /dev/null 
-curl -s localhost/tiles/10/574/351.pbf > /dev/null 
-curl -s localhost/tiles/10/575/324.pbf > /dev/null 
-curl -s localhost/tiles/10/575/325.pbf > /dev/null 
-curl -s localhost/tiles/10/575/326.pbf > /dev/null 
-curl -s localhost/tiles/10/575/327.pbf > /dev/null 
-curl -s localhost/tiles/10/575/328.pbf > /dev/null 
-curl -s localhost/tiles/10/575/329.pbf > /dev/null 
-curl -s localhost/tiles/10/575/330.pbf > /dev/null 
-curl -s localhost/tiles/10/575/331.pbf > /dev/null 
-curl -s localhost/tiles/10/575/332.pbf > /dev/null 
-curl -s localhost/tiles/10/575/333.pbf > /dev/null 
-curl -s localhost/tiles/10/575/334.pbf > /dev/null 
-curl -s localhost/tiles/10/575/335.pbf > /dev/null 
-curl -s localhost/tiles/10/575/336.pbf > /dev/null 
-curl -s localhost/tiles/10/575/337.pbf > /dev/null 
-curl -s localhost/tiles/10/575/338.pbf > /dev/null 
-curl -s localhost/tiles/10/575/339.pbf > /dev/null 
-curl -s localhost/tiles/10/575/340.pbf > /dev/null 
-curl -s localhost/tiles/10/575/341.pbf > /dev/null 
-curl -s localhost/tiles/10/575/342.pbf > /dev/null 
-curl -s localhost/tiles/10/575/343.pbf > /dev/null 
-curl -s localhost/tiles/10/575/344.pbf > /dev/null 
-curl -s localhost/tiles/10/575/345.pbf > /dev/null 
-curl -s localhost/tiles/10/575/346.pbf > /dev/null 
-curl -s localhost/tiles/10/575/347.pbf > /dev/null 
-curl -s localhost/tiles/10/575/348.pbf > /dev/null 
-curl -s localhost/tiles/10/575/349.pbf > /dev/null 
-curl -s localhost/tiles/10/575/350.pbf > /dev/null 
-curl -s localhost/tiles/10/575/351.pbf > /dev/null 
-curl -s localhost/tiles/10/576/324.pbf > /dev/null 
-curl -s localhost/tiles/10/576/325.pbf > /dev/null 
-curl -s localhost/tiles/10/576/326.pbf > /dev/null 
-curl -s localhost/tiles/10/576/327.pbf > /dev/null 
-curl -s localhost/tiles/10/576/328.pbf > /dev/null 
-curl -s localhost/tiles/10/576/329.pbf > /dev/null 
-curl -s localhost/tiles/10/576/330.pbf > /dev/null 
-curl -s localhost/tiles/10/576/331.pbf > /dev/null 
-curl -s localhost/tiles/10/576/332.pbf > /dev/null 
-curl -s localhost/tiles/10/576/333.pbf > /dev/null 
-curl -s localhost/tiles/10/576/334.pbf > /dev/null 
-curl -s localhost/tiles/10/576/335.pbf > /dev/null 
-curl -s localhost/tiles/10/576/336.pbf > /dev/null 
-curl -s localhost/tiles/10/576/337.pbf > /dev/null 
-curl -s localhost/tiles/10/576/338.pbf > /dev/null 
-curl -s localhost/tiles/10/576/339.pbf > /dev/null 
-curl -s localhost/tiles/10/576/340.pbf > /dev/null 
-curl -s localhost/tiles/10/576/341.pbf > /dev/null 
-curl -s localhost/tiles/10/576/342.pbf > /dev/null 
-curl -s localhost/tiles/10/576/343.pbf > /dev/null 
-curl -s localhost/tiles/10/576/344.pbf > /dev/null 
-curl -s localhost/tiles/10/576/345.pbf > /dev/null 
-curl -s localhost/tiles/10/576/346.pbf > /dev/null 
-curl -s localhost/tiles/10/576/347.pbf > /dev/null 
-curl -s localhost/tiles/10/576/348.pbf > /dev/null 
-curl -s localhost/tiles/10/576/349.pbf > /dev/null 
-curl -s localhost/tiles/10/576/350.pbf > /dev/null 
-curl -s localhost/tiles/10/576/351.pbf > /dev/null 
-curl -s localhost/tiles/10/577/324.pbf > /dev/null 
-curl -s localhost/tiles/10/577/325.pbf > /dev/null 
-curl -s localhost/tiles/10/577/326.pbf > /dev/null 
-curl -s localhost/tiles/10/577/327.pbf > /dev/null 
-curl -s localhost/tiles/10/577/328.pbf > /dev/null 
-curl -s localhost/tiles/10/577/329.pbf > /dev/null 
-curl -s localhost/tiles/10/577/330.pbf > /dev/null 
-curl -s localhost/tiles/10/577/331.pbf > /dev/null 
-curl -s localhost/tiles/10/577/332.pbf > /dev/null 
-curl -s localhost/tiles/10/577/333.pbf > /dev/null 
-curl -s localhost/tiles/10/577/334.pbf > /dev/null 
-curl -s localhost/tiles/10/577/335.pbf > /dev/null 
-curl -s localhost/tiles/10/577/336.pbf > /dev/null 
-curl -s localhost/tiles/10/577/337.pbf > /dev/null 
-curl -s localhost/tiles/10/577/338.pbf > /dev/null 
-curl -s localhost/tiles/10/577/339.pbf > /dev/null 
-curl -s localhost/tiles/10/577/340.pbf > /dev/null 
-curl -s localhost/tiles/10/577/341.pbf > /dev/null 
-curl -s localhost/tiles/10/577/342.pbf > /dev/null 
-curl -s localhost/tiles/10/577/343.pbf > /dev/null 
-curl -s localhost/tiles/10/577/344.pbf > /dev/null 
-curl -s localhost/tiles/10/577/345.pbf > /dev/null 
-curl -s localhost/tiles/10/577/346.pbf > /dev/null 
-curl -s localhost/tiles/10/577/347.pbf > /dev/null 
-curl -s localhost/tiles/10/577/348.pbf > /dev/null 
-curl -s localhost/tiles/10/577/349.pbf > /dev/null 
-curl -s localhost/tiles/10/577/350.pbf > /dev/null 
-curl -s localhost/tiles/10/577/351.pbf > /dev/null 
-curl -s localhost/tiles/10/578/324.pbf > /dev/null 
-curl -s localhost/tiles/10/578/325.pbf > /dev/null 
-curl -s localhost/tiles/10/578/326.pbf > /dev/null 
-curl -s localhost/tiles/10/578/327.pbf > /dev/null 
-curl -s localhost/tiles/10/578/328.pbf > /dev/null 
-curl -s localhost/tiles/10/578/329.pbf > /dev/null 
-curl -s localhost/tiles/10/578/330.pbf > /dev/null 
-curl -s localhost/tiles/10/578/331.pbf > /dev/null 
-curl -s localhost/tiles/10/578/332.pbf > /dev/null 
-curl -s localhost/tiles/10/578/333.pbf > /dev/null 
-curl -s localhost/tiles/10/578/334.pbf > /dev/null 
-curl -s localhost/tiles/10/578/335.pbf > /dev/null 
-curl -s localhost/tiles/10/578/336.pbf > /dev/null 
-curl -s localhost/tiles/10/578/337.pbf > /dev/null 
-curl -s localhost/tiles/10/578/338.pbf > /dev/null 
-curl -s localhost/tiles/10/578/339.pbf > /dev/null 
-curl -s localhost/tiles/10/578/340.pbf > /dev/null 
-curl -s localhost/tiles/10/578/341.pbf > /dev/null 
-curl -s localhost/tiles/10/578/342.pbf > /dev/null 
-curl -s localhost/tiles/10/578/343.pbf > /dev/null 
-curl -s localhost/tiles/10/578/344.pbf > /dev/null 
-curl -s localhost/tiles/10/578/345.pbf > /dev/null 
-curl -s localhost/tiles/10/578/346.pbf > /dev/null 
-curl -s localhost/tiles/10/578/347.pbf > /dev/null 
-curl -s localhost/tiles/10/578/348.pbf > /dev/null 
-curl -s localhost/tiles/10/578/349.pbf > /dev/null 
-curl -s localhost/tiles/10/578/350.pbf > /dev/null 
-curl -s localhost/tiles/10/578/351.pbf > /dev/null 
-curl -s localhost/tiles/10/579/324.pbf > /dev/null 
-curl -s localhost/tiles/10/579/325.pbf > /dev/null 
-curl -s localhost/tiles/10/579/326.pbf > /dev/null 
-curl -s localhost/tiles/10/579/327.pbf > /dev/null 
-curl -s localhost/tiles/10/579/328.pbf > /dev/null 
-curl -s localhost/tiles/10/579/329.pbf > /dev/null 
-curl -s localhost/tiles/10/579/330.pbf > /dev/null 
-curl -s localhost/tiles/10/579/331.pbf > /dev/null 
-curl -s localhost/tiles/10/579/332.pbf > /dev/null 
-curl -s localhost/tiles/10/579/333.pbf > /dev/null 
-curl -s localhost/tiles/10/579/334.pbf > /dev/null 
-curl -s localhost/tiles/10/579/335.pbf > /dev/null 
-curl -s localhost/tiles/10/579/336.pbf > /dev/null 
-curl -s localhost/tiles/10/579/337.pbf > /dev/null 
-curl -s localhost/tiles/10/579/338.pbf > /dev/null 
-curl -s localhost/tiles/10/579/339.pbf > /dev/null 
-curl -s localhost/tiles/10/579/340.pbf > /dev/null 
-curl -s localhost/tiles/10/579/341.pbf > /dev/null 
-curl -s localhost/tiles/10/579/342.pbf > /dev/null 
-curl -s localhost/tiles/10/579/343.pbf > /dev/null 
-curl -s localhost/tiles/10/579/344.pbf > /dev/null 
-curl -s localhost/tiles/10/579/345.pbf > /dev/null 
-curl -s localhost/tiles/10/579/346.pbf > /dev/null 
-curl -s localhost/tiles/10/579/347.pbf > /dev/null 
-curl -s localhost/tiles/10/579/348.pbf > /dev/null 
-curl -s localhost/tiles/10/579/349.pbf > /dev/null 
-curl -s localhost/tiles/10/579/350.pbf > /dev/null 
-curl -s localhost/tiles/10/579/351.pbf > /dev/null 
-curl -s localhost/tiles/10/580/324.pbf > /dev/null 
-curl -s localhost/tiles/10/580/325.pbf > /dev/null 
-curl -s localhost/tiles/10/580/326.pbf > /dev/null 
-curl -s localhost/tiles/10/580/327.pbf > /dev/null 
-curl -s localhost/tiles/10/580/328.pbf > /dev/null 
-curl -s localhost/tiles/10/580/329.pbf > /dev/null 
-curl -s localhost/tiles/10/580/330.pbf > /dev/null 
-curl -s localhost/tiles/10/580/331.pbf > /dev/null 
-curl -s localhost/tiles/10/580/332.pbf > /dev/null 
-curl -s localhost/tiles/10/580/333.pbf > /dev/null 
-curl -s localhost/tiles/10/580/334.pbf > /dev/null 
-curl -s localhost/tiles/10/580/335.pbf > /dev/null 
-curl -s localhost/tiles/10/580/336.pbf > /dev/null 
-curl -s localhost/tiles/10/580/337.pbf > /dev/null 
-curl -s localhost/tiles/10/580/338.pbf > /dev/null 
-curl -s localhost/tiles/10/580/339.pbf > /dev/null 
-curl -s localhost/tiles/10/580/340.pbf > /dev/null 
-curl -s localhost/tiles/10/580/341.pbf > /dev/null 
-curl -s localhost/tiles/10/580/342.pbf > /dev/null 
-curl -s localhost/tiles/10/580/343.pbf > /dev/null 
-curl -s localhost/tiles/10/580/344.pbf > /dev/null 
-curl -s localhost/tiles/10/580/345.pbf > /dev/null 
-curl -s localhost/tiles/10/580/346.pbf > /dev/null 
-curl -s localhost/tiles/10/580/347.pbf > /dev/null 
-curl -s localhost/tiles/10/580/348.pbf > /dev/null 
-curl -s localhost/tiles/10/580/349.pbf > /dev/null 
-curl -s localhost/tiles/10/580/350.pbf > /dev/null 
-curl -s localhost/tiles/10/580/351.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1103/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1104/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1105/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1106/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1107/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1108/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1109/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1110/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1111/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1112/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1113/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1114/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1115/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1116/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1117/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1118/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1119/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1120/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1121/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1122/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1123/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1124/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1125/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1126/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1127/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1128/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1129/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1130/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1131/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1132/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1133/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1134/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1135/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1136/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1137/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1138/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1139/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1140/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1141/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1142/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1143/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1144/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1145/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1146/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1147/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1148/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1149/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1150/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1151/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1152/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1153/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1154/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1155/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1156/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1157/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1158/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1159/703.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/649.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/650.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/651.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/652.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/653.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/654.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/655.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/656.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/657.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/658.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/659.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/660.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/661.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/662.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/663.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/664.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/665.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/666.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/667.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/668.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/669.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/670.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/671.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/672.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/673.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/674.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/675.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/676.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/677.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/678.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/679.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/680.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/681.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/682.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/683.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/684.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/685.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/686.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/687.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/688.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/689.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/690.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/691.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/692.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/693.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/694.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/695.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/696.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/697.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/698.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/699.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/700.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/701.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/702.pbf > /dev/null 
-curl -s localhost/tiles/11/1160/703.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2207/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2208/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2209/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2210/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2211/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2212/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2213/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2214/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2215/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2216/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2217/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2218/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2219/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2220/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2221/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2222/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2223/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2224/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2225/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2226/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2227/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2228/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2229/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2230/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2231/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2232/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2233/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2234/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2235/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2236/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2237/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2238/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2239/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2240/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2241/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2242/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2243/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2244/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2245/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2246/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2247/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2248/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2249/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2250/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2251/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2252/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2253/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2254/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2255/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2256/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2257/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2258/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2259/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2260/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2261/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2262/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2263/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2264/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2265/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2266/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2267/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2268/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2269/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2270/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2271/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2272/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2273/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2274/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2275/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2276/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2277/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2278/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2279/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2280/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2281/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2282/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2283/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2284/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2285/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2286/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2287/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2288/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2289/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2290/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2291/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2292/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2293/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2294/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2295/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2296/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2297/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2298/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2299/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2300/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2301/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2302/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2303/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2304/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2305/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2306/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2307/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2308/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2309/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2310/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2311/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2312/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2313/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2314/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2315/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2316/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2317/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2318/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2319/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2320/1406.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1298.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1299.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1300.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1301.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1302.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1303.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1304.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1305.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1306.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1307.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1308.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1309.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1310.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1311.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1312.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1313.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1314.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1315.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1316.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1317.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1318.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1319.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1320.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1321.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1322.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1323.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1324.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1325.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1326.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1327.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1328.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1329.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1330.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1331.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1332.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1333.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1334.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1335.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1336.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1337.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1338.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1339.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1340.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1341.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1342.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1343.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1344.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1345.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1346.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1347.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1348.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1349.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1350.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1351.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1352.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1353.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1354.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1355.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1356.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1357.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1358.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1359.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1360.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1361.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1362.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1363.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1364.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1365.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1366.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1367.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1368.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1369.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1370.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1371.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1372.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1373.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1374.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1375.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1376.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1377.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1378.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1379.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1380.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1381.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1382.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1383.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1384.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1385.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1386.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1387.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1388.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1389.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1390.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1391.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1392.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1393.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1394.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1395.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1396.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1397.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1398.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1399.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1400.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1401.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1402.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1403.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1404.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1405.pbf > /dev/null 
-curl -s localhost/tiles/12/2321/1406.pbf > /dev/null 
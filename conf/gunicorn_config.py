@@ -6,5 +6,11 @@ workers = 12 #multiprocessing.cpu_count() * 2 + 1
 access_logfile = "-"
 error_logfile = "-"
 worker_class = "gevent"
+# uncomment to make database calls cooperative so one slow query does not block other requests of the worker
+# raw_env = ["db_green_wait=1"]
+# every worker keeps its own pool of up to `db_pool_max_size` (env, default 5) connections to PostgreSQL
+# and its own in-memory tile cache of up to `tile_cache_max_bytes` (env, default 64MB)
+# newly rendered tiles are stored compressed with `tile_encoding` (env: gzip - default, br - needs brotli, identity)
+# tiles at zoom 13+ are rendered in blocks of `metatile_size` x `metatile_size` tiles (env, default 4)
 # timeout = 300
 
@@ -4,26 +4,31 @@ source /opt/gugik2osm/conf/.env
 
 python3.7 -u /opt/gugik2osm/git/processing/scripts/prg_dl.py --output_dir /opt/gugik2osm/temp >> /opt/gugik2osm/log/prg_processing.log 2>&1
 date >> /opt/gugik2osm/log/prg_processing.log
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/02_Punkty_Adresowe.zip --writer postgresql --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" --prep_tables >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/04_Punkty_Adresowe.zip --writer postgresql --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/06_Punkty_Adresowe.zip --writer postgresql --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/08_Punkty_Adresowe.zip --writer postgresql --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/10_Punkty_Adresowe.zip --writer postgresql --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/12_Punkty_Adresowe.zip --writer postgresql --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/14_Punkty_Adresowe.zip --writer postgresql --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/16_Punkty_Adresowe.zip --writer postgresql --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/18_Punkty_Adresowe.zip --writer postgresql --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/20_Punkty_Adresowe.zip --writer postgresql --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/22_Punkty_Adresowe.zip --writer postgresql --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/24_Punkty_Adresowe.zip --writer postgresql --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/26_Punkty_Adresowe.zip --writer postgresql --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/28_Punkty_Adresowe.zip --writer postgresql --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/30_Punkty_Adresowe.zip --writer postgresql --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/32_Punkty_Adresowe.zip --writer postgresql --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+# geometries have to be loaded as EWKB (tables are created with geometry columns), sql scripts of prg_prepare.py
+# select them straight into geometry columns
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/02_Punkty_Adresowe.zip --writer postgresql --geometry_format wkb --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" --prep_tables >> /opt/gugik2osm/log/prg_processing.log 2>&1
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/04_Punkty_Adresowe.zip --writer postgresql --geometry_format wkb --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/06_Punkty_Adresowe.zip --writer postgresql --geometry_format wkb --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/08_Punkty_Adresowe.zip --writer postgresql --geometry_format wkb --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/10_Punkty_Adresowe.zip --writer postgresql --geometry_format wkb --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/12_Punkty_Adresowe.zip --writer postgresql --geometry_format wkb --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/14_Punkty_Adresowe.zip --writer postgresql --geometry_format wkb --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/16_Punkty_Adresowe.zip --writer postgresql --geometry_format wkb --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/18_Punkty_Adresowe.zip --writer postgresql --geometry_format wkb --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/20_Punkty_Adresowe.zip --writer postgresql --geometry_format wkb --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/22_Punkty_Adresowe.zip --writer postgresql --geometry_format wkb --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/24_Punkty_Adresowe.zip --writer postgresql --geometry_format wkb --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/26_Punkty_Adresowe.zip --writer postgresql --geometry_format wkb --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/28_Punkty_Adresowe.zip --writer postgresql --geometry_format wkb --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/30_Punkty_Adresowe.zip --writer postgresql --geometry_format wkb --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/temp/32_Punkty_Adresowe.zip --writer postgresql --geometry_format wkb --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1
 date >> /opt/gugik2osm/log/prg_processing.log
 python3.7 -u /opt/gugik2osm/git/processing/scripts/prg_prepare.py --full --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" --starting 001_prg_pa_insert.sql >> /opt/gugik2osm/log/prg_processing.log 2>&1
 echo "Finished preparing data" >> /opt/gugik2osm/log/prg_processing.log
 date >> /opt/gugik2osm/log/prg_processing.log
-bash /opt/gugik2osm/conf/cache_low_zoom_tiles.sh
+# tiles were truncated by the full process so checkpoint of the previous run is not valid anymore,
+# after a crash rerun only the seeder command to resume
+rm -f /opt/gugik2osm/tile_seeder.checkpoint
+python3.7 -u /opt/gugik2osm/git/processing/scripts/tile_seeder.py --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" --workers 4 --checkpoint /opt/gugik2osm/tile_seeder.checkpoint >> /opt/gugik2osm/log/prg_processing.log 2>&1
 echo "Finished caching low zoom tiles" >> /opt/gugik2osm/log/prg_processing.log
 date >> /opt/gugik2osm/log/prg_processing.log
@@ -0,0 +1,35 @@
+#!/bin/bash
+
+source /opt/gugik2osm/conf/.env
+
+# full process runs in the first week of a month (TERYT dictionaries and OSM data changes reach unchanged addresses
+# only in full process) and when there are no indexes of the previous load
+if [ "$(date +%-d)" -le 7 ] || ! ls /opt/gugik2osm/prg_index/*.sqlite > /dev/null 2>&1; then
+  echo "Running full process." >> /opt/gugik2osm/log/prg_processing.log
+  exec /opt/gugik2osm/conf/prg_processing_v2.sh
+fi
+
+python3.7 -u /opt/gugik2osm/git/processing/scripts/prg_dl.py --output_dir /opt/gugik2osm/tempprg >> /opt/gugik2osm/log/prg_processing.log 2>&1
+date >> /opt/gugik2osm/log/prg_processing.log
+echo "PRG2PGSQL (incremental)" >> /opt/gugik2osm/log/prg_processing.log
+echo "truncate" >> /opt/gugik2osm/log/prg_processing.log
+psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "truncate table prg.jednostki_administracyjne" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "truncate table prg.miejscowosci" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "truncate table prg.ulice" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "truncate table prg.punkty_adresowe" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+# checkpoints of the previous load don't match truncated tables (the table is created by the parser on its first run)
+psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "delete from prg.parser_checkpoints" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+echo "load" >> /opt/gugik2osm/log/prg_processing.log
+# only address points inserted, updated or deleted since the previous load are written (other records in full),
+# new indexes are written next to the previous ones
+# position in every file is committed with its records, after a crash rerun this command with --resume
+# indexes are replaced only after the change set was applied (nothing runs after a failed step), after a failure
+# the whole script can be run again
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/*_Punkty_Adresowe.zip --writer postgresql_copy --workers 4 --geometry_format wkb --index_directory /opt/gugik2osm/prg_index --checkpoint --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1 \
+  && date >> /opt/gugik2osm/log/prg_processing.log \
+  && python3.7 -u /opt/gugik2osm/git/processing/scripts/prg_prepare.py --incremental --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1 \
+  && python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --commit_index --index_directory /opt/gugik2osm/prg_index >> /opt/gugik2osm/log/prg_processing.log 2>&1
+echo "Finished preparing data" >> /opt/gugik2osm/log/prg_processing.log
+date >> /opt/gugik2osm/log/prg_processing.log
+echo "Done." >> /opt/gugik2osm/log/prg_processing.log
+date >> /opt/gugik2osm/log/prg_processing.log
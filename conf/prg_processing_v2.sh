@@ -4,55 +4,39 @@ source /opt/gugik2osm/conf/.env
 
 python3.7 -u /opt/gugik2osm/git/processing/scripts/prg_dl.py --output_dir /opt/gugik2osm/tempprg >> /opt/gugik2osm/log/prg_processing.log 2>&1
 date >> /opt/gugik2osm/log/prg_processing.log
-echo "PRG2CSV" >> /opt/gugik2osm/log/prg_processing.log
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/02_Punkty_Adresowe.zip --writer csv --csv_directory /opt/gugik2osm/tempprg2 >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/04_Punkty_Adresowe.zip --writer csv --csv_directory /opt/gugik2osm/tempprg2 >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/06_Punkty_Adresowe.zip --writer csv --csv_directory /opt/gugik2osm/tempprg2 >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/08_Punkty_Adresowe.zip --writer csv --csv_directory /opt/gugik2osm/tempprg2 >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/10_Punkty_Adresowe.zip --writer csv --csv_directory /opt/gugik2osm/tempprg2 >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/12_Punkty_Adresowe.zip --writer csv --csv_directory /opt/gugik2osm/tempprg2 >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/14_Punkty_Adresowe.zip --writer csv --csv_directory /opt/gugik2osm/tempprg2 >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/16_Punkty_Adresowe.zip --writer csv --csv_directory /opt/gugik2osm/tempprg2 >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/18_Punkty_Adresowe.zip --writer csv --csv_directory /opt/gugik2osm/tempprg2 >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/20_Punkty_Adresowe.zip --writer csv --csv_directory /opt/gugik2osm/tempprg2 >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/22_Punkty_Adresowe.zip --writer csv --csv_directory /opt/gugik2osm/tempprg2 >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/24_Punkty_Adresowe.zip --writer csv --csv_directory /opt/gugik2osm/tempprg2 >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/26_Punkty_Adresowe.zip --writer csv --csv_directory /opt/gugik2osm/tempprg2 >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/28_Punkty_Adresowe.zip --writer csv --csv_directory /opt/gugik2osm/tempprg2 >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/30_Punkty_Adresowe.zip --writer csv --csv_directory /opt/gugik2osm/tempprg2 >> /opt/gugik2osm/log/prg_processing.log 2>&1
-python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/32_Punkty_Adresowe.zip --writer csv --csv_directory /opt/gugik2osm/tempprg2 >> /opt/gugik2osm/log/prg_processing.log 2>&1
-date >> /opt/gugik2osm/log/prg_processing.log
-echo "CSV2PGSQL" >> /opt/gugik2osm/log/prg_processing.log
+echo "PRG2PGSQL" >> /opt/gugik2osm/log/prg_processing.log
 echo "truncate" >> /opt/gugik2osm/log/prg_processing.log
 psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "truncate table prg.jednostki_administracyjne" >> /opt/gugik2osm/log/prg_processing.log 2>&1
 psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "truncate table prg.miejscowosci" >> /opt/gugik2osm/log/prg_processing.log 2>&1
 psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "truncate table prg.ulice" >> /opt/gugik2osm/log/prg_processing.log 2>&1
 psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "truncate table prg.punkty_adresowe" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+# checkpoints of the previous load don't match truncated tables (the table is created by the parser on its first run)
+psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "delete from prg.parser_checkpoints" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+# geometries are loaded as EWKB so staging tables need geometry columns (no-op on empty tables of earlier installs)
+psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "alter table prg.miejscowosci alter column geometry type geometry using geometry::geometry; alter table prg.ulice alter column geometry type geometry using geometry::geometry; alter table prg.punkty_adresowe alter column geometry type geometry using geometry::geometry" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+# kind of change of address points loaded by incremental load (prg_processing_incremental.sh)
+psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "alter table prg.punkty_adresowe add column if not exists change text" >> /opt/gugik2osm/log/prg_processing.log 2>&1
+# indexes of address points for incremental loads are rebuilt from scratch (without previous index every address
+# point is written as inserted), they replace the previous ones only if the full process succeeds
+rm -rf /opt/gugik2osm/prg_index
+mkdir -p /opt/gugik2osm/prg_index
 echo "load" >> /opt/gugik2osm/log/prg_processing.log
-for infile in /opt/gugik2osm/tempprg2/*JednostkaAdministracyjna*.csv
-do
-  cat $infile | psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "copy prg.jednostki_administracyjne FROM stdin with CSV header delimiter ','" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-done
-for infile in /opt/gugik2osm/tempprg2/*PRG_MiejscowoscNazwa*.csv
-do
-  cat $infile | psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "copy prg.miejscowosci FROM stdin with CSV header delimiter ','" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-done
-for infile in /opt/gugik2osm/tempprg2/*PRG_UlicaNazwa*.csv
-do
-  cat $infile | psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "copy prg.ulice FROM stdin with CSV header delimiter ','" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-done
-for infile in /opt/gugik2osm/tempprg2/*PRG_PunktAdresowy*.csv
-do
-  cat $infile | psql -h $PGHOSTADDR -p $PGPORT -d $PGDATABASE -U $PGUSER -c "copy prg.punkty_adresowe FROM stdin with CSV header delimiter ','" >> /opt/gugik2osm/log/prg_processing.log 2>&1
-done
-python3.7 -u /opt/gugik2osm/git/processing/scripts/prg_prepare.py --full --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" --starting 001_prg_pa_insert.sql >> /opt/gugik2osm/log/prg_processing.log 2>&1
+# parsed records are streamed straight into the staging tables with COPY (no intermediate csv files),
+# voivodeship files are parsed concurrently, one process (and database connection) per worker
+# coordinates are read straight into EWKB so no gml parsing is needed in the database
+# position in every file is committed with its records, after a crash rerun this command with --resume
+# change set is applied and indexes are replaced only if every file was parsed
+python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --input /opt/gugik2osm/tempprg/*_Punkty_Adresowe.zip --writer postgresql_copy --workers 4 --geometry_format wkb --index_directory /opt/gugik2osm/prg_index --checkpoint --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" >> /opt/gugik2osm/log/prg_processing.log 2>&1 \
+  && date >> /opt/gugik2osm/log/prg_processing.log \
+  && python3.7 -u /opt/gugik2osm/git/processing/scripts/prg_prepare.py --full --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" --starting 001_prg_pa_insert.sql >> /opt/gugik2osm/log/prg_processing.log 2>&1 \
+  && python3.7 -u /opt/gugik2osm/git/processing/parsers/prg.py --commit_index --index_directory /opt/gugik2osm/prg_index >> /opt/gugik2osm/log/prg_processing.log 2>&1
 echo "Finished preparing data" >> /opt/gugik2osm/log/prg_processing.log
 date >> /opt/gugik2osm/log/prg_processing.log
-bash /opt/gugik2osm/conf/cache_low_zoom_tiles.sh
+# tiles were truncated by the full process so checkpoint of the previous run is not valid anymore,
+# after a crash rerun only the seeder command to resume
+rm -f /opt/gugik2osm/tile_seeder.checkpoint
+python3.7 -u /opt/gugik2osm/git/processing/scripts/tile_seeder.py --dsn "host=$PGHOSTADDR port=$PGPORT dbname=$PGDATABASE user=$PGUSER password=$PGPASSWORD" --workers 4 --checkpoint /opt/gugik2osm/tile_seeder.checkpoint >> /opt/gugik2osm/log/prg_processing.log 2>&1
 echo "Finished caching low zoom tiles" >> /opt/gugik2osm/log/prg_processing.log
 date >> /opt/gugik2osm/log/prg_processing.log
-date >> /opt/gugik2osm/log/prg_processing.log
-echo "Cleaning temp csv files..." >> /opt/gugik2osm/log/prg_processing.log
-rm /opt/gugik2osm/tempprg2/*.csv
 echo "Done." >> /opt/gugik2osm/log/prg_processing.log
 date >> /opt/gugik2osm/log/prg_processing.log
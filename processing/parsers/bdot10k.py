@@ -7,9 +7,12 @@ from datetime import datetime
 from typing import List, Union, Dict, Set, Tuple, TextIO, BinaryIO
 from collections import OrderedDict
 import argparse
+import time
 
 from lxml import etree
 
+from gml_wkb import gml_to_ewkb, wkb_bbox, PARQUET_CONVERTERS, SQLITE_TYPES, SQLITE_INDEXES
+
 
 lookup_x_kod = {
     'BUBD01': 'budynki mieszkalne jednorodzinne',
@@ -235,6 +238,21 @@ lookup_funSzczegolowaBudynku = {
 }
 
 
+# parquet writer: field -> type of its column (other fields are text, geometry is binary for wkb and text for gml)
+PARQUET_TYPES: Dict[str, str] = {
+    'lokalnyId': 'uuid',
+    'wersjaId': 'timestamp',
+    'czyObiektBDOO': 'bool',
+    'x_doklGeom': 'float',
+    'x_aktualnoscG': 'date',
+    'x_aktualnoscA': 'date',
+    'poczatekWersjiObiektu': 'timestamp',
+    'koniecWersjiObiektu': 'timestamp',
+    'x_dataUtworzenia': 'timestamp',
+    'liczbaKondygnacji': 'int16',
+    'zabytek': 'bool',
+}
+
 class Namespaces:
 
     def __init__(self):
@@ -399,11 +417,16 @@ class Fields:
 
 class XML:
 
-    def __init__(self, namespaces: Namespaces, tags: Tags, fields: Fields):
+    def __init__(self, namespaces: Namespaces, tags: Tags, fields: Fields, geometry_format: str = 'gml'):
         self.NS: Namespaces = namespaces
         self.geometry_names: Set[str] = {'geometria'}
         self.Tags: Tags = tags
         self.Fields: Fields = fields
+        if geometry_format not in ('gml', 'wkb'):
+            raise ValueError(f'Unknown geometry format: {geometry_format}.')
+        self.geometry_format: str = geometry_format
+        # unlike PRG, positions are taken in the order they are in the file (as ST_GeomFromGML does)
+        self.swap_axes: bool = False
 
     @staticmethod
     def me_xml_iterator(context: etree.iterparse) -> etree.Element:
@@ -471,8 +494,11 @@ class XML:
                 result[name] = x.get(self.NS.XLINK) if val is None and x.get(self.NS.XLINK) else val
             # if geometry
             # we want to preserve geometry string in GML format to parse it later
+            # or read its coordinates straight into hex encoded EWKB
             elif x.tag in self.geometry_names:
-                if len(x.getchildren()) > 0:
+                if len(x.getchildren()) > 0 and self.geometry_format == 'wkb':
+                    result['geometry'] = gml_to_ewkb(x.getchildren()[0], self.swap_axes)
+                elif len(x.getchildren()) > 0:
                     # create a new xml node called geometry and add our gml geometry as a child
                     # also get rid of namespaces that are not used
                     gml = etree.Element('geometry', nsmap={'gml': self.NS.NS_GML})
@@ -490,7 +516,7 @@ class XML:
 
 class Parser:
 
-    def __init__(self, file_path: str, only_basic_fields=False):
+    def __init__(self, file_path: str, only_basic_fields=False, geometry_format: str = 'gml'):
         if len(file_path) == 0:
             raise AttributeError('List of file paths must not be empty.')
 
@@ -516,7 +542,7 @@ class Parser:
         if self.powiat:
             self.Fields.BUBD['powiat'] = None
 
-        self.XML: XML = XML(self.NS, self.Tags, self.Fields)
+        self.XML: XML = XML(self.NS, self.Tags, self.Fields, geometry_format)
 
         self.file_path: str = file_path
         self.size_mb: float = round(getsize(self.file_path) / 1024 / 1024, 4)
@@ -558,9 +584,11 @@ class Parser:
 
 class SQL:
     """Base class for writer classes that put data into sql databases.
-    Currently syntax is compatible with PostgreSQL and SQLite. (For sqlite schema should be empty)"""
+    Currently syntax is compatible with PostgreSQL and SQLite. (For sqlite schema should be empty)
+    All columns are text except geometry column which gets geometry_type and columns with types in column_types."""
 
-    def __init__(self, tags: Tags, fields: Fields, schema: Union[str, None], prep_st_placeholder: str):
+    def __init__(self, tags: Tags, fields: Fields, schema: Union[str, None], prep_st_placeholder: str,
+                 geometry_type: str = 'text', column_types: Union[Dict[str, str], None] = None):
         self.table_name_mappings: Dict[str, str] = {
             tags.BUBD: 'stg_budynki_ogolne_poligony',
         }
@@ -576,7 +604,10 @@ class SQL:
             self.sql_drop += 'DROP TABLE IF EXISTS ' + self.tab_classifier + self.table_name_mappings.get(tag) + ' CASCADE;\n'
             self.sql_create += 'CREATE TABLE ' + self.tab_classifier + self.table_name_mappings.get(tag) + '('
             for column in fields.tag[tag]:
-                self.sql_create += column + ' text, '  # all columns are text
+                if column == 'geometry':
+                    self.sql_create += column + ' ' + geometry_type + ', '
+                else:
+                    self.sql_create += column + ' ' + (column_types or {}).get(column, 'text') + ', '
             # remove comma and a space at the end and add closing parenthesis
             self.sql_create = self.sql_create[:-2] + ');\n'
 
@@ -600,11 +631,14 @@ class SQL:
 
 class PostgreSQLWriter(SQL):
 
-    def __init__(self, prg_file_path: str, dsn: str, schema: Union[str, None] = 'bdot', only_basic_fields: bool = False):
-        self.Parser: Parser = Parser(prg_file_path, only_basic_fields)
+    def __init__(self, prg_file_path: str, dsn: str, schema: Union[str, None] = 'bdot', only_basic_fields: bool = False,
+                 geometry_format: str = 'gml'):
+        self.Parser: Parser = Parser(prg_file_path, only_basic_fields, geometry_format)
         self.dsn: str = dsn
         self.schema: str = schema
-        super().__init__(self.Parser.Tags, self.Parser.Fields, schema, '%s')
+        self.geometry_format: str = geometry_format
+        super().__init__(self.Parser.Tags, self.Parser.Fields, schema, '%s',
+                         'geometry' if geometry_format == 'wkb' else 'text')
 
     def run(self, prepare_tables: bool = False, commit_every: int = 50000) -> None:
         import psycopg2
@@ -672,6 +706,8 @@ class PostgreSQLWriter(SQL):
             t_lookup_funSzczegolowaBudynku = f"{self.schema + '.' if self.schema else ''}lookup_funSzczegolowaBudynku"
             v_name = f"{self.schema + '.' if self.schema else ''}v_bubd_a"
             t_bubd_a = f"{self.schema + '.' if self.schema else ''}" + self.table_name_mappings.get(self.Parser.Tags.BUBD)
+            geom_a_2180 = 'geometry' if self.geometry_format == 'wkb' else \
+                'ST_GeomFromGML(SUBSTRING(geometry, 54, length(geometry) - 64))'
             query = f"""
                 CREATE OR REPLACE VIEW {v_name} as
                     SELECT 
@@ -690,7 +726,7 @@ class PostgreSQLWriter(SQL):
                         cast(x_aktualnosca as date) aktualnosc_atrybutow,
                         cast(koniecwersjiobiektu as timestamp) koniecwersjiobiektu,
                         kodkst kod_kst,
-                        ST_GeomFromGML(SUBSTRING(geometry, 54, length(geometry) - 64)) geom_a_2180
+                        {geom_a_2180} geom_a_2180
                     FROM {t_bubd_a}
                     LEFT JOIN {t_lookup_x_kod} using (x_kod)
                     LEFT JOIN {t_lookup_x_katIstnienia} using (x_katIstnienia)
@@ -701,25 +737,190 @@ class PostgreSQLWriter(SQL):
             conn.commit()
 
 
-class SQLiteWriter(SQL):
+class PostgreSQLCopyWriter(SQL):
+    """Loads records with COPY ... FROM STDIN instead of INSERT statements. Records are serialized as csv
+    into an in-memory buffer per table and every buffer is streamed to its table with COPY
+    as soon as it grows over buffer_size bytes, so memory usage is bounded regardless of the size of the file."""
 
-    def __init__(self, prg_file_path: str, db_file_path: str, only_basic_fields: bool = False):
-        self.Parser: Parser = Parser(prg_file_path, only_basic_fields)
+    def __init__(self, prg_file_path: str, dsn: str, schema: Union[str, None] = 'bdot', only_basic_fields: bool = False,
+                 buffer_size: int = 16 * 1024 * 1024, geometry_format: str = 'gml'):
+        self.Parser: Parser = Parser(prg_file_path, only_basic_fields, geometry_format)
+        self.dsn: str = dsn
+        self.buffer_size: int = buffer_size
+        super().__init__(self.Parser.Tags, self.Parser.Fields, schema, '%s',
+                         'geometry' if geometry_format == 'wkb' else 'text')
+        self.sql_copy: Dict[str, str] = {
+            self.Parser.Tags.no_ns[tag]: 'COPY {0}{1} ({2}) FROM STDIN WITH (FORMAT csv)'.format(
+                self.tab_classifier,
+                self.table_name_mappings.get(tag),
+                ', '.join(self.Parser.Fields.tag[tag])
+            )
+            for tag in self.Parser.Tags.list()
+        }
+
+    def run(self, prepare_tables: bool = False) -> None:
+        import csv
+        import io
+        import psycopg2
+        with psycopg2.connect(self.dsn) as conn:
+            cursor = conn.cursor()
+            if prepare_tables:
+                cursor.execute(self.sql_drop)
+                cursor.execute(self.sql_create)
+                conn.commit()
+
+            buffers: Dict[str, io.StringIO] = {typ: io.StringIO() for typ in self.sql_copy}
+            writers: dict = {typ: csv.writer(buf, lineterminator='\n') for typ, buf in buffers.items()}
+            rows: Dict[str, int] = {typ: 0 for typ in self.sql_copy}
+            sts = time.perf_counter()
+
+            def flush(typ: str) -> None:
+                buf = buffers[typ]
+                if buf.tell() == 0:
+                    return
+                buf.seek(0)
+                cursor.copy_expert(self.sql_copy[typ], buf)
+                buf.seek(0)
+                buf.truncate()
+
+            i = 0  # counter for records
+            for typ, vals in self.Parser.iterator():
+                writers[typ].writerow(vals)
+                rows[typ] += 1
+                i += 1
+                if buffers[typ].tell() >= self.buffer_size:
+                    flush(typ)
+                    print(i, 'records copied,', f'{i / (time.perf_counter() - sts):.0f} rows/s')
+            for typ in buffers:
+                flush(typ)
+            conn.commit()
+            elapsed = time.perf_counter() - sts
+            print(i, 'records copied in', f'{elapsed:.1f}s,', f'{i / elapsed if elapsed else 0:.0f} rows/s',
+                  '(' + ', '.join(f'{self.Parser.Tags.no_ns2short[typ]}: {n}' for typ, n in rows.items()) + ')')
+
+
+class SQLiteWriter(SQL):
+    """With typed_columns columns get types of SQLITE_TYPES (uuids and wkb geometries are blobs, numbers
+    are integers or reals, dates stay text), otherwise all columns are text."""
+
+    # pragmas of bulk load (run_bulk), they can be overridden, e.g. {'synchronous': 'NORMAL'}
+    BULK_PRAGMAS: Dict[str, str] = {
+        'journal_mode': 'OFF',
+        'synchronous': 'OFF',
+        'locking_mode': 'EXCLUSIVE',
+        'temp_store': 'MEMORY',
+        'cache_size': '-262144',  # in KiB when negative: 256 MB
+        'mmap_size': '1073741824',
+    }
+
+    def __init__(self, prg_file_path: str, db_file_path: str, only_basic_fields: bool = False,
+                 geometry_format: str = 'gml', typed_columns: bool = False):
+        self.Parser: Parser = Parser(prg_file_path, only_basic_fields, geometry_format)
         self.db_file_path: str = db_file_path
-        super().__init__(self.Parser.Tags, self.Parser.Fields, None, '?')
+        self.geometry_format: str = geometry_format
+        # record type -> functions converting values of its columns (None for values written as they are)
+        self.converters: Dict[str, list] = {}
+        column_types = None
+        if typed_columns:
+            column_types = {field: SQLITE_TYPES[typ] for field, typ in PARQUET_TYPES.items()}
+            for tag in self.Parser.Tags.list():
+                types = ['wkb' if f == 'geometry' and geometry_format == 'wkb' else PARQUET_TYPES.get(f, 'text')
+                         for f in self.Parser.Fields.tag[tag]]
+                self.converters[self.Parser.Tags.no_ns[tag]] = [
+                    PARQUET_CONVERTERS[t] if SQLITE_TYPES[t] != 'text' else None for t in types
+                ]
+        super().__init__(self.Parser.Tags, self.Parser.Fields, None, '?',
+                         'blob' if typed_columns and geometry_format == 'wkb' else 'text', column_types)
+        # R*Trees of geometries (see create_indexes) are dropped with their tables
+        for tag in self.Parser.Tags.list():
+            if 'geometry' in self.Parser.Fields.tag[tag]:
+                self.sql_drop += 'DROP TABLE IF EXISTS rtree_' + self.table_name_mappings[tag] + '_geometry;\n'
+
+    def records(self) -> Tuple[str, list]:
+        """Yields records of the parser with values converted for typed columns."""
+        for typ, vals in self.Parser.iterator():
+            converters = self.converters.get(typ)
+            if converters is not None:
+                vals = [convert(val) if convert is not None and val is not None else val
+                        for convert, val in zip(converters, vals)]
+            yield typ, vals
+
+    def create_indexes(self, db) -> None:
+        """Creates indexes of identifiers (SQLITE_INDEXES) and, for wkb geometries, R*Trees of their bounding boxes
+        (rtree_<table>_geometry with rowid of the record as id, the same layout as in GeoPackage). R*Tree gets
+        only rows added since it was filled last time. Rowids of the tables may be changed by VACUUM,
+        which isn't needed anyway as indexes are built after the load."""
+        for tag in self.Parser.Tags.list():
+            table = self.table_name_mappings[tag]
+            fields = self.Parser.Fields.tag[tag]
+            for column in SQLITE_INDEXES:
+                if column in fields:
+                    db.execute(f'CREATE INDEX IF NOT EXISTS {table}_{column.lower()} ON {table} ({column})')
+            if 'geometry' not in fields or self.geometry_format != 'wkb':
+                continue
+            rtree = f'rtree_{table}_geometry'
+            db.execute(f'CREATE VIRTUAL TABLE IF NOT EXISTS {rtree} USING rtree(id, minx, maxx, miny, maxy)')
+            last_id = db.execute(f'SELECT coalesce(max(id), 0) FROM {rtree}').fetchone()[0]
+            rows = db.execute(f'SELECT rowid, geometry FROM {table} WHERE rowid > ? AND geometry IS NOT NULL',
+                              (last_id,))
+            # geometries of text columns are hex encoded
+            bboxes = ((rowid, wkb_bbox(geom if isinstance(geom, bytes) else bytes.fromhex(geom)))
+                      for rowid, geom in rows)
+            db.executemany(f'INSERT INTO {rtree} VALUES (?, ?, ?, ?, ?)',
+                           ((rowid,) + bbox for rowid, bbox in bboxes if bbox is not None))
+
+    def run_bulk(self, prepare_tables: bool = False, batch_size: int = 10000,
+                 pragmas: Union[Dict[str, str], None] = None, create_indexes: bool = True) -> int:
+        """High-throughput load for building new databases (e.g. extracts): records are inserted with executemany
+        in batches of batch_size in a single transaction, with BULK_PRAGMAS updated with pragmas. Indexes are created
+        after the load (when many files are loaded into one database pass create_indexes with the last one only),
+        so they are built at once and don't slow down inserts. Database isn't journaled nor synced by default,
+        a failed load has to be started from scratch."""
+        import sqlite3
+        db = sqlite3.connect(self.db_file_path, isolation_level=None)  # transaction is controlled explicitly
+        try:
+            for name, value in dict(self.BULK_PRAGMAS, **(pragmas or {})).items():
+                db.execute(f'PRAGMA {name}={value}')
+            if prepare_tables:
+                db.executescript(self.sql_drop.replace(' CASCADE', ''))  # there is no cascade in sqlite
+                db.executescript(self.sql_create)
+
+            sts = time.perf_counter()
+            db.execute('BEGIN')
+            batches: Dict[str, list] = {typ: [] for typ in self.sql_insert}
+            i = 0  # counter for records
+            for typ, vals in self.records():
+                batch = batches[typ]
+                batch.append(vals)
+                if len(batch) >= batch_size:
+                    db.executemany(self.sql_insert[typ], batch)
+                    batch.clear()
+                i += 1
+            for typ, batch in batches.items():
+                if batch:
+                    db.executemany(self.sql_insert[typ], batch)
+            print(i, f'records loaded in {time.perf_counter() - sts:.1f}s')
+            if create_indexes:
+                sts = time.perf_counter()
+                self.create_indexes(db)
+                print(f'indexes created in {time.perf_counter() - sts:.1f}s')
+            db.execute('COMMIT')
+        finally:
+            db.close()
+        return i
 
     def run(self, prepare_tables: bool = False, commit_every: int = 50000):
         import sqlite3
         with sqlite3.connect(self.db_file_path) as db:
             cursor = db.cursor()
             if prepare_tables:
-                db.executescript(self.sql_drop)
+                db.executescript(self.sql_drop.replace(' CASCADE', ''))  # there is no cascade in sqlite
                 db.executescript('PRAGMA journal_mode=WAL;')  # enable WAL, supposedly faster
                 db.executescript(self.sql_create)
                 db.commit()
 
             i = 0  # counter for inserts
-            for typ, vals in self.Parser.iterator():
+            for typ, vals in self.records():
                 cursor.execute(self.sql_insert.get(typ), vals)
                 if i % commit_every == 0:
                     print(i, 'commit')
@@ -731,8 +932,9 @@ class SQLiteWriter(SQL):
 
 class CSVWriter:
 
-    def __init__(self, prg_file_path: str, output_directory: str, only_basic_fields: bool = False):
-        self.Parser: Parser = Parser(prg_file_path, only_basic_fields)
+    def __init__(self, prg_file_path: str, output_directory: str, only_basic_fields: bool = False,
+                 geometry_format: str = 'gml'):
+        self.Parser: Parser = Parser(prg_file_path, only_basic_fields, geometry_format)
         self.output_dir: str = output_directory
         prg_fn = os.path.basename(prg_file_path).split('.')[0]
         self.output_file_paths: dict = {
@@ -759,10 +961,84 @@ class CSVWriter:
             f.close()
 
 
+class ParquetWriter:
+    """Writes every record type to its own compressed Parquet file with typed columns (see PARQUET_TYPES),
+    geometries are binary (WKB) with geometry_format wkb. Values are buffered by columns and every row_group_size
+    records of a type are written as a row group, so memory usage depends on row_group_size only.
+    Requires pyarrow."""
+
+    def __init__(self, prg_file_path: str, output_directory: str, only_basic_fields: bool = False,
+                 geometry_format: str = 'gml', row_group_size: int = 100000, compression: str = 'zstd'):
+        self.Parser: Parser = Parser(prg_file_path, only_basic_fields, geometry_format)
+        self.output_dir: str = output_directory
+        self.geometry_format: str = geometry_format
+        self.row_group_size: int = row_group_size
+        self.compression: str = compression
+        prg_fn = os.path.basename(prg_file_path).split('.')[0]
+        self.output_file_paths: dict = {
+            self.Parser.Tags.no_ns[x]: join(output_directory, prg_fn + '_' + self.Parser.Tags.no_ns[x] + '.parquet')
+            for x in self.Parser.Tags.list()
+        }
+
+    def column_types(self, typ: str) -> List[str]:
+        """Returns types of columns (see PARQUET_CONVERTERS) of the record type, 'text' for text columns."""
+        types = []
+        for field in self.Parser.Fields.tag[self.Parser.Tags.with_ns[typ]]:
+            if field == 'geometry':
+                types.append('wkb' if self.geometry_format == 'wkb' else 'text')
+            else:
+                types.append(PARQUET_TYPES.get(field, 'text'))
+        return types
+
+    def run(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        arrow_types = {
+            'text': pa.string(),
+            'uuid': pa.binary(16),
+            'timestamp': pa.timestamp('s'),
+            'date': pa.date32(),
+            'int16': pa.int16(),
+            'float': pa.float64(),
+            'bool': pa.bool_(),
+            'wkb': pa.binary(),
+        }
+        converters: Dict[str, list] = {}
+        schemas: dict = {}
+        writers: dict = {}
+        columns: Dict[str, List[list]] = {}
+        for typ, fp in self.output_file_paths.items():
+            types = self.column_types(typ)
+            fields = self.Parser.Fields.tag[self.Parser.Tags.with_ns[typ]]
+            converters[typ] = [PARQUET_CONVERTERS.get(t) for t in types]
+            schemas[typ] = pa.schema([pa.field(f, arrow_types[t]) for f, t in zip(fields, types)])
+            writers[typ] = pq.ParquetWriter(fp, schemas[typ], compression=self.compression)
+            columns[typ] = [[] for _ in fields]
+
+        def flush(typ: str) -> None:
+            if len(columns[typ][0]) == 0:
+                return
+            arrays = [pa.array(col, type=field.type) for col, field in zip(columns[typ], schemas[typ])]
+            writers[typ].write_table(pa.Table.from_arrays(arrays, schema=schemas[typ]))
+            columns[typ] = [[] for _ in columns[typ]]
+
+        try:
+            for typ, vals in self.Parser.iterator():
+                for col, convert, val in zip(columns[typ], converters[typ], vals):
+                    col.append(convert(val) if convert is not None and val is not None else val)
+                if len(columns[typ][0]) >= self.row_group_size:
+                    flush(typ)
+            for typ in columns:
+                flush(typ)
+        finally:
+            for w in writers.values():
+                w.close()
+
+
 class StdOutWriter:
 
-    def __init__(self, prg_file_path: str, only_basic_fields: bool = False):
-        self.Parser: Parser = Parser(prg_file_path, only_basic_fields)
+    def __init__(self, prg_file_path: str, only_basic_fields: bool = False, geometry_format: str = 'gml'):
+        self.Parser: Parser = Parser(prg_file_path, only_basic_fields, geometry_format)
 
     def run(self, limit: Union[int, None] = None):
         import csv
@@ -777,6 +1053,9 @@ class StdOutWriter:
                 break
             writer.writerow(vals)
             stdout.write(self.Parser.Tags.no_ns2short[typ] + '|' + strio.getvalue())
+            # reuse the buffer, otherwise every line would contain all previous records
+            strio.seek(0)
+            strio.truncate()
             i += 1
 
 
@@ -791,13 +1070,33 @@ if __name__ == '__main__':
         else:
             raise argparse.ArgumentTypeError('Boolean value expected.')
 
+    def sqlite_pragma(v: str) -> Tuple[str, str]:
+        match = re.fullmatch(r'(\w+)=(-?\w+)', v)
+        if match is None:
+            raise argparse.ArgumentTypeError('Pragma expected as name=value, e.g. synchronous=NORMAL.')
+        return match.group(1), match.group(2)
+
 
     parser = argparse.ArgumentParser()
     parser.add_argument('--input', help='File paths to the input files. (provide one or more)', nargs='+')
-    parser.add_argument('--writer', help='Writer to use.', choices=('csv', 'sqlite', 'postgresql', 'stdout'), nargs=1)
+    parser.add_argument('--writer', help='Writer to use.',
+                        choices=('csv', 'parquet', 'sqlite', 'postgresql', 'postgresql_copy', 'stdout'), nargs=1)
     parser.add_argument('--csv_directory', help='Directory for csv files when using csv writer.', nargs=1)
+    parser.add_argument('--parquet_directory', help='Directory for parquet files when using parquet writer.', nargs=1)
+    parser.add_argument('--row_group_size', help='Number of records in a row group of parquet files.', nargs=1,
+                        type=int, default=[100000])
     parser.add_argument('--sqlite_file', help='Filepath for SQLite database when using sqlite writer.', nargs=1)
-    parser.add_argument('--dsn', help='Connection string for PostgreSQL when using postgresql writer.', nargs=1)
+    parser.add_argument('--sqlite_bulk', help='Fast load of sqlite writer for building new databases: batched inserts '
+                                              'in a single transaction without journal, indexes and R*Trees of '
+                                              'geometries (wkb) created after the load.', action='store_true')
+    parser.add_argument('--sqlite_typed_columns', help='Typed columns of sqlite writer (uuids and wkb geometries '
+                                                       'as blobs, numbers as integers or reals).', action='store_true')
+    parser.add_argument('--sqlite_batch_size', help='Number of records inserted at once by sqlite bulk load.',
+                        nargs=1, type=int, default=[10000])
+    parser.add_argument('--sqlite_pragmas', help='Pragmas of sqlite bulk load overriding the defaults, '
+                                                 'e.g. synchronous=NORMAL cache_size=-65536 mmap_size=0.',
+                        nargs='+', type=sqlite_pragma, default=[])
+    parser.add_argument('--dsn', help='Connection string for PostgreSQL when using postgresql writers.', nargs=1)
     parser.add_argument('--prep_tables', help='Drop and create tables when using db writers.',
                         nargs='?',
                         type=str2bool,
@@ -821,11 +1120,15 @@ if __name__ == '__main__':
                         nargs='?',
                         type=str2bool,
                         const=True)
+    parser.add_argument('--geometry_format', help='Format of geometries: gml (default) or hex encoded EWKB (wkb), '
+                                                  'postgresql writers create geometry columns for wkb.',
+                        choices=('gml', 'wkb'), nargs=1, default=['gml'])
     args = vars(parser.parse_args())
 
     params = {}
 
     file_paths = args['input']
+    geometry_format = args['geometry_format'][0]
 
     for idx, file_path in enumerate(file_paths):
         print(str(idx+1).zfill(3), '-', file_path)
@@ -836,18 +1139,35 @@ if __name__ == '__main__':
             params = {}
 
         if args['writer'][0] == 'stdout':
-            StdOutWriter(file_path, only_basic_fields=args['basic_fields']).run(limit=args['limit'][0] if args['limit'] else None)
+            StdOutWriter(file_path, only_basic_fields=args['basic_fields'], geometry_format=geometry_format).run(
+                limit=args['limit'][0] if args['limit'] else None)
         elif args['writer'][0] == 'csv':
-            CSVWriter(file_path, args['csv_directory'][0], only_basic_fields=args['basic_fields']).run(
+            CSVWriter(file_path, args['csv_directory'][0], only_basic_fields=args['basic_fields'],
+                      geometry_format=geometry_format).run(
                 headers=args['csv_headers'][0] if args['csv_headers'] is not None else True)
+        elif args['writer'][0] == 'parquet':
+            ParquetWriter(file_path, args['parquet_directory'][0], only_basic_fields=args['basic_fields'],
+                          geometry_format=geometry_format, row_group_size=args['row_group_size'][0]).run()
         elif args['writer'][0] == 'sqlite':
-            SQLiteWriter(file_path, args['sqlite_file'][0], only_basic_fields=args['basic_fields']).run(**params)
+            sqlite_writer = SQLiteWriter(file_path, args['sqlite_file'][0], only_basic_fields=args['basic_fields'],
+                                         geometry_format=geometry_format,
+                                         typed_columns=args['sqlite_typed_columns'])
+            if args['sqlite_bulk']:
+                # indexes are created once, after the last file
+                sqlite_writer.run_bulk(batch_size=args['sqlite_batch_size'][0], pragmas=dict(args['sqlite_pragmas']),
+                                       create_indexes=idx == len(file_paths) - 1, **params)
+            else:
+                sqlite_writer.run(**params)
         elif args['writer'][0] == 'postgresql':
-            pgw = PostgreSQLWriter(file_path, args['dsn'][0], only_basic_fields=args['basic_fields'])
+            pgw = PostgreSQLWriter(file_path, args['dsn'][0], only_basic_fields=args['basic_fields'],
+                                   geometry_format=geometry_format)
             pgw.run(**params)
             if idx == 0 and args['create_lookup_tables']:
                 pgw.create_lookup_tables()
             if idx == 0 and args['create_view']:
                 pgw.create_view()
+        elif args['writer'][0] == 'postgresql_copy':
+            PostgreSQLCopyWriter(file_path, args['dsn'][0], only_basic_fields=args['basic_fields'],
+                                 geometry_format=geometry_format).run(**params)
         else:
             print(args)
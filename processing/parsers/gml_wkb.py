@@ -0,0 +1,148 @@
+"""Helpers shared by PRG and BDOT10k parsers: conversion of gml geometries to EWKB, bounding boxes of EWKB
+and conversion of text values of fields to values of typed columns (parquet and sqlite writers)."""
+import re
+import struct
+import uuid
+from datetime import datetime, date, timezone
+from typing import List, Union, Dict, Tuple, Callable
+
+from lxml import etree
+
+
+# gml geometry name -> wkb geometry type
+WKB_TYPES: Dict[str, int] = {
+    'Point': 1,
+    'LineString': 2,
+    'Polygon': 3,
+    'MultiPoint': 4,
+    'MultiCurve': 5,
+    'MultiLineString': 5,
+    'MultiSurface': 6,
+    'MultiPolygon': 6
+}
+EWKB_Z: int = 0x80000000
+EWKB_SRID: int = 0x20000000
+
+
+def gml_to_ewkb(geom: etree.Element, swap_axes: bool, srid: int = 2180) -> str:
+    """Helper function. Returns gml geometry (Point, LineString, Polygon or their multi versions) as hex encoded
+    EWKB (little endian). SRID is taken from srsName attribute of the geometry if it's there.
+    If swap_axes is True positions are read as "y x" and written as x, y."""
+    srs_name = geom.get('srsName')
+    if srs_name:
+        re_srid = re.search(r'(\d+)$', srs_name)
+        if re_srid:
+            srid = int(re_srid.group(1))
+    return _wkb_geometry(geom, swap_axes, int(geom.get('srsDimension', 2)), srid).hex()
+
+
+def _wkb_geometry(geom: etree.Element, swap_axes: bool, dim: int, srid: Union[int, None] = None) -> bytes:
+    """Helper function. Returns WKB of gml geometry, with SRID (EWKB) if srid is given."""
+    name = etree.QName(geom).localname
+    typ = WKB_TYPES.get(name)
+    if typ is None:
+        raise ValueError(f'Geometry type {name} is not supported.')
+    if typ == 1:
+        body = _wkb_coordinates(geom, swap_axes, dim)[1]
+    elif typ == 2:
+        body = b''.join(_wkb_coordinates(geom, swap_axes, dim))
+    elif typ == 3:
+        # exterior ring comes first in the document, interior rings follow
+        rings = [b''.join(_wkb_coordinates(ring, swap_axes, dim)) for ring in geom.iter('{*}LinearRing')]
+        body = struct.pack('<I', len(rings)) + b''.join(rings)
+    else:
+        # members (e.g. surfaceMember) hold one geometry each, plural members (e.g. surfaceMembers) hold many
+        parts = [_wkb_geometry(part, swap_axes, dim) for member in geom for part in member]
+        body = struct.pack('<I', len(parts)) + b''.join(parts)
+    if dim == 3:
+        typ |= EWKB_Z
+    if srid is None:
+        return struct.pack('<BI', 1, typ) + body
+    return struct.pack('<BII', 1, typ | EWKB_SRID, srid) + body
+
+
+def _wkb_coordinates(el: etree.Element, swap_axes: bool, dim: int) -> Tuple[bytes, bytes]:
+    """Helper function. Returns number of points and packed coordinates of all gml:pos/gml:posList of the element."""
+    values: List[float] = []
+    for pos in el.iter('{*}pos', '{*}posList'):
+        values.extend(float(v) for v in (pos.text or '').split())
+    if swap_axes:
+        values[0::dim], values[1::dim] = values[1::dim], values[0::dim]
+    return struct.pack('<I', len(values) // dim), struct.pack(f'<{len(values)}d', *values)
+
+
+def wkb_bbox(wkb: bytes) -> Union[Tuple[float, float, float, float], None]:
+    """Helper function. Returns bounding box (minx, maxx, miny, maxy) of (E)WKB geometry written by gml_to_ewkb
+    (little endian), None for empty geometries."""
+    xs: List[float] = []
+    ys: List[float] = []
+    _wkb_bbox_helper(wkb, 0, xs, ys)
+    if not xs:
+        return None
+    return min(xs), max(xs), min(ys), max(ys)
+
+
+def _wkb_bbox_helper(wkb: bytes, offset: int, xs: List[float], ys: List[float]) -> int:
+    """Helper function. Collects coordinates of geometry starting at offset, returns offset of the end of geometry."""
+    typ = struct.unpack_from('<I', wkb, offset + 1)[0]
+    offset += 9 if typ & EWKB_SRID else 5
+    dim = 3 if typ & EWKB_Z else 2
+    typ &= 0xFF
+    if typ > 3:
+        parts = struct.unpack_from('<I', wkb, offset)[0]
+        offset += 4
+        for _ in range(parts):
+            offset = _wkb_bbox_helper(wkb, offset, xs, ys)
+        return offset
+    if typ == 3:
+        rings = struct.unpack_from('<I', wkb, offset)[0]
+        offset += 4
+    else:
+        rings = 1
+    for _ in range(rings):
+        if typ == 1:
+            n = 1
+        else:
+            n = struct.unpack_from('<I', wkb, offset)[0]
+            offset += 4
+        coordinates = struct.unpack_from(f'<{n * dim}d', wkb, offset)
+        xs.extend(coordinates[0::dim])
+        ys.extend(coordinates[1::dim])
+        offset += 8 * n * dim
+    return offset
+
+
+def to_timestamp(value: str) -> datetime:
+    """Parses xsd:dateTime, times with time zone are converted to UTC (columns are without time zone)."""
+    ts = datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return ts
+
+
+# type of a parquet column -> function converting text value of a field to value of the column
+PARQUET_CONVERTERS: Dict[str, Callable] = {
+    'uuid': lambda v: uuid.UUID(v).bytes,
+    'timestamp': to_timestamp,
+    'date': lambda v: date.fromisoformat(v[:10]),
+    'int16': int,
+    'float': float,
+    'bool': lambda v: v in ('true', '1'),
+    'wkb': bytes.fromhex,
+}
+
+# sqlite writer with typed columns: type of a parquet column -> type of sqlite column, dates and timestamps stay
+# ISO text (sqlite has no date type, its date functions work on text), values of other types are converted
+# with PARQUET_CONVERTERS (bools are stored as 0/1)
+SQLITE_TYPES: Dict[str, str] = {
+    'text': 'text',
+    'uuid': 'blob',
+    'timestamp': 'text',
+    'date': 'text',
+    'int16': 'integer',
+    'float': 'real',
+    'bool': 'integer',
+    'wkb': 'blob',
+}
+# columns indexed by sqlite writer (if record type has them)
+SQLITE_INDEXES: Tuple[str, ...] = ('gmlid', 'lokalnyId')
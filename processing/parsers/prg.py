@@ -9,9 +9,17 @@ from datetime import datetime
 from typing import List, Union, Dict, Set, Tuple, TextIO, BinaryIO
 from collections import OrderedDict
 import argparse
+import hashlib
+import json
+import multiprocessing
+import sys
+import time
+import uuid
 
 from lxml import etree
 
+from gml_wkb import gml_to_ewkb, wkb_bbox, PARQUET_CONVERTERS, SQLITE_TYPES, SQLITE_INDEXES
+
 
 def incremented_name(name: str) -> str:
     """Helper function. Returns name with the next number.
@@ -39,6 +47,16 @@ def fix_typo(name: str) -> str:
     return 'jednostkaAdministracyjna' if name == 'jednostkaAdmnistracyjna' else name
 
 
+# parquet writer: field -> type of its column (other fields are text, geometry is binary for wkb and text for gml)
+PARQUET_TYPES: Dict[str, str] = {
+    'lokalnyId': 'uuid',
+    'wersjaId': 'timestamp',
+    'poczatekWersjiObiektu': 'timestamp',
+    'koniecWersjiObiektu': 'timestamp',
+    'waznyOd': 'date',
+    'waznyDo': 'date',
+}
+
 class Namespaces:
 
     def __init__(self):
@@ -266,12 +284,34 @@ class Fields:
 
 
 class XML:
-
-    def __init__(self, namespaces: Namespaces, tags: Tags, fields: Fields):
+    # what to do with an element (child of a record)
+    NESTED = 0  # walk its children
+    GEOMETRY = 1  # serialize its child as gml (or ewkb)
+    SKIP = 2  # ignore it with its whole subtree
+    # number of names of a repeated field compiled up front, more are compiled when a record has more occurrences
+    MAX_REPEATS = 100
+
+    def __init__(self, namespaces: Namespaces, tags: Tags, fields: Fields, geometry_format: str = 'gml'):
         self.NS: Namespaces = namespaces
         self.geometry_names: Set[str] = {'pozycja', 'geometria'}
+        # elements of the PRG schema holding other elements -> fields in their subtrees,
+        # subtrees without any of the fields of the record type are skipped
+        self.container_fields: Dict[str, Set[str]] = {
+            'idIIP': {'lokalnyId', 'przestrzenNazw', 'wersjaId'},
+            'BT_Identyfikator': {'lokalnyId', 'przestrzenNazw', 'wersjaId'},
+            'cyklZycia': {'poczatekWersjiObiektu', 'koniecWersjiObiektu'},
+            'BT_CyklZyciaInfo': {'poczatekWersjiObiektu', 'koniecWersjiObiektu'},
+        }
         self.Tags: Tags = tags
         self.Fields: Fields = fields
+        if geometry_format not in ('gml', 'wkb'):
+            raise ValueError(f'Unknown geometry format: {geometry_format}.')
+        self.geometry_format: str = geometry_format
+        # positions in PRG files are in "y x" order (axis order of EPSG:2180)
+        self.swap_axes: bool = True
+        # record type -> tag of its descendant (with namespace) -> entry created by _compile_tag,
+        # filled when the tag is seen for the first time so fields shouldn't be changed after parsing started
+        self._dispatch: Dict[str, Dict[str, Tuple[int, Tuple[str, ...]]]] = {}
 
     @staticmethod
     def me_xml_iterator(context: etree.iterparse) -> etree.Element:
@@ -286,74 +326,187 @@ class XML:
 
     def parse_element(self, el: etree.Element) -> Tuple[str, Dict[str, str]]:
         """Function that parses an element.
-        Gets element 'gmlid' then recursively calls helper function for every value in an element."""
-
-        parsed = self._parse_element_helper(
-            el,
-            (
-                el.tag,
-                {'gmlid': el.get('{' + self.NS.NS_GML + '}id')}
-            )
-        )
-        return parsed
+        Gets element 'gmlid' then walks element's children using dispatch table of the record type."""
+
+        typ = el.tag
+        table = self._dispatch.get(typ)
+        if table is None:
+            table = self._dispatch[typ] = {}
+        result = {'gmlid': el.get('{' + self.NS.NS_GML + '}id')}
+        # number of occurrences of every field so far, repeated fields get incremented names
+        counters = {'gmlid': 1}
+        self._parse_children(el, typ, table, result, counters)
+        return typ, result
 
-    def _parse_element_helper(
+    def _compile_tag(self, typ: str, tag) -> Tuple[int, Tuple[str, ...]]:
+        """Returns entry of the dispatch table for given tag (with namespace) of a child of a record of type typ:
+        what to do with the element and names of columns for its consecutive occurrences (if it's a field)."""
+        if not isinstance(tag, str):  # comments and processing instructions
+            return self.SKIP, ()
+        name = fix_typo(tag.split('}', 1)[-1])
+        if name in self.geometry_names:
+            # geometry is serialized only if it's one of the fields
+            action = self.GEOMETRY if 'geometry' in self.Fields.tag[typ] else self.SKIP
+        elif name in self.container_fields:
+            # containers of the schema are walked only if they hold any of the fields
+            action = self.NESTED if any(f in self.Fields.tag[typ] for f in self.container_fields[name]) else self.SKIP
+        else:
+            action = self.NESTED
+        if name not in self.Fields.tag[typ]:
+            return action, ()
+        names = [name]
+        while len(names) < self.MAX_REPEATS:
+            names.append(incremented_name(names[-1]))
+        return action, tuple(names)
+
+    def _parse_children(
             self,
             el: etree.Element,
-            carryover_values: Tuple[str, Dict[str, Union[str, None]]]
-    ) -> Tuple[str, Dict[str, str]]:
-        """Method called recursively to parse all element's values."""
+            typ: str,
+            table: Dict[str, Tuple[int, Tuple[str, ...]]],
+            result: Dict[str, Union[str, None]],
+            counters: Dict[str, int]
+    ) -> None:
+        """Flattens values of element's descendants into result."""
 
-        typ, result = carryover_values
         for x in el:
-            # remove namespace from tag
-            if x.prefix:
-                x.tag = etree.QName(x).localname
-            name = fix_typo(x.tag)
+            entry = table.get(x.tag)
+            if entry is None:
+                entry = table[x.tag] = self._compile_tag(typ, x.tag)
+            action, names = entry
 
             # if no children and fields in the list of fields we want the values of
             # add data to dictionary
-            if len(list(x)) == 0 and name in self.Fields.tag[typ]:
+            if names and len(x) == 0:
                 # some tags appear multiple times with different values
                 # but not attribute to make them distinct
-                # so if we already have a key present
-                # create new key with appended 2 digit number
-                # if tag has empty text but contains xlink xref attribute
-                # then take that as a value
-                if name in result:
-                    last_name = sorted([x for x in result.keys() if str(x).startswith(name)], reverse=True)[0]
-                    name = incremented_name(last_name)
+                # so every next occurrence gets a name with appended 2 digit number
+                n = counters.get(names[0], 0)
+                counters[names[0]] = n + 1
+                if n >= len(names):
+                    # more occurrences than compiled names, compile the next ones
+                    while n >= len(names):
+                        names += (incremented_name(names[-1]),)
+                    table[x.tag] = action, names
                 # if value or href link start with url 'http://geoportal.gov.pl/PZGIK/dane/',
                 # remove it as it is not necessary
-                if x.text and x.text.startswith('http://geoportal.gov.pl'):
-                    val = str(x.text)[35:]
-                elif x.text is None and x.get(self.NS.XLINK) and x.get(self.NS.XLINK).startswith('http://geoportal.gov.pl'):
-                    val = str(x.get(self.NS.XLINK))[35:]
+                # if tag has empty text but contains xlink xref attribute
+                # then take that as a value
+                text = x.text
+                if text is None:
+                    href = x.get(self.NS.XLINK)
+                    val = href[35:] if href and href.startswith('http://geoportal.gov.pl') else href
+                elif text.startswith('http://geoportal.gov.pl'):
+                    val = text[35:]
                 else:
-                    val = x.text
-                result[name] = x.get(self.NS.XLINK) if val is None and x.get(self.NS.XLINK) else val
+                    val = text
+                result[names[n]] = val
             # if geometry
             # we want to preserve geometry string in GML format to parse it later
-            elif x.tag in self.geometry_names:
-                if len(x.getchildren()) > 0:
+            # or read its coordinates straight into hex encoded EWKB
+            elif action == self.GEOMETRY:
+                if len(x) > 0 and self.geometry_format == 'wkb':
+                    result['geometry'] = gml_to_ewkb(x[0], self.swap_axes)
+                elif len(x) > 0:
                     # create a new xml node called geometry and add our gml geometry as a child
                     # also get rid of namespaces that are not used
                     gml = etree.Element('geometry', nsmap={'gml': self.NS.NS_GML})
-                    gml.insert(0, x.getchildren()[0])
+                    gml.insert(0, x[0])
                     result['geometry'] = etree.tostring(gml, pretty_print=False).decode()
                 else:  # null geometry
                     result['geometry'] = None
             # if nested
             # go into the element
             # we want to flatten the document into a table
-            else:
-                self._parse_element_helper(x, (typ, result))
-        return typ, result
+            elif action == self.NESTED and len(x) > 0:
+                self._parse_children(x, typ, table, result, counters)
+
+
+class ChangeIndex:
+    """On-disk (SQLite) index of address points of the previous load of a file: lokalnyId -> (wersjaId, hash).
+    Hash is a 64 bit digest of all values of the record (including geometry so the geometry format of loads
+    should stay the same). Index of the current load is written to a temporary file (path + '.tmp') which is
+    renamed to path + '.new' only when the whole file was parsed (close), and that one replaces the previous
+    index only when commit_index is called, i.e. after the change set was applied to the database, so a failed
+    load can be repeated and an index of a failed load is never committed."""
+
+    def __init__(self, path: str):
+        import sqlite3
+        self.path: str = path
+        self.new_path: str = path + '.new'
+        self.tmp_path: str = path + '.tmp'
+        # index of an earlier load which wasn't committed must not be committed after this one fails
+        for p in (self.new_path, self.tmp_path):
+            if os.path.exists(p):
+                os.remove(p)
+        self.db = sqlite3.connect(self.tmp_path)
+        self.db.execute('PRAGMA journal_mode=OFF')
+        self.db.execute('PRAGMA synchronous=OFF')
+        self.db.execute('CREATE TABLE records (lokalnyid BLOB PRIMARY KEY, wersjaid TEXT, hash BLOB) WITHOUT ROWID')
+        self.has_previous: bool = os.path.exists(path)
+        if self.has_previous:
+            self.db.execute('ATTACH DATABASE ? AS previous', (path,))
+
+    @staticmethod
+    def key(lokalnyid: str) -> Union[bytes, str]:
+        """Identifiers are UUIDs stored as 16 bytes, anything else is stored as text."""
+        try:
+            return uuid.UUID(lokalnyid).bytes
+        except (ValueError, TypeError, AttributeError):
+            return lokalnyid
+
+    def change(self, lokalnyid: str, wersjaid: Union[str, None], vals: List[str]) -> Union[str, None]:
+        """Records the address point in the new index.
+        Returns 'insert' or 'update' if it's new or changed since the previous load, None if it's unchanged."""
+        key = self.key(lokalnyid)
+        digest = hashlib.blake2b(
+            '\x1f'.join('\x00' if v is None else v for v in vals).encode('UTF-8'),
+            digest_size=8
+        ).digest()
+        self.db.execute('INSERT OR REPLACE INTO records VALUES (?, ?, ?)', (key, wersjaid, digest))
+        if not self.has_previous:
+            return 'insert'
+        previous = self.db.execute('SELECT wersjaid, hash FROM previous.records WHERE lokalnyid = ?', (key,)).fetchone()
+        if previous is None:
+            return 'insert'
+        if previous[0] != wersjaid or previous[1] != digest:
+            return 'update'
+        return None
+
+    def deleted(self) -> List[str]:
+        """Returns lokalnyId of address points of the previous load missing from the current one."""
+        if not self.has_previous:
+            return []
+        # ordered so the same change set is returned when a load is resumed from a checkpoint
+        rows = self.db.execute(
+            'SELECT lokalnyid FROM previous.records EXCEPT SELECT lokalnyid FROM main.records ORDER BY 1'
+        )
+        return [str(uuid.UUID(bytes=k)) if isinstance(k, bytes) else k for k, in rows]
+
+    def close(self) -> None:
+        """Publishes the index of the current load, call it only after all records were read."""
+        self.db.commit()
+        self.db.close()
+        os.replace(self.tmp_path, self.new_path)
+
+
+def change_index_path(index_directory: str, file_path: str) -> str:
+    """Returns path of the change index of given PRG file (every file has its own index)."""
+    return join(index_directory, os.path.basename(file_path).split('.')[0] + '.sqlite')
+
+
+def commit_change_indexes(index_directory: str) -> int:
+    """Replaces previous indexes with the ones written by the last load. Returns number of replaced indexes."""
+    new_indexes = [f for f in os.listdir(index_directory) if f.endswith('.sqlite.new')]
+    for f in new_indexes:
+        os.replace(join(index_directory, f), join(index_directory, f[:-len('.new')]))
+    return len(new_indexes)
 
 
 class Parser:
 
-    def __init__(self, file_path: str, only_basic_fields=False):
+    def __init__(self, file_path: str, only_basic_fields=False, geometry_format: str = 'gml',
+                 index_path: Union[str, None] = None):
         if len(file_path) == 0:
             raise AttributeError('List of file paths must not be empty.')
 
@@ -374,15 +527,42 @@ class Parser:
         self.file_obj.seek(0)  # go back to beginning of file after reading first lines for updating namespaces
         self.Tags: Tags = Tags(self.NS)
         self.Fields: Fields = Fields(self.Tags, only_basic_fields)
-        self.XML: XML = XML(self.NS, self.Tags, self.Fields)
+        # with change index only address points inserted, updated or deleted since the previous load are returned
+        # and their kind of change is in an additional column, deleted ones have only lokalnyId and change
+        self.index_path: Union[str, None] = index_path
+        if index_path:
+            self.Fields.PA['change'] = None
+        self.XML: XML = XML(self.NS, self.Tags, self.Fields, geometry_format)
 
         self.file_path: str = file_path
         self.size_mb: float = round(getsize(self.file_path) / 1024 / 1024, 4)
+        # record type -> number of returned records and gmlid of the last one (updated by iterator)
+        self.position: Dict[str, Tuple[int, Union[str, None]]] = {}
 
-    def iterator(self) -> Tuple[str, List[str]]:
-        """Method iterates over elements yielding values for every element."""
+    def iterator(self, skip: Union[Dict[str, Tuple[int, Union[str, None]]], None] = None) -> Tuple[str, List[str]]:
+        """Method iterates over elements yielding values for every element.
+        Records already written before a restart are skipped: skip is a checkpoint of a writer (record type ->
+        number of written records of the type and gmlid of the last one), the records are only matched by tag
+        (not parsed, except address points when change index is used as it has to get all of them) and gmlid
+        of the last one has to match. Position of the iterator in the same format is kept in self.position."""
 
         tags_to_read = self.Tags.list()
+        self.position = {self.Tags.no_ns[tag]: (0, None) for tag in tags_to_read}
+        self.position.update({typ: tuple(pos) for typ, pos in (skip or {}).items()})
+        remaining = {typ: pos[0] for typ, pos in (skip or {}).items() if pos[0] > 0}
+
+        def skipped(typ: str, gmlid: Union[str, None]) -> bool:
+            n = remaining.get(typ)
+            if not n:
+                return False
+            if n > 1:
+                remaining[typ] = n - 1
+            else:
+                del remaining[typ]
+                if gmlid != skip[typ][1]:
+                    raise ValueError(f'Checkpoint does not match file {self.file_path}: last written {typ} '
+                                     f'should be {skip[typ][1]}, found {gmlid}.')
+            return True
 
         # create context for xml parser iterator
         context = etree.iterparse(
@@ -392,16 +572,46 @@ class Parser:
             remove_blank_text=True
         )
 
+        index = ChangeIndex(self.index_path) if self.index_path else None
+        gmlid_attribute = '{' + self.NS.NS_GML + '}id'
         # parse file
         try:
             # iterate over elements
             for el in self.XML.me_xml_iterator(context):
+                if remaining and (index is None or el.tag != self.Tags.PA) \
+                        and skipped(self.Tags.no_ns[el.tag], el.get(gmlid_attribute)):
+                    continue
                 # parse element
                 typ, result = self.XML.parse_element(el)
                 vals = [result.get(k) for k in self.Fields.tag[typ]]
+                if index is not None and typ == self.Tags.PA:
+                    change = index.change(result.get('lokalnyId'), result.get('wersjaId'), vals[:-1])
+                    if change is None:
+                        continue
+                    vals[-1] = change
+                    if remaining and skipped(self.Tags.no_ns[typ], result['gmlid']):
+                        continue
+                self.position[self.Tags.no_ns[typ]] = (self.position[self.Tags.no_ns[typ]][0] + 1, result['gmlid'])
                 # yield results as tuple with first element being tag of record and second being a list of values
                 yield self.Tags.no_ns[typ], vals
 
+            if index is not None:
+                typ = self.Tags.no_ns[self.Tags.PA]
+                fields = list(self.Fields.PA)
+                for lokalnyid in index.deleted():
+                    if remaining and skipped(typ, None):
+                        continue
+                    vals = [None] * len(fields)
+                    vals[fields.index('lokalnyId')] = lokalnyid
+                    vals[-1] = 'delete'
+                    self.position[typ] = (self.position[typ][0] + 1, None)
+                    yield typ, vals
+                index.close()
+
+            if remaining:
+                raise ValueError(f'Checkpoint does not match file {self.file_path}: it has less records than '
+                                 f'were written ({", ".join(f"{typ}: {n}" for typ, n in remaining.items())} missing).')
+
         except Exception:
             print('-' * 10)
             print(datetime.now().isoformat(), '- something went wrong while parsing:')
@@ -412,9 +622,11 @@ class Parser:
 
 class SQL:
     """Base class for writer classes that put data into sql databases.
-    Currently syntax is compatible with PostgreSQL and SQLite. (For sqlite schema should be empty)"""
+    Currently syntax is compatible with PostgreSQL and SQLite. (For sqlite schema should be empty)
+    All columns are text except geometry column which gets geometry_type and columns with types in column_types."""
 
-    def __init__(self, tags: Tags, fields: Fields, schema: Union[str, None], prep_st_placeholder: str):
+    def __init__(self, tags: Tags, fields: Fields, schema: Union[str, None], prep_st_placeholder: str,
+                 geometry_type: str = 'text', column_types: Union[Dict[str, str], None] = None):
         self.table_name_mappings: Dict[str, str] = {
             tags.JA: 'jednostki_administracyjne',
             tags.MSC: 'miejscowosci',
@@ -433,7 +645,10 @@ class SQL:
             self.sql_drop += 'DROP TABLE IF EXISTS ' + self.tab_classifier + self.table_name_mappings.get(tag) + ';\n'
             self.sql_create += 'CREATE TABLE ' + self.tab_classifier + self.table_name_mappings.get(tag) + '('
             for column in fields.tag[tag]:
-                self.sql_create += column + ' text, '  # all columns are text
+                if column == 'geometry':
+                    self.sql_create += column + ' ' + geometry_type + ', '
+                else:
+                    self.sql_create += column + ' ' + (column_types or {}).get(column, 'text') + ', '
             # remove comma and a space at the end and add closing parenthesis
             self.sql_create = self.sql_create[:-2] + ');\n'
 
@@ -456,6 +671,17 @@ class SQL:
             tags.no_ns[tags.UL]: self.sql_insert_ul
         }
 
+        # checkpoints (positions in input files, see Parser.iterator) are saved in the same transaction
+        # as the records so after a restart nothing is written twice, the table isn't dropped with the others
+        self.sql_checkpoint_create: str = 'CREATE TABLE IF NOT EXISTS {0}parser_checkpoints ' \
+                                          '(file_name text PRIMARY KEY, position text)'.format(self.tab_classifier)
+        self.sql_checkpoint_select: str = 'SELECT position FROM {0}parser_checkpoints WHERE file_name = {1}'.format(
+            self.tab_classifier, prep_st_placeholder)
+        self.sql_checkpoint_delete: str = 'DELETE FROM {0}parser_checkpoints WHERE file_name = {1}'.format(
+            self.tab_classifier, prep_st_placeholder)
+        self.sql_checkpoint_insert: str = 'INSERT INTO {0}parser_checkpoints VALUES ({1}, {1})'.format(
+            self.tab_classifier, prep_st_placeholder)
+
     def create_tables(self, conn) -> None:
         cursor = conn.cursor()
         cursor.execute(self.sql_drop)
@@ -465,98 +691,437 @@ class SQL:
     def inserter(self, cursor, typ: str, vals: List[str]) -> None:
         cursor.execute(self.sql_insert.get(typ), vals)
 
+    def start_checkpoints(self, cursor, file_path: str, resume: bool) -> Union[Dict[str, list], None]:
+        """Creates table for checkpoints if needed. Returns checkpoint of the file when resuming (None if there is
+        none), otherwise removes it right away: records may be committed much later (COPY writer commits
+        with its first flush) and a crash before that must not leave the checkpoint of the previous load."""
+        cursor.execute(self.sql_checkpoint_create)
+        file_name = os.path.basename(file_path)
+        if resume:
+            cursor.execute(self.sql_checkpoint_select, (file_name,))
+            row = cursor.fetchone()
+            return json.loads(row[0]) if row else None
+        cursor.execute(self.sql_checkpoint_delete, (file_name,))
+        cursor.connection.commit()
+        return None
+
+    def save_checkpoint(self, cursor, file_path: str, position: Dict[str, Tuple[int, Union[str, None]]]) -> None:
+        """Saves position in the file, it's committed together with records."""
+        file_name = os.path.basename(file_path)
+        cursor.execute(self.sql_checkpoint_delete, (file_name,))
+        cursor.execute(self.sql_checkpoint_insert, (file_name, json.dumps(position)))
+
 
 class PostgreSQLWriter(SQL):
 
-    def __init__(self, prg_file_path: str, dsn: str, schema: Union[str, None] = 'prg', only_basic_fields: bool = False):
-        self.Parser: Parser = Parser(prg_file_path, only_basic_fields)
+    def __init__(self, prg_file_path: str, dsn: str, schema: Union[str, None] = 'prg', only_basic_fields: bool = False,
+                 geometry_format: str = 'gml',
+                 index_path: Union[str, None] = None):
+        self.Parser: Parser = Parser(prg_file_path, only_basic_fields, geometry_format, index_path)
         self.dsn: str = dsn
-        super().__init__(self.Parser.Tags, self.Parser.Fields, schema, '%s')
+        super().__init__(self.Parser.Tags, self.Parser.Fields, schema, '%s',
+                         'geometry' if geometry_format == 'wkb' else 'text')
 
-    def run(self, prepare_tables: bool = False, commit_every: int = 50000) -> None:
+    def run(self, prepare_tables: bool = False, commit_every: int = 50000, checkpoint: bool = False,
+            resume: bool = False) -> int:
+        """With checkpoint (or resume) position in the file is saved with every commit,
+        resume skips records committed before (tables are not prepared then)."""
         import psycopg2
         with psycopg2.connect(self.dsn) as conn:
             cursor = conn.cursor()
-            if prepare_tables:
+            skip = self.start_checkpoints(cursor, self.Parser.file_path, resume) if checkpoint or resume else None
+            if skip:
+                print('resuming from checkpoint:', skip)
+            elif prepare_tables:
                 cursor.execute(self.sql_drop)
                 cursor.execute(self.sql_create)
                 conn.commit()
 
             i = 0  # counter for inserts
-            for typ, vals in self.Parser.iterator():
+            for typ, vals in self.Parser.iterator(skip):
                 cursor.execute(self.sql_insert.get(typ), vals)
                 if i % commit_every == 0:
                     print(i, 'commit')
+                    if checkpoint or resume:
+                        self.save_checkpoint(cursor, self.Parser.file_path, self.Parser.position)
                     conn.commit()
                 i += 1
+            if checkpoint or resume:
+                self.save_checkpoint(cursor, self.Parser.file_path, self.Parser.position)
             conn.commit()
             print(i, 'commit.')
+        return i
 
 
-class SQLiteWriter(SQL):
+class PostgreSQLCopyWriter(SQL):
+    """Loads records with COPY ... FROM STDIN instead of INSERT statements. Records are serialized as csv
+    into an in-memory buffer per table and every buffer is streamed to its table with COPY
+    as soon as it grows over buffer_size bytes, so memory usage is bounded regardless of the size of the file."""
 
-    def __init__(self, prg_file_path: str, db_file_path: str, only_basic_fields: bool = False):
-        self.Parser: Parser = Parser(prg_file_path, only_basic_fields)
+    def __init__(self, prg_file_path: str, dsn: str, schema: Union[str, None] = 'prg', only_basic_fields: bool = False,
+                 buffer_size: int = 16 * 1024 * 1024, geometry_format: str = 'gml',
+                 index_path: Union[str, None] = None):
+        self.Parser: Parser = Parser(prg_file_path, only_basic_fields, geometry_format, index_path)
+        self.dsn: str = dsn
+        self.buffer_size: int = buffer_size
+        super().__init__(self.Parser.Tags, self.Parser.Fields, schema, '%s',
+                         'geometry' if geometry_format == 'wkb' else 'text')
+        self.sql_copy: Dict[str, str] = {
+            self.Parser.Tags.no_ns[tag]: 'COPY {0}{1} ({2}) FROM STDIN WITH (FORMAT csv)'.format(
+                self.tab_classifier,
+                self.table_name_mappings.get(tag),
+                ', '.join(self.Parser.Fields.tag[tag])
+            )
+            for tag in self.Parser.Tags.list()
+        }
+
+    def run(self, prepare_tables: bool = False, checkpoint: bool = False, resume: bool = False) -> int:
+        """With checkpoint (or resume) every COPY is committed together with position of its table in the file
+        (by default records are committed once at the end), resume skips records committed before
+        (tables are not prepared then)."""
+        import csv
+        import io
+        import psycopg2
+        with psycopg2.connect(self.dsn) as conn:
+            cursor = conn.cursor()
+            skip = self.start_checkpoints(cursor, self.Parser.file_path, resume) if checkpoint or resume else None
+            if skip:
+                print('resuming from checkpoint:', skip)
+            elif prepare_tables:
+                cursor.execute(self.sql_drop)
+                cursor.execute(self.sql_create)
+                conn.commit()
+            # tables are flushed separately so every one of them has its own committed position
+            committed: Dict[str, Tuple[int, Union[str, None]]] = dict(skip or {})
+
+            buffers: Dict[str, io.StringIO] = {typ: io.StringIO() for typ in self.sql_copy}
+            writers: dict = {typ: csv.writer(buf, lineterminator='\n') for typ, buf in buffers.items()}
+            rows: Dict[str, int] = {typ: 0 for typ in self.sql_copy}
+            sts = time.perf_counter()
+
+            def flush(typ: str) -> None:
+                buf = buffers[typ]
+                if buf.tell() == 0:
+                    return
+                buf.seek(0)
+                cursor.copy_expert(self.sql_copy[typ], buf)
+                buf.seek(0)
+                buf.truncate()
+                if checkpoint or resume:
+                    committed[typ] = self.Parser.position[typ]
+                    self.save_checkpoint(cursor, self.Parser.file_path, committed)
+                    conn.commit()
+
+            i = 0  # counter for records
+            for typ, vals in self.Parser.iterator(skip):
+                writers[typ].writerow(vals)
+                rows[typ] += 1
+                i += 1
+                if buffers[typ].tell() >= self.buffer_size:
+                    flush(typ)
+                    print(i, 'records copied,', f'{i / (time.perf_counter() - sts):.0f} rows/s')
+            for typ in buffers:
+                flush(typ)
+            conn.commit()
+            elapsed = time.perf_counter() - sts
+            print(i, 'records copied in', f'{elapsed:.1f}s,', f'{i / elapsed if elapsed else 0:.0f} rows/s',
+                  '(' + ', '.join(f'{self.Parser.Tags.no_ns2short[typ]}: {n}' for typ, n in rows.items()) + ')')
+        return i
+
+
+class SQLiteWriter(SQL):
+    """With typed_columns columns get types of SQLITE_TYPES (uuids and wkb geometries are blobs, numbers
+    are integers or reals, dates stay text), otherwise all columns are text."""
+
+    # pragmas of bulk load (run_bulk), they can be overridden, e.g. {'synchronous': 'NORMAL'}
+    BULK_PRAGMAS: Dict[str, str] = {
+        'journal_mode': 'OFF',
+        'synchronous': 'OFF',
+        'locking_mode': 'EXCLUSIVE',
+        'temp_store': 'MEMORY',
+        'cache_size': '-262144',  # in KiB when negative: 256 MB
+        'mmap_size': '1073741824',
+    }
+
+    def __init__(self, prg_file_path: str, db_file_path: str, only_basic_fields: bool = False,
+                 geometry_format: str = 'gml',
+                 index_path: Union[str, None] = None, typed_columns: bool = False):
+        self.Parser: Parser = Parser(prg_file_path, only_basic_fields, geometry_format, index_path)
         self.db_file_path: str = db_file_path
-        super().__init__(self.Parser.Tags, self.Parser.Fields, None, '?')
+        self.geometry_format: str = geometry_format
+        # record type -> functions converting values of its columns (None for values written as they are)
+        self.converters: Dict[str, list] = {}
+        column_types = None
+        if typed_columns:
+            column_types = {field: SQLITE_TYPES[typ] for field, typ in PARQUET_TYPES.items()}
+            for tag in self.Parser.Tags.list():
+                types = ['wkb' if f == 'geometry' and geometry_format == 'wkb' else PARQUET_TYPES.get(f, 'text')
+                         for f in self.Parser.Fields.tag[tag]]
+                self.converters[self.Parser.Tags.no_ns[tag]] = [
+                    PARQUET_CONVERTERS[t] if SQLITE_TYPES[t] != 'text' else None for t in types
+                ]
+        super().__init__(self.Parser.Tags, self.Parser.Fields, None, '?',
+                         'blob' if typed_columns and geometry_format == 'wkb' else 'text', column_types)
+        # R*Trees of geometries (see create_indexes) are dropped with their tables
+        for tag in self.Parser.Tags.list():
+            if 'geometry' in self.Parser.Fields.tag[tag]:
+                self.sql_drop += 'DROP TABLE IF EXISTS rtree_' + self.table_name_mappings[tag] + '_geometry;\n'
+
+    def records(self, skip: Union[Dict[str, Tuple[int, Union[str, None]]], None] = None) -> Tuple[str, list]:
+        """Yields records of the parser with values converted for typed columns."""
+        for typ, vals in self.Parser.iterator(skip):
+            converters = self.converters.get(typ)
+            if converters is not None:
+                vals = [convert(val) if convert is not None and val is not None else val
+                        for convert, val in zip(converters, vals)]
+            yield typ, vals
+
+    def create_indexes(self, db) -> None:
+        """Creates indexes of identifiers (SQLITE_INDEXES) and, for wkb geometries, R*Trees of their bounding boxes
+        (rtree_<table>_geometry with rowid of the record as id, the same layout as in GeoPackage). R*Tree gets
+        only rows added since it was filled last time. Rowids of the tables may be changed by VACUUM,
+        which isn't needed anyway as indexes are built after the load."""
+        for tag in self.Parser.Tags.list():
+            table = self.table_name_mappings[tag]
+            fields = self.Parser.Fields.tag[tag]
+            for column in SQLITE_INDEXES:
+                if column in fields:
+                    db.execute(f'CREATE INDEX IF NOT EXISTS {table}_{column.lower()} ON {table} ({column})')
+            if 'geometry' not in fields or self.geometry_format != 'wkb':
+                continue
+            rtree = f'rtree_{table}_geometry'
+            db.execute(f'CREATE VIRTUAL TABLE IF NOT EXISTS {rtree} USING rtree(id, minx, maxx, miny, maxy)')
+            last_id = db.execute(f'SELECT coalesce(max(id), 0) FROM {rtree}').fetchone()[0]
+            rows = db.execute(f'SELECT rowid, geometry FROM {table} WHERE rowid > ? AND geometry IS NOT NULL',
+                              (last_id,))
+            # geometries of text columns are hex encoded
+            bboxes = ((rowid, wkb_bbox(geom if isinstance(geom, bytes) else bytes.fromhex(geom)))
+                      for rowid, geom in rows)
+            db.executemany(f'INSERT INTO {rtree} VALUES (?, ?, ?, ?, ?)',
+                           ((rowid,) + bbox for rowid, bbox in bboxes if bbox is not None))
+
+    def run_bulk(self, prepare_tables: bool = False, batch_size: int = 10000,
+                 pragmas: Union[Dict[str, str], None] = None, create_indexes: bool = True) -> int:
+        """High-throughput load for building new databases (e.g. extracts): records are inserted with executemany
+        in batches of batch_size in a single transaction, with BULK_PRAGMAS updated with pragmas. Indexes are created
+        after the load (when many files are loaded into one database pass create_indexes with the last one only),
+        so they are built at once and don't slow down inserts. Database isn't journaled nor synced by default,
+        a failed load has to be started from scratch (checkpoints are not supported)."""
+        import sqlite3
+        db = sqlite3.connect(self.db_file_path, isolation_level=None)  # transaction is controlled explicitly
+        try:
+            for name, value in dict(self.BULK_PRAGMAS, **(pragmas or {})).items():
+                db.execute(f'PRAGMA {name}={value}')
+            if prepare_tables:
+                db.executescript(self.sql_drop)
+                db.executescript(self.sql_create)
 
-    def run(self, prepare_tables: bool = False, commit_every: int = 50000):
+            sts = time.perf_counter()
+            db.execute('BEGIN')
+            batches: Dict[str, list] = {typ: [] for typ in self.sql_insert}
+            i = 0  # counter for records
+            for typ, vals in self.records():
+                batch = batches[typ]
+                batch.append(vals)
+                if len(batch) >= batch_size:
+                    db.executemany(self.sql_insert[typ], batch)
+                    batch.clear()
+                i += 1
+            for typ, batch in batches.items():
+                if batch:
+                    db.executemany(self.sql_insert[typ], batch)
+            print(i, f'records loaded in {time.perf_counter() - sts:.1f}s')
+            if create_indexes:
+                sts = time.perf_counter()
+                self.create_indexes(db)
+                print(f'indexes created in {time.perf_counter() - sts:.1f}s')
+            db.execute('COMMIT')
+        finally:
+            db.close()
+        return i
+
+    def run(self, prepare_tables: bool = False, commit_every: int = 50000, checkpoint: bool = False,
+            resume: bool = False) -> int:
+        """With checkpoint (or resume) position in the file is saved with every commit,
+        resume skips records committed before (tables are not prepared then)."""
         import sqlite3
         with sqlite3.connect(self.db_file_path) as db:
             cursor = db.cursor()
-            if prepare_tables:
+            skip = self.start_checkpoints(cursor, self.Parser.file_path, resume) if checkpoint or resume else None
+            if skip:
+                print('resuming from checkpoint:', skip)
+            elif prepare_tables:
                 db.executescript(self.sql_drop)
                 db.executescript('PRAGMA journal_mode=WAL;')  # enable WAL, supposedly faster
                 db.executescript(self.sql_create)
                 db.commit()
 
             i = 0  # counter for inserts
-            for typ, vals in self.Parser.iterator():
+            for typ, vals in self.records(skip):
                 cursor.execute(self.sql_insert.get(typ), vals)
                 if i % commit_every == 0:
                     print(i, 'commit')
+                    if checkpoint or resume:
+                        self.save_checkpoint(cursor, self.Parser.file_path, self.Parser.position)
                     db.commit()
                 i += 1
+            if checkpoint or resume:
+                self.save_checkpoint(cursor, self.Parser.file_path, self.Parser.position)
             db.commit()
             print(i, 'commit.')
+        return i
 
 
 class CSVWriter:
 
-    def __init__(self, prg_file_path: str, output_directory: str, only_basic_fields: bool = False):
-        self.Parser: Parser = Parser(prg_file_path, only_basic_fields)
+    def __init__(self, prg_file_path: str, output_directory: str, only_basic_fields: bool = False,
+                 geometry_format: str = 'gml',
+                 index_path: Union[str, None] = None):
+        self.Parser: Parser = Parser(prg_file_path, only_basic_fields, geometry_format, index_path)
         self.output_dir: str = output_directory
         prg_fn = os.path.basename(prg_file_path).split('.')[0]
         self.output_file_paths: dict = {
             self.Parser.Tags.no_ns[x]: join(output_directory, prg_fn + '_' + self.Parser.Tags.no_ns[x] + '.csv')
             for x in self.Parser.Tags.list()
         }
-
-    def run(self, headers: bool = True):
+        self.checkpoint_file_path: str = join(output_directory, prg_fn + '_checkpoint.json')
+
+    def save_checkpoint(self, fcon: dict) -> None:
+        """Saves position in the file and sizes of csv files (after their content is on disk)."""
+        sizes = {}
+        for typ, f in fcon.items():
+            f.flush()
+            os.fsync(f.fileno())
+            sizes[typ] = os.path.getsize(self.output_file_paths[typ])
+        with open(self.checkpoint_file_path + '.tmp', 'w', encoding='UTF-8') as f:
+            json.dump({'position': self.Parser.position, 'sizes': sizes}, f)
+        os.replace(self.checkpoint_file_path + '.tmp', self.checkpoint_file_path)
+
+    def run(self, headers: bool = True, checkpoint: bool = False, resume: bool = False,
+            checkpoint_every: int = 50000) -> int:
+        """With checkpoint (or resume) position in the file is saved every checkpoint_every records,
+        resume skips records written before and removes the ones written after the checkpoint from csv files."""
         import csv
+        skip, sizes = None, {}
+        if resume and os.path.exists(self.checkpoint_file_path):
+            with open(self.checkpoint_file_path, 'r', encoding='UTF-8') as f:
+                state = json.load(f)
+            skip, sizes = state['position'], state['sizes']
+            print('resuming from checkpoint:', skip)
+        elif os.path.exists(self.checkpoint_file_path):
+            os.remove(self.checkpoint_file_path)
+
         writers: dict = {}
         fcon: dict = {}
         for typ, fp in self.output_file_paths.items():
-            if headers:
+            if skip is not None:
+                os.truncate(fp, sizes[typ])
+            elif headers:
                 with open(fp, 'w', encoding='UTF-8', newline='') as f:
                     csv.DictWriter(f, self.Parser.Fields.tag.get(self.Parser.Tags.with_ns[typ])).writeheader()
 
             fcon[typ] = open(fp, 'a', encoding='UTF-8', newline='')
             writers[typ] = csv.writer(fcon[typ])
 
-        for typ, vals in self.Parser.iterator():
+        i = 0  # counter for records
+        for typ, vals in self.Parser.iterator(skip):
             writers[typ].writerow(vals)
+            i += 1
+            if (checkpoint or resume) and i % checkpoint_every == 0:
+                self.save_checkpoint(fcon)
 
+        if checkpoint or resume:
+            self.save_checkpoint(fcon)
         for f in fcon.values():
             f.close()
+        return i
+
+
+class ParquetWriter:
+    """Writes every record type to its own compressed Parquet file with typed columns (see PARQUET_TYPES),
+    geometries are binary (WKB) with geometry_format wkb. Values are buffered by columns and every row_group_size
+    records of a type are written as a row group, so memory usage depends on row_group_size only.
+    Requires pyarrow."""
+
+    def __init__(self, prg_file_path: str, output_directory: str, only_basic_fields: bool = False,
+                 geometry_format: str = 'gml', index_path: Union[str, None] = None, row_group_size: int = 100000,
+                 compression: str = 'zstd'):
+        self.Parser: Parser = Parser(prg_file_path, only_basic_fields, geometry_format, index_path)
+        self.output_dir: str = output_directory
+        self.geometry_format: str = geometry_format
+        self.row_group_size: int = row_group_size
+        self.compression: str = compression
+        prg_fn = os.path.basename(prg_file_path).split('.')[0]
+        self.output_file_paths: dict = {
+            self.Parser.Tags.no_ns[x]: join(output_directory, prg_fn + '_' + self.Parser.Tags.no_ns[x] + '.parquet')
+            for x in self.Parser.Tags.list()
+        }
+
+    def column_types(self, typ: str) -> List[str]:
+        """Returns types of columns (see PARQUET_CONVERTERS) of the record type, 'text' for text columns."""
+        types = []
+        for field in self.Parser.Fields.tag[self.Parser.Tags.with_ns[typ]]:
+            if field == 'geometry':
+                types.append('wkb' if self.geometry_format == 'wkb' else 'text')
+            else:
+                types.append(PARQUET_TYPES.get(field, 'text'))
+        return types
+
+    def run(self) -> int:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        arrow_types = {
+            'text': pa.string(),
+            'uuid': pa.binary(16),
+            'timestamp': pa.timestamp('s'),
+            'date': pa.date32(),
+            'int16': pa.int16(),
+            'float': pa.float64(),
+            'bool': pa.bool_(),
+            'wkb': pa.binary(),
+        }
+        converters: Dict[str, list] = {}
+        schemas: dict = {}
+        writers: dict = {}
+        columns: Dict[str, List[list]] = {}
+        for typ, fp in self.output_file_paths.items():
+            types = self.column_types(typ)
+            fields = self.Parser.Fields.tag[self.Parser.Tags.with_ns[typ]]
+            converters[typ] = [PARQUET_CONVERTERS.get(t) for t in types]
+            schemas[typ] = pa.schema([pa.field(f, arrow_types[t]) for f, t in zip(fields, types)])
+            writers[typ] = pq.ParquetWriter(fp, schemas[typ], compression=self.compression)
+            columns[typ] = [[] for _ in fields]
+
+        def flush(typ: str) -> None:
+            if len(columns[typ][0]) == 0:
+                return
+            arrays = [pa.array(col, type=field.type) for col, field in zip(columns[typ], schemas[typ])]
+            writers[typ].write_table(pa.Table.from_arrays(arrays, schema=schemas[typ]))
+            columns[typ] = [[] for _ in columns[typ]]
+
+        i = 0  # counter for records
+        try:
+            for typ, vals in self.Parser.iterator():
+                for col, convert, val in zip(columns[typ], converters[typ], vals):
+                    col.append(convert(val) if convert is not None and val is not None else val)
+                if len(columns[typ][0]) >= self.row_group_size:
+                    flush(typ)
+                i += 1
+            for typ in columns:
+                flush(typ)
+        finally:
+            for w in writers.values():
+                w.close()
+        return i
 
 
 class StdOutWriter:
 
-    def __init__(self, prg_file_path: str, only_basic_fields: bool = False):
-        self.Parser: Parser = Parser(prg_file_path, only_basic_fields)
+    def __init__(self, prg_file_path: str, only_basic_fields: bool = False, geometry_format: str = 'gml',
+                 index_path: Union[str, None] = None):
+        self.Parser: Parser = Parser(prg_file_path, only_basic_fields, geometry_format, index_path)
 
-    def run(self, limit: Union[int, None] = None):
+    def run(self, limit: Union[int, None] = None) -> int:
         import csv
         import os
         from sys import stdout
@@ -569,7 +1134,111 @@ class StdOutWriter:
                 break
             writer.writerow(vals)
             stdout.write(self.Parser.Tags.no_ns2short[typ] + '|' + strio.getvalue())
+            # reuse the buffer, otherwise every line would contain all previous records
+            strio.seek(0)
+            strio.truncate()
             i += 1
+        return i - 1
+
+
+def parse_file(writer: str, file_path: str, options: dict) -> Tuple[str, int, float]:
+    """Parses one file with given writer. Returns file path, number of written records and time it took."""
+    sts = time.perf_counter()
+    index_directory = options.get('index_directory')
+    kwargs = {
+        'geometry_format': options.get('geometry_format', 'gml'),
+        'index_path': change_index_path(index_directory, file_path) if index_directory else None,
+    }
+    checkpoints = {'checkpoint': options.get('checkpoint', False), 'resume': options.get('resume', False)}
+    if writer == 'stdout':
+        records = StdOutWriter(file_path, **kwargs).run(limit=options.get('limit'))
+    elif writer == 'csv':
+        records = CSVWriter(file_path, options['csv_directory'], **kwargs).run(
+            headers=options.get('csv_headers', True), **checkpoints)
+    elif writer == 'parquet':
+        records = ParquetWriter(file_path, options['parquet_directory'],
+                                row_group_size=options.get('row_group_size', 100000), **kwargs).run()
+    elif writer == 'sqlite':
+        sqlite_writer = SQLiteWriter(file_path, options['sqlite_file'],
+                                     typed_columns=options.get('sqlite_typed_columns', False), **kwargs)
+        if options.get('sqlite_bulk'):
+            records = sqlite_writer.run_bulk(prepare_tables=options.get('prepare_tables', False),
+                                             batch_size=options.get('sqlite_batch_size', 10000),
+                                             pragmas=options.get('sqlite_pragmas'),
+                                             create_indexes=options.get('last_file', True))
+        else:
+            records = sqlite_writer.run(prepare_tables=options.get('prepare_tables', False), **checkpoints)
+    elif writer == 'postgresql':
+        records = PostgreSQLWriter(file_path, options['dsn'], **kwargs).run(
+            prepare_tables=options.get('prepare_tables', False), **checkpoints)
+    elif writer == 'postgresql_copy':
+        records = PostgreSQLCopyWriter(file_path, options['dsn'], **kwargs).run(
+            prepare_tables=options.get('prepare_tables', False), **checkpoints)
+    else:
+        raise ValueError(f'Unknown writer: {writer}.')
+    return file_path, records, time.perf_counter() - sts
+
+
+def _parse_file_job(job: Tuple[str, str, dict]) -> Tuple[str, int, float]:
+    return parse_file(*job)
+
+
+def parse_files(writer: str, file_paths: List[str], options: dict, workers: int = 1) -> Tuple[int, float]:
+    """Parses files with given writer, with more than one worker files are parsed concurrently by a pool of processes.
+    Every file is written to its own csv (parquet) files, every worker of a PostgreSQL writer uses its own connection.
+    Stdout and SQLite writers always use a single worker (they write to a single output).
+    Returns total number of records and wall time."""
+    if writer in ('stdout', 'sqlite'):
+        workers = 1
+    workers = max(1, min(workers, len(file_paths)))
+    sts = time.perf_counter()
+    # tables are dropped and created only once: while parsing the first file when files are parsed one by one,
+    # before workers start otherwise (tables can't be recreated while other workers load data into them),
+    # bulk load of sqlite writer creates indexes after the last file
+    prepare_tables = bool(options.get('prepare_tables'))
+    jobs = [
+        (writer, file_path, dict(options, prepare_tables=prepare_tables and idx == 0 and workers == 1,
+                                 last_file=idx == len(file_paths) - 1))
+        for idx, file_path in enumerate(file_paths)
+    ]
+    # resumed load keeps tables with records written before (files without checkpoint prepare them themselves)
+    if prepare_tables and workers > 1 and writer in ('postgresql', 'postgresql_copy') and not options.get('resume'):
+        import psycopg2
+        with psycopg2.connect(options['dsn']) as conn:
+            # tables for change sets have an additional column (index is only opened while parsing)
+            index_directory = options.get('index_directory')
+            PostgreSQLWriter(
+                file_paths[0], options['dsn'], geometry_format=options.get('geometry_format', 'gml'),
+                index_path=change_index_path(index_directory, file_paths[0]) if index_directory else None
+            ).create_tables(conn)
+
+    # stdout writer writes records to stdout
+    log = sys.stderr if writer == 'stdout' else sys.stdout
+    total_records, total_time = 0, 0.0
+    if workers == 1:
+        results = map(_parse_file_job, jobs)
+    else:
+        pool = multiprocessing.Pool(workers)
+        results = pool.imap_unordered(_parse_file_job, jobs)
+    try:
+        for i, (file_path, records, elapsed) in enumerate(results, start=1):
+            total_records += records
+            total_time += elapsed
+            wall_time = time.perf_counter() - sts
+            print(datetime.now().isoformat(), f'- [{i}/{len(jobs)}] {file_path}: {records} records in {elapsed:.1f}s',
+                  f'({records / elapsed if elapsed else 0:.0f} records/s), total: {total_records} records,',
+                  f'{total_records / wall_time if wall_time else 0:.0f} records/s', file=log, flush=True)
+    finally:
+        if workers > 1:
+            pool.close()
+            pool.join()
+
+    wall_time = time.perf_counter() - sts
+    print(datetime.now().isoformat(), f'- parsed {len(jobs)} files ({total_records} records) in {wall_time:.1f}s',
+          f'using {workers} workers, {total_records / wall_time if wall_time else 0:.0f} records/s,',
+          f'parsing time of all files: {total_time:.1f}s (speedup: {total_time / wall_time if wall_time else 0:.1f}x)',
+          file=log, flush=True)
+    return total_records, wall_time
 
 
 if __name__ == '__main__':
@@ -583,13 +1252,34 @@ if __name__ == '__main__':
         else:
             raise argparse.ArgumentTypeError('Boolean value expected.')
 
+    def sqlite_pragma(v: str) -> Tuple[str, str]:
+        match = re.fullmatch(r'(\w+)=(-?\w+)', v)
+        if match is None:
+            raise argparse.ArgumentTypeError('Pragma expected as name=value, e.g. synchronous=NORMAL.')
+        return match.group(1), match.group(2)
+
 
     parser = argparse.ArgumentParser()
-    parser.add_argument('--input', help='File path to the input file.', nargs=1)
-    parser.add_argument('--writer', help='Writer to use.', choices=('csv', 'sqlite', 'postgresql', 'stdout'), nargs=1)
+    parser.add_argument('--input', help='File paths to the input files. (provide one or more)', nargs='+')
+    parser.add_argument('--writer', help='Writer to use.',
+                        choices=('csv', 'parquet', 'sqlite', 'postgresql', 'postgresql_copy', 'stdout'), nargs=1)
     parser.add_argument('--csv_directory', help='Directory for csv files when using csv writer.', nargs=1)
+    parser.add_argument('--parquet_directory', help='Directory for parquet files when using parquet writer.', nargs=1)
+    parser.add_argument('--row_group_size', help='Number of records in a row group of parquet files.', nargs=1,
+                        type=int, default=[100000])
     parser.add_argument('--sqlite_file', help='Filepath for SQLite database when using sqlite writer.', nargs=1)
-    parser.add_argument('--dsn', help='Connection string for PostgreSQL when using postgresql writer.', nargs=1)
+    parser.add_argument('--sqlite_bulk', help='Fast load of sqlite writer for building new databases: batched inserts '
+                                              'in a single transaction without journal, indexes and R*Trees of '
+                                              'geometries (wkb) created after the load. No checkpoints.',
+                        action='store_true')
+    parser.add_argument('--sqlite_typed_columns', help='Typed columns of sqlite writer (uuids and wkb geometries '
+                                                       'as blobs, numbers as integers or reals).', action='store_true')
+    parser.add_argument('--sqlite_batch_size', help='Number of records inserted at once by sqlite bulk load.',
+                        nargs=1, type=int, default=[10000])
+    parser.add_argument('--sqlite_pragmas', help='Pragmas of sqlite bulk load overriding the defaults, '
+                                                 'e.g. synchronous=NORMAL cache_size=-65536 mmap_size=0.',
+                        nargs='+', type=sqlite_pragma, default=[])
+    parser.add_argument('--dsn', help='Connection string for PostgreSQL when using postgresql writers.', nargs=1)
     parser.add_argument('--prep_tables', help='Drop and create tables when using db writers.',
                         nargs='?',
                         type=str2bool,
@@ -601,20 +1291,49 @@ if __name__ == '__main__':
                         nargs='?',
                         type=str2bool,
                         const=True)
+    parser.add_argument('--workers', help='Number of processes parsing input files concurrently (csv, parquet and '
+                                          'postgresql writers only).', nargs=1, type=int, default=[1])
+    parser.add_argument('--geometry_format', help='Format of geometries: gml (default) or hex encoded EWKB (wkb), '
+                                                  'postgresql writers create geometry columns for wkb (required by '
+                                                  'sql scripts of prg_prepare.py).',
+                        choices=('gml', 'wkb'), nargs=1, default=['gml'])
+    parser.add_argument('--index_directory', help='Directory with indexes of address points of the previous load. '
+                                                  'Only address points inserted, updated or deleted since then are '
+                                                  'written (with kind of change in change column).', nargs=1)
+    parser.add_argument('--commit_index', help='Replace indexes in index directory with the ones written by the last '
+                                               'load (run it after the change set was applied). Nothing is parsed.',
+                        action='store_true')
+    parser.add_argument('--checkpoint', help='Save position in every input file together with written records '
+                                             '(not supported by stdout writer).', action='store_true')
+    parser.add_argument('--resume', help='Resume interrupted load (with the same arguments) from checkpoints, records '
+                                         'written before are skipped. Implies --checkpoint.', action='store_true')
     args = vars(parser.parse_args())
 
-    sqlparams = {}
-    if args['prep_tables']:
-        sqlparams['prepare_tables'] = args['prep_tables']
-
-    if args['writer'][0] == 'stdout':
-        StdOutWriter(args['input'][0]).run(limit=args['limit'][0] if args['limit'] else None)
-    elif args['writer'][0] == 'csv':
-        CSVWriter(args['input'][0], args['csv_directory'][0]).run(
-            headers=args['csv_headers'][0] if args['csv_headers'] is not None else True)
-    elif args['writer'][0] == 'sqlite':
-        SQLiteWriter(args['input'][0], args['sqlite_file'][0]).run(**sqlparams)
-    elif args['writer'][0] == 'postgresql':
-        PostgreSQLWriter(args['input'][0], args['dsn'][0]).run(**sqlparams)
-    else:
-        print(args)
+    if args['sqlite_bulk'] and (args['checkpoint'] or args['resume']):
+        parser.error('--sqlite_bulk does not support --checkpoint and --resume.')
+
+    if args['commit_index']:
+        if not args['index_directory']:
+            parser.error('--index_directory is required with --commit_index.')
+        print(datetime.now().isoformat(), '- replaced', commit_change_indexes(args['index_directory'][0]), 'indexes.')
+        sys.exit(0)
+
+    writer_options = {
+        'prepare_tables': bool(args['prep_tables']),
+        'limit': args['limit'][0] if args['limit'] else None,
+        'csv_headers': args['csv_headers'] if args['csv_headers'] is not None else True,
+        'csv_directory': args['csv_directory'][0] if args['csv_directory'] else None,
+        'parquet_directory': args['parquet_directory'][0] if args['parquet_directory'] else None,
+        'row_group_size': args['row_group_size'][0],
+        'sqlite_file': args['sqlite_file'][0] if args['sqlite_file'] else None,
+        'sqlite_bulk': args['sqlite_bulk'],
+        'sqlite_typed_columns': args['sqlite_typed_columns'],
+        'sqlite_batch_size': args['sqlite_batch_size'][0],
+        'sqlite_pragmas': dict(args['sqlite_pragmas']),
+        'dsn': args['dsn'][0] if args['dsn'] else None,
+        'geometry_format': args['geometry_format'][0],
+        'index_directory': args['index_directory'][0] if args['index_directory'] else None,
+        'checkpoint': args['checkpoint'],
+        'resume': args['resume'],
+    }
+    parse_files(args['writer'][0], args['input'], writer_options, workers=args['workers'][0])
@@ -1,19 +1,22 @@
 import argparse
+import sys
 import time
 from datetime import datetime, timezone, timedelta
-from os.path import join, dirname, abspath
+from os.path import join, dirname, abspath, basename
 from os import walk
 from typing import Union
 
-import mercantile as m
-from pyproj import Proj, transform
 import psycopg2 as pg
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 
+sys.path.append(abspath(join(dirname(abspath(__file__)), '..', '..', 'app')))
+from common.tile_math import tile_envelope
+
 sql_path = abspath(join(dirname(abspath(__file__)), '..', 'sql'))
 ddl_path = join(sql_path, 'ddl')
 dml_path = join(sql_path, 'dml')
 partial_update_path = join(sql_path, 'partial_update')
+incremental_path = join(sql_path, 'incremental')
 
 keepalive_kwargs = {
     "keepalives": 1,
@@ -23,15 +26,6 @@ keepalive_kwargs = {
 }
 
 
-def to_merc(bbox: m.LngLatBbox) -> dict:
-    in_proj = Proj('epsg:4326')
-    out_proj = Proj('epsg:3857')
-    res = dict()
-    res["west"], res["south"] = transform(in_proj, out_proj, bbox.south, bbox.west)
-    res["east"], res["north"] = transform(in_proj, out_proj, bbox.north, bbox.east)
-    return res
-
-
 def _read_and_execute(
     conn,
     path: str,
@@ -167,8 +161,72 @@ def full_process(dsn: str, starting: str = '000', force: bool = False) -> None:
                 conn.commit()
                 print(datetime.now(timezone.utc).astimezone().isoformat(), '- finished full update process.')
         else:
+            final_status = 'SKIPPED'
             print(datetime.now(timezone.utc).astimezone().isoformat(),
                   '- full update in progress already. Not starting another one.')
+    if final_status != 'SUCCESS':
+        # lets shell scripts stop (e.g. not replace indexes of the parser)
+        sys.exit(1)
+
+
+def incremental_update(dsn: str, force: bool = False) -> None:
+    """Applies change set loaded by prg.py with --index_directory (staging table of address points holds only
+    the ones inserted, updated or deleted since the previous load) to prg.pa, prg.pa_hashed and prg.delta.
+    Scripts from incremental directory replace dml scripts with the same number, dml scripts matching TERYT codes
+    (002-009, they only update addresses without codes) are shared with full process. Changes of TERYT dictionaries
+    and OSM data don't reach unchanged addresses, full process should still run from time to time."""
+    final_status: str = 'SUCCESS'
+    scripts: list = []
+    # r=root, d=directories, f = files
+    for r, d, f in walk(incremental_path):
+        for file in f:
+            if file.endswith('.sql'):
+                scripts.append(join(r, file))
+    for r, d, f in walk(dml_path):
+        for file in f:
+            if file.endswith('.sql') and '002' <= file < '010':
+                scripts.append(join(r, file))
+    # scripts from both directories are run in order of their names
+    scripts = sorted(scripts, key=basename)
+
+    with pg.connect(dsn, **keepalive_kwargs) as conn:
+        cur = conn.cursor()
+        # it changes the same tables as full process so it uses its lock (partial update waits for both)
+        cur.execute('SELECT in_progress FROM process_locks WHERE process_name = %s', ('prg_full_update',))
+        full_update_in_progress = cur.fetchone()[0] if not force else False
+        if not full_update_in_progress:
+            print(datetime.now(timezone.utc).astimezone().isoformat(), '- starting incremental update process.')
+            cur.execute('UPDATE process_locks SET (in_progress, start_time, end_time) = (true, \'now\', null) ' +
+                        'WHERE process_name = %s',
+                        ('prg_full_update',))
+            conn.commit()
+            try:
+                # change set is applied in a single transaction so a failed update can simply be run again
+                execute_scripts_from_files(conn=conn, vacuum='never', paths=scripts, temp_set_workmem='2048MB',
+                                           commit_mode='off')
+                print(datetime.now(timezone.utc).astimezone().isoformat(),
+                      '- refreshing aggregates for low zoom tiles.')
+                refresh_file_path = join(partial_update_path, '____delta_aggr_refresh.sql')
+                cur.execute(str(open(refresh_file_path, 'r', encoding='utf-8').read()))
+                conn.commit()
+            except Exception as e:
+                print(datetime.now(timezone.utc).astimezone().isoformat(), '- failure in incremental update process.')
+                print(e)
+                final_status = 'FAIL'
+                conn.rollback()
+            finally:
+                cur.execute('UPDATE process_locks SET (in_progress, end_time, last_status) = (false, \'now\', %s) ' +
+                            'WHERE process_name = %s',
+                            (final_status, 'prg_full_update'))
+                conn.commit()
+                print(datetime.now(timezone.utc).astimezone().isoformat(), '- finished incremental update process.')
+        else:
+            final_status = 'SKIPPED'
+            print(datetime.now(timezone.utc).astimezone().isoformat(),
+                  '- full update in progress already. Not starting incremental update.')
+    if final_status != 'SUCCESS':
+        # change set must not be marked as applied (indexes of the parser are replaced only on success)
+        sys.exit(1)
 
 
 def partial_update(dsn: str, starting: str = '000') -> None:
@@ -216,9 +274,7 @@ def partial_update(dsn: str, starting: str = '000') -> None:
             cur.execute('SELECT * FROM expired_tiles WHERE processed = false FOR UPDATE SKIP LOCKED;')
             for i, row in enumerate(cur.fetchall()):
                 x, y, z = row[2], row[3], row[1]
-                tile = m.Tile(x, y, z)
-                bbox = to_merc(m.bounds(tile))
-                bbox = {'xmin': bbox['west'], 'ymin': bbox['south'], 'xmax': bbox['east'], 'ymax': bbox['north']}
+                bbox = tile_envelope(z, x, y)
                 try:
                     execute_scripts_from_files(conn=conn, vacuum='never', paths=sql_queries,
                                                query_parameters=bbox, commit_mode='off')
@@ -234,6 +290,21 @@ def partial_update(dsn: str, starting: str = '000') -> None:
                 )
                 if i % 25 == 0:
                     conn.commit()
+            conn.commit()
+
+            if final_status == 'SUCCESS':
+                print(datetime.now(timezone.utc).astimezone().isoformat(),
+                      '- refreshing aggregates for low zoom tiles.')
+                refresh_file_path = join(partial_update_path, '____delta_aggr_refresh.sql')
+                refresh_sql = str(open(refresh_file_path, 'r', encoding='utf-8').read())
+                try:
+                    cur.execute(refresh_sql)
+                    conn.commit()
+                except Exception as e:
+                    print(datetime.now(timezone.utc).astimezone().isoformat(), '- failure in partial update process.')
+                    print(e)
+                    final_status = 'FAIL'
+                    conn.rollback()
             cur.execute(
                 'UPDATE process_locks SET (in_progress, end_time, last_status) = (false, \'now\', %s) WHERE process_name = %s',
                 (final_status, 'prg_partial_update',))
@@ -248,7 +319,9 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('--full', help='Launch full process', nargs='?', const=True)
     parser.add_argument('--update', help='Launch partial update process', nargs='?', const=True)
-    parser.add_argument('--force', help='Ignore checking if another process is running. Applies to full process.', nargs='?', const=True)
+    parser.add_argument('--incremental', help='Launch incremental update process (apply change set of PRG load)',
+                        nargs='?', const=True)
+    parser.add_argument('--force', help='Ignore checking if another process is running. Applies to full and incremental process.', nargs='?', const=True)
     parser.add_argument('--dsn', help='Connection string for PostgreSQL DB.', nargs=1)
     parser.add_argument('--starting', help='Start from this query (DML or Partial Update). Must match name exactly.', nargs=1)
     args = vars(parser.parse_args())
@@ -259,6 +332,8 @@ if __name__ == '__main__':
             full_process(dsn, starting=args.get('starting')[0], force=args.get('force'))
         else:
             full_process(dsn, force=args.get('force'))
+    elif 'incremental' in args and args.get('incremental'):
+        incremental_update(dsn, force=args.get('force'))
     elif 'update' in args and args.get('update'):
         if args.get('starting'):
             partial_update(dsn, args.get('starting')[0])
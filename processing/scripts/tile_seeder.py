@@ -0,0 +1,151 @@
+"""Renders (seeds) vector tiles into the tiles table using the same SQL as the app.
+
+Tiles are processed in order of zoom (low zooms first) by a pool of processes, each with its own DB connection.
+Finished tiles are appended to the checkpoint file so an interrupted run can be resumed with the same arguments.
+
+Usage:
+python tile_seeder.py --dsn "host=localhost port=5432 dbname=gugik2osm user=user password=password" --workers 8
+"""
+import argparse
+import multiprocessing
+import sys
+import time
+from datetime import datetime, timezone
+from os.path import join, dirname, abspath, isfile
+from typing import Iterable, List, Set, Tuple
+
+import mercantile as m
+import psycopg2 as pg
+
+sys.path.append(abspath(join(dirname(abspath(__file__)), '..', '..', 'app')))
+from common.tile_render import get_or_render_tile, query_for_zoom, metatile, METATILE_SIZE
+
+# bounding box of Poland (WGS84) used for low zoom tiles cache
+POLAND_BBOX = (14.0, 49.0, 24.03, 54.86)
+
+keepalive_kwargs = {
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 5,
+    "keepalives_count": 5,
+}
+
+_conn = None  # connection of the worker process
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).astimezone().isoformat()
+
+
+def tiles_to_seed(bbox: Tuple[float, float, float, float], zooms: Iterable[int]) -> List[Tuple[int, int, int]]:
+    """Returns list of tiles (z, x, y) covering bbox ordered by zoom (low zooms first).
+    High zoom tiles are rendered by whole metatiles so only one tile of every metatile is returned."""
+    tiles, metatiles = [], set()
+    for t in m.tiles(*bbox, sorted(zooms)):
+        if query_for_zoom(t.z) is None and METATILE_SIZE > 1:
+            key = (t.z,) + metatile(t.z, t.x, t.y)[:2]
+            if key in metatiles:
+                continue
+            metatiles.add(key)
+        tiles.append((t.z, t.x, t.y))
+    return tiles
+
+
+def read_checkpoint(path: str) -> Set[Tuple[int, int, int]]:
+    """Reads tiles (one z/x/y per line) finished by previous runs."""
+    done = set()
+    if path and isfile(path):
+        with open(path, 'r', encoding='UTF-8') as f:
+            for line in f:
+                parts = line.strip().split('/')
+                if len(parts) == 3:
+                    done.add(tuple(int(p) for p in parts))
+    return done
+
+
+def _init_worker(dsn: str) -> None:
+    global _conn
+    _conn = pg.connect(dsn, **keepalive_kwargs)
+
+
+def _seed_tile(tile: Tuple[int, int, int]) -> Tuple[Tuple[int, int, int], str, float]:
+    """Renders the tile (if it's not in the tiles table already). Returns tile, status and time it took."""
+    sts = time.perf_counter()
+    try:
+        _, status = get_or_render_tile(_conn, *tile)
+    except Exception as e:
+        _conn.rollback()
+        print(_now(), f'- failed to render tile {"/".join(str(v) for v in tile)}:', e, flush=True)
+        status = 'failed'
+    return tile, status, time.perf_counter() - sts
+
+
+def seed(
+    dsn: str,
+    tiles: List[Tuple[int, int, int]],
+    workers: int,
+    checkpoint: str = None,
+    report_every: float = 30.0
+) -> dict:
+    done = read_checkpoint(checkpoint)
+    todo = [t for t in tiles if t not in done]
+    print(_now(), f'- tiles: {len(tiles)}, already done: {len(tiles) - len(todo)}, to seed: {len(todo)},',
+          f'workers: {workers}', flush=True)
+
+    results = {'cached': 0, 'rendered': 0, 'rendered_elsewhere': 0, 'failed': 0}
+    render_time = 0.0
+    sts = time.perf_counter()
+    last_report = sts
+    checkpoint_file = open(checkpoint, 'a', encoding='UTF-8') if checkpoint else None
+    try:
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(dsn,)) as pool:
+            # imap keeps the order of submitted tasks so low zoom tiles are done first
+            for i, (tile, status, elapsed) in enumerate(pool.imap(_seed_tile, todo, chunksize=4), start=1):
+                results[status] += 1
+                render_time += elapsed
+                if checkpoint_file and status != 'failed':
+                    checkpoint_file.write('{}/{}/{}\n'.format(*tile))
+                now = time.perf_counter()
+                if now - last_report >= report_every or i == len(todo):
+                    last_report = now
+                    rate = i / (now - sts)
+                    eta = (len(todo) - i) / rate if rate else 0
+                    print(_now(), f'- {i}/{len(todo)} ({i / len(todo):.1%}), current zoom: {tile[0]},',
+                          f'{rate:.1f} tiles/s, ETA: {eta:.0f}s,',
+                          ', '.join(f'{k}: {v}' for k, v in results.items()), flush=True)
+                    if checkpoint_file:
+                        checkpoint_file.flush()
+    finally:
+        if checkpoint_file:
+            checkpoint_file.close()
+
+    elapsed = time.perf_counter() - sts
+    print(_now(), f'- finished in {elapsed:.1f}s,',
+          f'avg time per tile: {render_time / len(todo) if todo else 0:.3f}s,',
+          ', '.join(f'{k}: {v}' for k, v in results.items()), flush=True)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dsn', help='Connection string for PostgreSQL DB.', nargs=1, required=True)
+    parser.add_argument('--min_zoom', help='Lowest zoom to seed.', nargs=1, type=int, default=[6])
+    parser.add_argument('--max_zoom', help='Highest zoom to seed.', nargs=1, type=int, default=[12])
+    parser.add_argument('--bbox', help='Bounding box in WGS84: west south east north.', nargs=4, type=float,
+                        default=list(POLAND_BBOX))
+    parser.add_argument('--workers', help='Number of processes (database connections) rendering tiles.', nargs=1,
+                        type=int, default=[multiprocessing.cpu_count()])
+    parser.add_argument('--checkpoint', help='File with finished tiles. Rerun with the same file to resume.',
+                        nargs=1)
+    parser.add_argument('--report_every', help='Report progress every n seconds.', nargs=1, type=float,
+                        default=[30.0])
+    args = vars(parser.parse_args())
+
+    failed = seed(
+        dsn=args['dsn'][0],
+        tiles=tiles_to_seed(tuple(args['bbox']), range(args['min_zoom'][0], args['max_zoom'][0] + 1)),
+        workers=args['workers'][0],
+        checkpoint=args['checkpoint'][0] if args.get('checkpoint') else None,
+        report_every=args['report_every'][0]
+    )['failed']
+    sys.exit(1 if failed else 0)
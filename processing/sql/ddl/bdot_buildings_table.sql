@@ -16,6 +16,17 @@ create table if not exists bdot_buildings (
     historic text,
     tourism text,
     building_levels smallint,
-    geom_4326 geometry(polygon, 4326) not null
+    geom_4326 geometry(polygon, 4326) not null,
+    geom_3857 geometry(polygon, 3857) not null,
+    -- set for buildings excluded (reported as not fit for import) after the table was built
+    excluded boolean not null default false
 );
+
+-- tables created before the columns were added get them here (the next rebuild of buildings creates them anyway)
+alter table bdot_buildings add column if not exists geom_3857 geometry(polygon, 3857);
+update bdot_buildings set geom_3857 = st_transform(geom_4326, 3857) where geom_3857 is null;
+alter table bdot_buildings alter column geom_3857 set not null;
+alter table bdot_buildings add column if not exists excluded boolean not null default false;
+
 create index if not exists idx_bdot_buildings_geom on bdot_buildings using GIST (geom_4326);
+create index if not exists idx_bdot_buildings_geom_3857 on bdot_buildings using GIST (geom_3857) where not excluded;
@@ -13,7 +13,7 @@ create unlogged table if not exists bdot.stg_budynki_ogolne_poligony (
     kodkst                 text,
     nazwa                  text,
     zabytek                text,
-    geometry               text,
+    geometry               geometry,
     powiat                 text
 );
 
@@ -54,7 +54,7 @@ CREATE OR REPLACE VIEW bdot.v_bubd_a as
         cast(x_aktualnosca as date) aktualnosc_atrybutow,
         cast(koniecwersjiobiektu as timestamp) koniecwersjiobiektu,
         kodkst kod_kst,
-        ST_GeomFromGML(SUBSTRING(geometry, 54, length(geometry) - 64)) geom_a_2180
+        geometry geom_a_2180
     FROM bdot.stg_budynki_ogolne_poligony
     LEFT JOIN bdot.lookup_x_kod using (x_kod)
     LEFT JOIN bdot.lookup_x_katistnienia using (x_katIstnienia)
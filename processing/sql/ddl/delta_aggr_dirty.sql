@@ -0,0 +1,5 @@
+-- SIMCs whose aggregates of delta (prg.delta_aggr_*) have to be recomputed, filled by partial and incremental updates
+-- and processed by ____delta_aggr_refresh.sql
+create table if not exists prg.delta_aggr_dirty (
+    teryt_simc text primary key
+);
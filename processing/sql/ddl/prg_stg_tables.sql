@@ -26,7 +26,7 @@ CREATE unlogged TABLE if not exists prg.miejscowosci (
     waznydo text,
     nazwa text,
     idteryt text,
-    geometry text,
+    geometry geometry,
     miejscowosc text
 );
 
@@ -50,7 +50,7 @@ CREATE unlogged TABLE if not exists prg.punkty_adresowe (
     numerporzadkowy text,
     kodpocztowy text,
     status text,
-    geometry text,
+    geometry geometry,
     komponent text,
     komponent_01 text,
     komponent_02 text,
@@ -58,7 +58,9 @@ CREATE unlogged TABLE if not exists prg.punkty_adresowe (
     komponent_04 text,
     komponent_05 text,
     komponent_06 text,
-    obiektemuia text
+    obiektemuia text,
+    -- kind of change (insert, update, delete) when only changes since the previous load are loaded
+    change text
 );
 
 CREATE unlogged TABLE if not exists prg.ulice (
@@ -73,6 +75,6 @@ CREATE unlogged TABLE if not exists prg.ulice (
     waznydo text,
     nazwaglownaczesc text,
     idteryt text,
-    geometry text,
+    geometry geometry,
     ulica text
 );
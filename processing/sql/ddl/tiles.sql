@@ -2,9 +2,28 @@ create table if not exists tiles (
 	z integer not null,
 	x integer not null,
 	y integer not null,
-	mvt bytea,
+	mvt bytea, -- compressed with the encoding below
 	bbox geometry(Polygon, 3857),
+	hash text, -- md5 of uncompressed mvt, served as ETag
+	encoding text, -- Content-Encoding of mvt (gzip, br or identity), null means identity
 	constraint tiles_zxy_pk primary key (z, x, y)
 );
 
+alter table tiles add column if not exists hash text;
+alter table tiles add column if not exists encoding text;
+
 create index if not exists idx_tiles_bbox on tiles using gist (bbox);
+
+-- layers of high zoom tiles (z >= 13) rendered separately so they can be invalidated independently,
+-- tiles table keeps tiles assembled from these layers
+create table if not exists tile_layers (
+	z integer not null,
+	x integer not null,
+	y integer not null,
+	layer text not null, -- name of the layer in the tile: prg2load or buildings
+	mvt bytea, -- uncompressed
+	bbox geometry(Polygon, 3857),
+	constraint tile_layers_zxy_layer_pk primary key (z, x, y, layer)
+);
+
+create index if not exists idx_tile_layers_bbox on tile_layers using gist (bbox);
@@ -33,7 +33,7 @@ INSERT INTO prg.pa
        pa.numerporzadkowy,
        ltrim(rtrim(replace(replace(upper(trim(pa.numerporzadkowy)), '\', '/'), ' ', ''), './'), '.0/') nr,
        case when pa.kodpocztowy = '00-000' then null else pa.kodpocztowy end                 pna,
-       st_flipcoordinates(ST_GeomFromGML(SUBSTRING(pa.geometry, 54, length(pa.geometry) - 64))) geom
+       pa.geometry                                                                           geom
     FROM prg.punkty_adresowe pa
     LEFT JOIN prg.jednostki_administracyjne ja2 on pa.komponent_01 = ja2.gmlid
     LEFT JOIN prg.jednostki_administracyjne ja3 on pa.komponent_02 = ja3.gmlid
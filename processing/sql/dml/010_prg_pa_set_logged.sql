@@ -1,2 +1,4 @@
 alter table prg.pa set logged;
+-- incremental update looks up addresses sharing (simc, ulic, nr) with the changed ones
+create index if not exists prg_pa_simc_nr on prg.pa using btree (teryt_simc, numerporzadkowy);
 analyze prg.pa;
@@ -1,2 +1,3 @@
 create index if not exists prg_pa_hashed_geom on prg.pa_hashed using gist (geom);
+create index if not exists prg_pa_hashed_lokalnyid on prg.pa_hashed using btree (lokalnyid);
 analyze prg.pa_hashed;
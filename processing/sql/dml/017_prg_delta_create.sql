@@ -9,7 +9,10 @@ create unlogged table prg.delta_new as
         pa.numerporzadkowy nr,
         pa.pna,
         pa.gml geom,
-        pa.nr nr_standaryzowany
+        ST_Transform(pa.gml, 3857) geom_3857,
+        pa.nr nr_standaryzowany,
+        -- set for addresses excluded (reported as not fit for import) after the table was built
+        false excluded
     from prg.pa_hashed prg
     join prg.pa using (lokalnyid)
     left join osm_hashed osm
@@ -18,5 +21,7 @@ create unlogged table prg.delta_new as
 ;
 create index if not exists delta_gis_new on prg.delta_new using gist (geom);
 cluster prg.delta_new using delta_gis_new;
+-- tiles and josm data are read in EPSG:3857 and never include excluded addresses
+create index if not exists delta_gis_3857_new on prg.delta_new using gist (geom_3857) where not excluded;
 create index if not exists delta_lokalnyid_new on prg.delta_new using btree (lokalnyid);
 analyze prg.delta_new;
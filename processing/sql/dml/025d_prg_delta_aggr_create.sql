@@ -0,0 +1,51 @@
+-- aggregates of delta (address points missing in OSM) shown at low zooms, geometries are already in EPSG:3857
+-- per gmina (z6-7)
+drop table if exists prg.delta_aggr_terc_new;
+create table prg.delta_aggr_terc_new as
+    select
+        s.woj || s.pow || s.gmi || s.rodz_gmi terc,
+        ST_Transform(ST_GeometricMedian(st_union(d.geom)), 3857) geom,
+        count(*) no_of_points
+    from prg.delta d
+    join teryt.simc s on d.teryt_simc = s.sym
+    where not d.excluded
+    group by s.woj || s.pow || s.gmi || s.rodz_gmi
+;
+create index delta_aggr_terc_gis_new on prg.delta_aggr_terc_new using gist (geom);
+create index delta_aggr_terc_terc_new on prg.delta_aggr_terc_new using btree (terc);
+
+-- per SIMC (z8-9)
+drop table if exists prg.delta_aggr_simc_new;
+create table prg.delta_aggr_simc_new as
+    select
+        d.teryt_simc,
+        ST_Transform(ST_GeometricMedian(st_union(d.geom)), 3857) geom,
+        count(*) no_of_points
+    from prg.delta d
+    where not d.excluded
+    group by d.teryt_simc
+;
+create index delta_aggr_simc_gis_new on prg.delta_aggr_simc_new using gist (geom);
+create index delta_aggr_simc_simc_new on prg.delta_aggr_simc_new using btree (teryt_simc);
+
+-- per street (SIMC + ULIC, 99999 for addresses without street) (z10-11)
+drop table if exists prg.delta_aggr_simc_ulic_new;
+create table prg.delta_aggr_simc_ulic_new as
+    select
+        d.teryt_simc,
+        coalesce(d.teryt_ulic, '99999') teryt_ulic,
+        ST_Transform(ST_GeometricMedian(st_union(d.geom)), 3857) geom,
+        count(*) no_of_points
+    from prg.delta d
+    where not d.excluded
+    group by d.teryt_simc, coalesce(d.teryt_ulic, '99999')
+;
+create index delta_aggr_simc_ulic_gis_new on prg.delta_aggr_simc_ulic_new using gist (geom);
+create index delta_aggr_simc_ulic_simc_new on prg.delta_aggr_simc_ulic_new using btree (teryt_simc);
+
+analyze prg.delta_aggr_terc_new;
+analyze prg.delta_aggr_simc_new;
+analyze prg.delta_aggr_simc_ulic_new;
+
+-- aggregates were just built from scratch, nothing has to be recomputed (table is created by ddl/delta_aggr_dirty.sql)
+delete from prg.delta_aggr_dirty where 1=1;
@@ -0,0 +1,14 @@
+drop table if exists prg.delta_aggr_terc;
+alter table prg.delta_aggr_terc_new rename to delta_aggr_terc;
+alter index prg.delta_aggr_terc_gis_new rename to delta_aggr_terc_gis;
+alter index prg.delta_aggr_terc_terc_new rename to delta_aggr_terc_terc;
+
+drop table if exists prg.delta_aggr_simc;
+alter table prg.delta_aggr_simc_new rename to delta_aggr_simc;
+alter index prg.delta_aggr_simc_gis_new rename to delta_aggr_simc_gis;
+alter index prg.delta_aggr_simc_simc_new rename to delta_aggr_simc_simc;
+
+drop table if exists prg.delta_aggr_simc_ulic;
+alter table prg.delta_aggr_simc_ulic_new rename to delta_aggr_simc_ulic;
+alter index prg.delta_aggr_simc_ulic_gis_new rename to delta_aggr_simc_ulic_gis;
+alter index prg.delta_aggr_simc_ulic_simc_new rename to delta_aggr_simc_ulic_simc;
@@ -17,5 +17,8 @@ create table if not exists bdot_buildings_new (
     historic text,
     tourism text,
     building_levels smallint,
-    geom_4326 geometry(polygon, 4326) not null
+    geom_4326 geometry(polygon, 4326) not null,
+    geom_3857 geometry(polygon, 3857) not null,
+    -- set for buildings excluded (reported as not fit for import) after the table was built
+    excluded boolean not null default false
 );
@@ -14,7 +14,8 @@ insert into bdot_buildings_new (
     historic,
     tourism,
     building_levels,
-    geom_4326
+    geom_4326,
+    geom_3857
 )
   select
     b.powiat,
@@ -35,7 +36,8 @@ insert into bdot_buildings_new (
     end historic,
     m.tourism,
     b.liczba_kondygnacji as building_levels,
-    st_transform(b.geom_a_2180, 4326) as geom_4326
+    st_transform(b.geom_a_2180, 4326) as geom_4326,
+    st_transform(b.geom_a_2180, 3857) as geom_3857
   from bdot.v_bubd_a b
   left join bdot.buildings_categories_mappings m
     on m.kategoria_bdot=b.kategoria_bdot
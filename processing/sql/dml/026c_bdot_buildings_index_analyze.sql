@@ -1,2 +1,3 @@
 create index if not exists idx_bdot_buildings_geom_new on bdot_buildings_new using GIST (geom_4326);
+create index if not exists idx_bdot_buildings_geom_3857_new on bdot_buildings_new using GIST (geom_3857) where not excluded;
 analyze bdot_buildings_new;
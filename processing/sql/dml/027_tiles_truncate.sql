@@ -1,2 +1,3 @@
 delete from tiles where 1=1;
+delete from tile_layers where 1=1;
 delete from expired_tiles where processed=true;
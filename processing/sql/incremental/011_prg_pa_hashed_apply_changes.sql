@@ -0,0 +1,21 @@
+delete from prg.pa_hashed h
+using prg.pa_changes c
+where h.lokalnyid = c.lokalnyid
+;
+-- same as dml/011_prg_pa_hashed_create.sql
+insert into prg.pa_hashed (hash, lokalnyid, geom)
+select
+    md5(concat(lower(prg.teryt_msc), lower(coalesce(prg.osm_ulica, prg.teryt_ulica, '')), prg.nr)) hash,
+    lokalnyid,
+    gml geom
+from prg.pa prg
+join prg.pa_changes c using (lokalnyid)
+join teryt.simc on prg.teryt_simc = simc.sym
+left join exclude_prg e on lokalnyid = e.id
+where
+    prg.teryt_msc is not null
+    and not (prg.teryt_ulic is null and prg.ul is not null)
+    and not (simc.rm like '9%' and prg.teryt_ulica is null)
+    and e.id is null
+;
+analyze prg.pa_hashed;
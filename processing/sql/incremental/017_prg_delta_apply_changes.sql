@@ -0,0 +1,116 @@
+-- addresses whose delta rows have to be recomputed: changed ones and the ones sharing (simc, ulic, nr)
+-- with previous or current versions of changed ones (duplicates are removed from delta together, see 021)
+drop table if exists prg.pa_affected;
+create unlogged table prg.pa_affected as
+    select lokalnyid
+    from prg.pa_changes
+    union
+    select pa.lokalnyid
+    from prg.pa
+    join (
+        select teryt_simc, teryt_ulic, numerporzadkowy
+        from prg.pa_changes_old_keys
+        union
+        select pa.teryt_simc, pa.teryt_ulic, pa.numerporzadkowy
+        from prg.pa
+        join prg.pa_changes using (lokalnyid)
+    ) k using (teryt_simc, teryt_ulic, numerporzadkowy)
+;
+create index pa_affected_lokalnyid on prg.pa_affected using btree (lokalnyid);
+analyze prg.pa_affected;
+
+-- geometries (EPSG:3857) and SIMCs of delta rows before and after the update, for tiles and aggregates
+drop table if exists prg.delta_changes;
+create unlogged table prg.delta_changes (
+    geom geometry,
+    teryt_simc text
+);
+with deleted as (
+    delete from prg.delta d
+    using prg.pa_affected a
+    where d.lokalnyid = a.lokalnyid
+    returning d.geom_3857, d.teryt_simc
+)
+insert into prg.delta_changes (geom, teryt_simc)
+    select geom_3857, teryt_simc
+    from deleted
+;
+
+-- conditions of dml/017-023 (except the duplicates which are removed below) applied to affected addresses only,
+-- expiry is only known for changed addresses (it's in the staging table) but it changes version of an address anyway
+insert into prg.delta (lokalnyid, teryt_msc, teryt_simc, teryt_ulica, teryt_ulic, nr, pna, geom, geom_3857,
+                       nr_standaryzowany, excluded)
+    select
+        pa.lokalnyid,
+        pa.teryt_msc,
+        pa.teryt_simc,
+        coalesce(pa.osm_ulica, pa.teryt_ulica) teryt_ulica,
+        pa.teryt_ulic,
+        pa.numerporzadkowy nr,
+        pa.pna,
+        pa.gml geom,
+        ST_Transform(pa.gml, 3857) geom_3857,
+        pa.nr nr_standaryzowany,
+        -- addresses excluded after prg.pa_hashed was built are still in it
+        exists(select 1 from exclude_prg e where e.id = pa.lokalnyid) excluded
+    from prg.pa_affected a
+    join prg.pa_hashed prg using (lokalnyid)
+    join prg.pa using (lokalnyid)
+    where
+        not exists (
+            select 1
+            from osm_hashed osm
+            where prg.hash = osm.hash and st_dwithin(prg.geom, osm.geom, 150)
+        )
+        and not exists (
+            select 1
+            from osm_hashed osm
+            where st_dwithin(prg.geom, osm.geom, 2)
+        )
+        and not exists (
+            select 1
+            from osm_adr osm
+            where st_dwithin(pa.gml, st_transform(osm.geom, 2180), 40) and pa.nr = osm.nr
+        )
+        and not exists (
+            select 1
+            from prg.punkty_adresowe stg
+            where
+                stg.change in ('insert', 'update')
+                and stg.lokalnyid::uuid = pa.lokalnyid
+                and ((stg.waznydo is not null and stg.waznydo::timestamptz < now()) or stg.koniecwersjiobiektu is not null)
+        )
+        and not exists (
+            select 1
+            from osm_addr_polygon osm
+            where st_intersects(pa.gml, st_transform(osm.geometry, 2180)) and osm.type = pa.nr -- type = nr
+        )
+        and not exists (
+            select 1
+            from osm_addr_polygon osm
+            where st_dwithin(pa.gml, st_transform(osm.geometry, 2180), 15) and osm.type = pa.nr -- type = nr
+        )
+;
+
+-- same as dml/021_prg_delta_delete.sql but only for (simc, ulic, nr) of affected addresses
+delete from prg.delta d
+using (
+    select teryt_simc, teryt_ulic, nr
+    from prg.delta
+    where (teryt_simc, teryt_ulic, nr) in (
+        select delta.teryt_simc, delta.teryt_ulic, delta.nr
+        from prg.delta
+        join prg.pa_affected using (lokalnyid)
+    )
+    group by teryt_simc, teryt_ulic, nr
+    having count(*) > 1
+) dd
+where d.teryt_simc = dd.teryt_simc and d.teryt_ulic = dd.teryt_ulic and d.nr = dd.nr
+;
+
+insert into prg.delta_changes (geom, teryt_simc)
+    select d.geom_3857, d.teryt_simc
+    from prg.delta d
+    join prg.pa_affected using (lokalnyid)
+;
+analyze prg.delta;
@@ -0,0 +1,20 @@
+-- only tiles showing changed delta rows are removed (full process truncates all of them)
+delete from tile_layers t
+using prg.delta_changes c
+where 1=1
+  and t.layer = 'prg2load'
+  and t.bbox && c.geom
+;
+delete from tiles t
+using prg.delta_changes c
+where 1=1
+  and t.z >= 13
+  and t.bbox && c.geom
+;
+-- aggregates shown at low zooms are recomputed (and their tiles removed) at the end of incremental update
+insert into prg.delta_aggr_dirty (teryt_simc)
+  select distinct teryt_simc
+  from prg.delta_changes
+  where teryt_simc is not null
+on conflict do nothing
+;
@@ -1,63 +1,87 @@
-delete from prg.delta d
-where
-  -- make sure given bounding box is valid
-  ST_Transform(ST_MakeEnvelope(14.0, 49.0, 24.03, 54.86, 4326), 3857) && ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857)
-  and
-  d.geom && ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 2180)
-  and (
-    exists (
-      select 1
-      from prg.pa_hashed prg, osm_hashed osm
-      where
-        st_dwithin(prg.geom, ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 2180), 150)
-        and
-        st_dwithin(osm.geom, ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 2180), 150)
-        and
-        d.lokalnyid = prg.lokalnyid
-        and
-        prg.hash = osm.hash
-        and
-        st_dwithin(prg.geom, osm.geom, 150)
+with deleted as (
+  delete from prg.delta d
+  where
+    -- make sure given bounding box is valid
+    ST_Transform(ST_MakeEnvelope(14.0, 49.0, 24.03, 54.86, 4326), 3857) && ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857)
+    and
+    d.geom && ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 2180)
+    and (
+      exists (
+        select 1
+        from prg.pa_hashed prg, osm_hashed osm
+        where
+          st_dwithin(prg.geom, ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 2180), 150)
+          and
+          st_dwithin(osm.geom, ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 2180), 150)
+          and
+          d.lokalnyid = prg.lokalnyid
+          and
+          prg.hash = osm.hash
+          and
+          st_dwithin(prg.geom, osm.geom, 150)
+      )
+      or
+      exists (
+        select 1
+        from prg.pa_hashed prg, osm_hashed osm
+        where
+          st_dwithin(prg.geom, ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 2180), 150)
+          and
+          st_dwithin(osm.geom, ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 2180), 150)
+          and
+          d.lokalnyid = prg.lokalnyid
+          and
+          st_dwithin(prg.geom, osm.geom, 2)
+      )
+      or
+      exists (
+        select 1
+        from osm_adr osm
+        where
+          st_dwithin(osm.geom, ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 2180), 150)
+          and
+          st_dwithin(d.geom, st_transform(osm.geom, 2180), 40) and d.nr_standaryzowany = osm.nr
+      )
+      or
+      exists (
+        select 1
+        from osm_addr_polygon osm
+        where
+          st_dwithin(osm.geometry, ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 2180), 150)
+          and
+          st_intersects(d.geom, st_transform(osm.geometry, 2180)) AND (osm.type = d.nr_standaryzowany) -- type = nr
+      )
+      or
+      exists (
+        select 1
+        from osm_addr_polygon osm
+        where
+          st_dwithin(osm.geometry, ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 2180), 150)
+          and
+          st_dwithin(d.geom, st_transform(osm.geometry, 2180), 15) AND (osm.type = d.nr_standaryzowany) -- type = nr
+      )
     )
-    or
-    exists (
-      select 1
-      from prg.pa_hashed prg, osm_hashed osm
-      where
-        st_dwithin(prg.geom, ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 2180), 150)
-        and
-        st_dwithin(osm.geom, ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 2180), 150)
-        and
-        d.lokalnyid = prg.lokalnyid
-        and
-        st_dwithin(prg.geom, osm.geom, 2)
-    )
-    or
-    exists (
-      select 1
-      from osm_adr osm
-      where
-        st_dwithin(osm.geom, ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 2180), 150)
-        and
-        st_dwithin(d.geom, st_transform(osm.geom, 2180), 40) and d.nr_standaryzowany = osm.nr
-    )
-    or
-    exists (
-      select 1
-      from osm_addr_polygon osm
-      where
-        st_dwithin(osm.geometry, ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 2180), 150)
-        and
-        st_intersects(d.geom, st_transform(osm.geometry, 2180)) AND (osm.type = d.nr_standaryzowany) -- type = nr
-    )
-    or
-    exists (
-      select 1
-      from osm_addr_polygon osm
-      where
-        st_dwithin(osm.geometry, ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 2180), 150)
-        and
-        st_dwithin(d.geom, st_transform(osm.geometry, 2180), 15) AND (osm.type = d.nr_standaryzowany) -- type = nr
-    )
-  )
+  returning d.geom_3857 geom, d.teryt_simc
+),
+delete_layers as (
+  -- only the layer built from deleted rows has to be rendered again
+  delete from tile_layers t
+  using deleted
+  where 1=1
+    and t.layer = 'prg2load'
+    and t.bbox && deleted.geom
+),
+delete_tiles as (
+  delete from tiles t
+  using deleted
+  where 1=1
+    and z >= 13
+    and t.bbox && deleted.geom
+)
+-- aggregates shown at low zooms are recomputed (and their tiles removed) at the end of partial update
+insert into prg.delta_aggr_dirty (teryt_simc)
+  select distinct teryt_simc
+  from deleted
+  where teryt_simc is not null
+on conflict do nothing
 ;
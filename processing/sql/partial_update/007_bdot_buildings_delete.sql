@@ -1,12 +1,28 @@
-delete from bdot_buildings b
-using osm_buildings o
-where
-  -- make sure given bounding box is valid
-  ST_Transform(ST_MakeEnvelope(14.0, 49.0, 24.03, 54.86, 4326), 3857) && ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857)
-  and
-  b.geom_4326 && ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 4326)
-  and
-  o.geometry && ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 4326)
-  and
-  st_intersects(b.geom_4326, o.geometry)
+with deleted as (
+  delete from bdot_buildings b
+  using osm_buildings o
+  where
+    -- make sure given bounding box is valid
+    ST_Transform(ST_MakeEnvelope(14.0, 49.0, 24.03, 54.86, 4326), 3857) && ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857)
+    and
+    b.geom_4326 && ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 4326)
+    and
+    o.geometry && ST_Transform(ST_MakeEnvelope(%(xmin)s, %(ymin)s, %(xmax)s, %(ymax)s, 3857), 4326)
+    and
+    st_intersects(b.geom_4326, o.geometry)
+  returning b.geom_3857 geom
+),
+delete_layers as (
+  -- only the layer built from deleted rows has to be rendered again
+  delete from tile_layers t
+  using deleted
+  where 1=1
+    and t.layer = 'buildings'
+    and t.bbox && deleted.geom
+)
+delete from tiles t
+using deleted
+where 1=1
+  and z >= 13
+  and t.bbox && deleted.geom
 ;
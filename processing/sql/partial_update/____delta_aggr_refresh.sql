@@ -0,0 +1,106 @@
+-- recomputes aggregates of delta for SIMCs changed by partial update and removes low zoom tiles showing them
+create temporary table dirty_simc on commit drop as
+  select teryt_simc
+  from prg.delta_aggr_dirty
+;
+create temporary table dirty_terc on commit drop as
+  select distinct s.woj || s.pow || s.gmi || s.rodz_gmi terc
+  from dirty_simc
+  join teryt.simc s on dirty_simc.teryt_simc = s.sym
+;
+delete from prg.delta_aggr_dirty a
+using dirty_simc
+where a.teryt_simc = dirty_simc.teryt_simc
+;
+
+-- per gmina (z6-7)
+delete from tiles t
+using prg.delta_aggr_terc a, dirty_terc
+where 1=1
+  and t.z between 6 and 7
+  and a.terc = dirty_terc.terc
+  and t.bbox && a.geom
+;
+delete from prg.delta_aggr_terc a
+using dirty_terc
+where a.terc = dirty_terc.terc
+;
+insert into prg.delta_aggr_terc (terc, geom, no_of_points)
+  select
+    s.woj || s.pow || s.gmi || s.rodz_gmi terc,
+    ST_Transform(ST_GeometricMedian(st_union(d.geom)), 3857) geom,
+    count(*) no_of_points
+  from prg.delta d
+  join teryt.simc s on d.teryt_simc = s.sym
+  join dirty_terc on s.woj || s.pow || s.gmi || s.rodz_gmi = dirty_terc.terc
+  where not d.excluded
+  group by s.woj || s.pow || s.gmi || s.rodz_gmi
+;
+delete from tiles t
+using prg.delta_aggr_terc a, dirty_terc
+where 1=1
+  and t.z between 6 and 7
+  and a.terc = dirty_terc.terc
+  and t.bbox && a.geom
+;
+
+-- per SIMC (z8-9)
+delete from tiles t
+using prg.delta_aggr_simc a, dirty_simc
+where 1=1
+  and t.z between 8 and 9
+  and a.teryt_simc = dirty_simc.teryt_simc
+  and t.bbox && a.geom
+;
+delete from prg.delta_aggr_simc a
+using dirty_simc
+where a.teryt_simc = dirty_simc.teryt_simc
+;
+insert into prg.delta_aggr_simc (teryt_simc, geom, no_of_points)
+  select
+    d.teryt_simc,
+    ST_Transform(ST_GeometricMedian(st_union(d.geom)), 3857) geom,
+    count(*) no_of_points
+  from prg.delta d
+  join dirty_simc on d.teryt_simc = dirty_simc.teryt_simc
+  where not d.excluded
+  group by d.teryt_simc
+;
+delete from tiles t
+using prg.delta_aggr_simc a, dirty_simc
+where 1=1
+  and t.z between 8 and 9
+  and a.teryt_simc = dirty_simc.teryt_simc
+  and t.bbox && a.geom
+;
+
+-- per street (z10-11)
+delete from tiles t
+using prg.delta_aggr_simc_ulic a, dirty_simc
+where 1=1
+  and t.z between 10 and 11
+  and a.teryt_simc = dirty_simc.teryt_simc
+  and t.bbox && a.geom
+;
+delete from prg.delta_aggr_simc_ulic a
+using dirty_simc
+where a.teryt_simc = dirty_simc.teryt_simc
+;
+insert into prg.delta_aggr_simc_ulic (teryt_simc, teryt_ulic, geom, no_of_points)
+  select
+    d.teryt_simc,
+    coalesce(d.teryt_ulic, '99999') teryt_ulic,
+    ST_Transform(ST_GeometricMedian(st_union(d.geom)), 3857) geom,
+    count(*) no_of_points
+  from prg.delta d
+  join dirty_simc on d.teryt_simc = dirty_simc.teryt_simc
+  where not d.excluded
+  group by d.teryt_simc, coalesce(d.teryt_ulic, '99999')
+;
+delete from tiles t
+using prg.delta_aggr_simc_ulic a, dirty_simc
+where 1=1
+  and t.z between 10 and 11
+  and a.teryt_simc = dirty_simc.teryt_simc
+  and t.bbox && a.geom
+;
@@ -3,13 +3,36 @@ with prg_ids as (
   where processed = false
   returning id
 ),
+delete_tile_layers as (
+  -- building layer of the tile doesn't change
+  delete from tile_layers t
+  using prg.delta d, prg_ids prg
+  where 1=1
+    and t.layer = 'prg2load'
+    and t.bbox && d.geom_3857
+    and d.lokalnyid = prg.id
+),
 delete_tiles as (
   delete from tiles t
   using prg.delta d, prg_ids prg
   where 1=1
     and z >= 13
-    and t.bbox && st_transform(d.geom, 3857)
+    and t.bbox && d.geom_3857
     and d.lokalnyid = prg.id
+),
+dirty_aggregates as (
+  insert into prg.delta_aggr_dirty (teryt_simc)
+    select distinct d.teryt_simc
+    from prg.delta d, prg_ids prg
+    where d.lokalnyid = prg.id and d.teryt_simc is not null
+  on conflict do nothing
+),
+flag_delta as (
+  -- usually already flagged when the exclusion was reported, reads skip flagged rows
+  update prg.delta d
+  set excluded = true
+  from prg_ids prg
+  where d.lokalnyid = prg.id and not d.excluded
 )
 insert into exclude_prg (id)
   select id
@@ -22,13 +45,29 @@ with b_ids as (
   where processed = false
   returning id
 ),
+delete_tile_layers as (
+  -- address layer of the tile doesn't change
+  delete from tile_layers t
+  using bdot_buildings b, b_ids
+  where 1=1
+    and t.layer = 'buildings'
+    and t.bbox && b.geom_3857
+    and b.lokalnyid = b_ids.id
+),
 delete_tiles as (
   delete from tiles t
   using bdot_buildings b, b_ids
   where 1=1
     and z >= 13
-    and t.bbox && st_transform(b.geom_4326, 3857)
+    and t.bbox && b.geom_3857
     and b.lokalnyid = b_ids.id
+),
+flag_buildings as (
+  -- usually already flagged when the exclusion was reported, reads skip flagged rows
+  update bdot_buildings b
+  set excluded = true
+  from b_ids
+  where b.lokalnyid = b_ids.id and not b.excluded
 )
 insert into exclude_bdot_buildings (id)
   select id
@@ -37,7 +37,8 @@ var map = new mapboxgl.Map({
                 "type": "vector",
                 "tiles": [
                     vectorTilesURL
-                ]
+                ],
+                "maxzoom": 16
             },
             "updates": {
                 "type": "geojson",